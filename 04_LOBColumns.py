@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 import argparse
 import json
+from dataclasses import dataclass, field
+from itertools import groupby
 from typing import Any, Optional
 from dotenv import load_dotenv
 from utils.etl_helpers import SQLExecutionError
@@ -11,8 +14,7 @@ from tqdm import tqdm
 import tkinter as tk
 from tkinter import messagebox
 
-import sqlalchemy
-from db.connections import get_target_connection
+from db.connections import dispose_engines, get_target_connection, pool_capacity
 from utils.logging_helper import setup_logging, operation_counts
 from config.settings import settings, parse_database_name
 from config import ETLConstants
@@ -24,12 +26,22 @@ from utils.etl_helpers import (
     transaction_scope,
     execute_sql_with_timeout,
 )
-from etl.core import sanitize_sql
+from etl.bulk_loader import insert_rows
+from etl.core import ConfigError, sanitize_sql
+from etl.parallel import TaskOutcome, run_parallel
+from utils.retry_policy import RetryBudget, RetryPolicy, is_lock_error
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_LOG_FILE = "PreDMSErrorLog_LOBS.txt"
 
+# LOB_COLUMN_UPDATES columns written by the analyzer, in insert order
+LOB_UPDATE_COLUMNS = (
+    "SchemaName", "TableName", "ColumnName", "DataType", "CurrentLength",
+    "RowCnt", "MaxLen", "MaxBytes", "AlterStatement",
+)
+LOB_UPDATE_TYPES = {"CurrentLength": "INT", "RowCnt": "INT", "MaxLen": "INT", "MaxBytes": "BIGINT"}
+
 # Database name used within the dynamic SQL statements
 conn_val = settings.mssql_target_conn_str if settings.mssql_target_conn_str else None
 DB_NAME = settings.mssql_target_db_name or parse_database_name(conn_val)
@@ -59,6 +71,21 @@ def parse_args() -> argparse.Namespace:
         type=int,
         help="Number of rows to fetch per batch when processing LOB columns."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of tables to analyze and alter concurrently on separate connections."
+    )
+    parser.add_argument(
+        "--rebuild-rows",
+        type=int,
+        help="Row count from which a table with several LOB column changes is rebuilt once (0 disables)."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Analyze every LOB column again instead of only tables changed since the last run."
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -74,7 +101,10 @@ def validate_environment() -> None:
     optional_vars = {
         'EJ_LOG_DIR': "Directory for log files (defaults to current directory)",
         'INCLUDE_EMPTY_TABLES': "Set to '1' to include empty tables (defaults to '0')",
-        'SQL_TIMEOUT': "Timeout in seconds for SQL operations (defaults to 300)"
+        'SQL_TIMEOUT': "Timeout in seconds for SQL operations (defaults to 300)",
+        'LOB_WORKERS': "Number of tables to analyze and alter concurrently (defaults to 1)",
+        'LOB_REBUILD_ROWS': "Row count from which a table's LOB columns are changed in one rebuild (defaults to 1000000)",
+        'LOB_FULL_SCAN': "Set to '1' to analyze every table instead of only changed ones (defaults to '0')"
     }
     
     # Check required vars
@@ -102,6 +132,11 @@ def load_config(config_file: str | None = None) -> dict[str, Any]:
         "log_filename": DEFAULT_LOG_FILE,
         "sql_timeout": ETLConstants.DEFAULT_SQL_TIMEOUT,  # seconds
         "batch_size": ETLConstants.DEFAULT_BULK_INSERT_BATCH_SIZE,
+        "max_retry_attempts": ETLConstants.MAX_RETRY_ATTEMPTS,
+        "retry_budget": ETLConstants.DEFAULT_RETRY_BUDGET,
+        "workers": ETLConstants.DEFAULT_TABLE_WORKERS,
+        "rebuild_rows": ETLConstants.DEFAULT_LOB_REBUILD_ROWS,
+        "incremental": True,
     }
     
     if config_file and os.path.exists(config_file):
@@ -114,6 +149,27 @@ def load_config(config_file: str | None = None) -> dict[str, Any]:
             logger.error(f"Error loading config file: {e}")
     
     return config
+def check_pool_capacity(config: dict[str, Any]) -> None:
+    """Reject a ``workers`` setting the connection pool cannot serve.
+
+    Each worker holds its own connection next to the main one.
+    """
+    workers = max(1, int(config.get("workers", ETLConstants.DEFAULT_TABLE_WORKERS)))
+    needed = 1 + workers if workers > 1 else 1
+    if needed > pool_capacity():
+        raise ConfigError(
+            f"workers={workers} needs {needed} connections but the pool allows {pool_capacity()} "
+            "(DB_POOL_SIZE + DB_MAX_OVERFLOW); lower the workers or raise DB_MAX_OVERFLOW"
+        )
+
+
+def _length_expression(column: str, datatype: str) -> Optional[str]:
+    """Return the ``LEN`` expression used to measure a text/varchar column."""
+    if datatype.lower() in ("varchar", "nvarchar"):
+        return f"LEN([{column}])"
+    if datatype.lower() in ("text", "ntext"):
+        return f"LEN(CAST([{column}] AS NVARCHAR(MAX)))"
+    return None
 def get_max_length(conn: Any, schema: str, table: str, column: str, datatype: str, timeout: int) -> Optional[int]:
     """Determine the maximum length needed for a text/varchar column."""
     try:
@@ -124,12 +180,10 @@ def get_max_length(conn: Any, schema: str, table: str, column: str, datatype: st
         table = validate_sql_identifier(table)
         column = validate_sql_identifier(column)
         
-        if datatype.lower() in ("varchar", "nvarchar"):
-            sql = f"SELECT MAX(LEN([{column}])) FROM [{schema}].[{table}]"
-        elif datatype.lower() in ("text", "ntext"):
-            sql = f"SELECT MAX(LEN(CAST([{column}] AS NVARCHAR(MAX)))) FROM [{schema}].[{table}]"
-        else:
+        expression = _length_expression(column, datatype)
+        if expression is None:
             return None
+        sql = f"SELECT MAX({expression}) FROM [{schema}].[{table}]"
 
         cur = execute_sql_with_timeout(conn, sql, timeout=timeout)
         result = cur.fetchone()
@@ -137,6 +191,51 @@ def get_max_length(conn: Any, schema: str, table: str, column: str, datatype: st
     except Exception as e:
         logger.error(f"Error getting max length for {schema}.{table}.{column}: {e}")
         return None
+def get_max_lengths(
+    conn: Any,
+    schema: str,
+    table: str,
+    columns: list[tuple[str, str]],
+    timeout: int,
+) -> dict[str, tuple[Optional[int], Optional[int]]]:
+    """Profile all LOB columns of one table with a single aggregate scan.
+
+    ``columns`` holds ``(column, datatype)`` pairs.  Returns
+    ``{column: (max_len, max_bytes)}`` where ``max_len`` matches what
+    :func:`get_max_length` reports and ``max_bytes`` is ``MAX(DATALENGTH)``.
+    If the combined query fails the columns are measured one at a time.
+    """
+    from etl.core import validate_sql_identifier
+
+    schema = validate_sql_identifier(schema)
+    table = validate_sql_identifier(table)
+    measured = []
+    aggregates = []
+    results: dict[str, tuple[Optional[int], Optional[int]]] = {}
+    for column, datatype in columns:
+        expression = _length_expression(validate_sql_identifier(column), datatype)
+        if expression is None:
+            results[column] = (None, None)
+            continue
+        aggregates.append(f"MAX({expression}), MAX(DATALENGTH([{column}]))")
+        measured.append((column, datatype))
+    if not measured:
+        return results
+
+    sql = f"SELECT {', '.join(aggregates)} FROM [{schema}].[{table}]"
+    try:
+        row = execute_sql_with_timeout(conn, sql, timeout=timeout).fetchone()
+        for i, (column, _) in enumerate(measured):
+            max_len = row[2 * i] if row and row[2 * i] is not None else 0
+            max_bytes = row[2 * i + 1] if row and row[2 * i + 1] is not None else 0
+            results[column] = (max_len, max_bytes)
+    except Exception as e:
+        logger.warning(
+            f"Combined length scan of {schema}.{table} failed ({e}); measuring {len(measured)} columns one at a time"
+        )
+        for column, datatype in measured:
+            results[column] = (get_max_length(conn, schema, table, column, datatype, timeout), None)
+    return results
 def build_alter_column_sql(
     schema: str,
     table: str,
@@ -145,30 +244,269 @@ def build_alter_column_sql(
     max_length: Optional[int],
 ) -> str:
     """Build the SQL statement to alter a column based on its max length."""
+    return f"ALTER TABLE [{schema}].[{table}] ALTER COLUMN [{column}] {lob_target_type(max_length)} NULL"
+
+
+def lob_target_type(max_length: Optional[int]) -> str:
+    """Return the column type a LOB column is narrowed to for ``max_length``."""
     if max_length is None or max_length == 0:
-        return f"ALTER TABLE [{schema}].[{table}] ALTER COLUMN [{column}] CHAR(1) NULL"
+        return "CHAR(1)"
     elif max_length > 8000:
-        return f"ALTER TABLE [{schema}].[{table}] ALTER COLUMN [{column}] TEXT NULL"
+        return "TEXT"
     else:
-        return f"ALTER TABLE [{schema}].[{table}] ALTER COLUMN [{column}] VARCHAR({max_length}) NULL"
+        return f"VARCHAR({max_length})"
 def create_lob_tracking_table(conn: Any, config: dict[str, Any]) -> None:
-    """Create the table to track LOB column updates."""
-    logger.info("Creating LOB_COLUMN_UPDATES tracking table")
+    """Create the tables that track LOB column updates unless they exist."""
+    logger.info("Creating LOB_COLUMN_UPDATES and LOB_TABLE_STATE tracking tables")
     gather_lobs_sql = load_sql('lob/gather_lobs.sql', DB_NAME)
     
     # Use run_sql_script_no_tracking to ensure this always executes
     run_sql_script_no_tracking(conn, 'gather_lobs', gather_lobs_sql, timeout=config['sql_timeout'])
     
-    logger.info("LOB tracking table created successfully")
+    logger.info("LOB tracking tables ready")
+
+
+def usage_stats_visible(conn: Any, timeout: int) -> bool:
+    """Return True if the login may read the server DMVs the incremental scan uses.
+
+    ``sys.dm_db_index_usage_stats`` and ``sys.dm_os_sys_info`` need
+    ``VIEW SERVER STATE``.  Without it the permission error is logged and
+    every table is treated as changed.
+    """
+    try:
+        execute_sql_with_timeout(
+            conn,
+            "SELECT TOP (0) i.sqlserver_start_time, u.last_user_update "
+            "FROM sys.dm_os_sys_info i CROSS JOIN sys.dm_db_index_usage_stats u",
+            timeout=timeout,
+        ).fetchall()
+        return True
+    except Exception as e:
+        conn.rollback()
+        logger.warning(
+            f"Cannot read index usage statistics (VIEW SERVER STATE is required): {e}. "
+            "Analyzing every LOB table"
+        )
+        return False
+
+
+def _table_signature_sql(track_writes: bool = True) -> str:
+    """SELECT returning every table's row count, ``modify_date`` and last write.
+
+    ``modify_date`` only moves with schema changes, so ``LastUserUpdate``
+    takes the latest ``last_user_update`` from ``sys.dm_db_index_usage_stats``
+    to notice UPDATEs that keep the row count.  Without ``track_writes`` it
+    is NULL.
+    """
+    last_write = "CAST(NULL AS DATETIME)"
+    if track_writes:
+        last_write = f"""(
+                SELECT MAX(u.last_user_update)
+                FROM sys.dm_db_index_usage_stats u
+                WHERE u.database_id = DB_ID('{DB_NAME}') AND u.object_id = t.object_id
+            )"""
+    return f"""
+        SELECT s.[NAME] AS SchemaName, t.[NAME] AS TableName, t.modify_date AS ModifyDate,
+            ISNULL(SUM(p.rows), 0) AS RowCnt,
+            {last_write} AS LastUserUpdate
+        FROM {DB_NAME}.sys.tables t
+        INNER JOIN {DB_NAME}.sys.schemas s ON t.schema_id = s.schema_id
+        LEFT JOIN {DB_NAME}.sys.partitions p ON p.object_id = t.object_id AND p.index_id IN (0, 1)
+        GROUP BY s.[NAME], t.[NAME], t.modify_date, t.object_id
+    """
+
+
+def _unchanged_tables_sql(track_writes: bool = True) -> str:
+    """SELECT returning the tables whose ``LOB_TABLE_STATE`` row still matches.
+
+    The usage statistics are cleared when SQL Server restarts, so state
+    recorded before the last restart never matches.  Without
+    ``track_writes`` writes cannot be detected and no table matches.
+    """
+    if not track_writes:
+        return "SELECT CAST(NULL AS SYSNAME) AS SchemaName, CAST(NULL AS SYSNAME) AS TableName WHERE 1 = 0"
+    return f"""
+        SELECT g.SchemaName, g.TableName
+        FROM ({_table_signature_sql()}) g
+        INNER JOIN {DB_NAME}.dbo.LOB_TABLE_STATE st
+            ON st.SchemaName = g.SchemaName AND st.TableName = g.TableName
+            AND st.ModifyDate = g.ModifyDate AND st.RowCnt = g.RowCnt
+            AND (st.LastUserUpdate = g.LastUserUpdate OR (st.LastUserUpdate IS NULL AND g.LastUserUpdate IS NULL))
+            AND st.ProcessDate > (SELECT sqlserver_start_time FROM sys.dm_os_sys_info)
+    """
+
+
+def record_lob_table_state(conn: Any, config: dict[str, Any]) -> None:
+    """Remember the row count, ``modify_date`` and last write of every analyzed table.
+
+    Run after the ALTER statements, which change ``modify_date`` themselves,
+    so the next run only profiles tables that were reloaded, modified or
+    written to in between.  Tables no longer in ``LOB_COLUMN_UPDATES`` lose
+    their state.
+    """
+    with transaction_scope(conn):
+        execute_sql_with_timeout(
+            conn,
+            f"""
+            MERGE {DB_NAME}.dbo.LOB_TABLE_STATE AS st
+            USING (
+                SELECT g.SchemaName, g.TableName, g.RowCnt, g.ModifyDate, g.LastUserUpdate
+                FROM ({_table_signature_sql(config.get("track_writes", True))}) g
+                WHERE EXISTS (
+                    SELECT 1 FROM {DB_NAME}.dbo.LOB_COLUMN_UPDATES U
+                    WHERE U.SchemaName = g.SchemaName AND U.TableName = g.TableName
+                )
+            ) AS src
+            ON st.SchemaName = src.SchemaName AND st.TableName = src.TableName
+            WHEN MATCHED THEN
+                UPDATE SET RowCnt = src.RowCnt, ModifyDate = src.ModifyDate,
+                    LastUserUpdate = src.LastUserUpdate, ProcessDate = GETDATE()
+            WHEN NOT MATCHED BY TARGET THEN
+                INSERT (SchemaName, TableName, RowCnt, ModifyDate, LastUserUpdate)
+                VALUES (src.SchemaName, src.TableName, src.RowCnt, src.ModifyDate, src.LastUserUpdate)
+            WHEN NOT MATCHED BY SOURCE THEN
+                DELETE;
+            """,
+            timeout=config["sql_timeout"],
+        )
+    logger.info("Recorded LOB table state for the next incremental run")
+
+
+def column_has_type(current_type: Optional[str], current_bytes: Optional[int], target: str) -> bool:
+    """Return True when a column declared ``current_type`` is already ``target``."""
+    if not current_type:
+        return False
+    declared = current_type.upper()
+    if declared in ("CHAR", "VARCHAR", "NCHAR", "NVARCHAR", "BINARY", "VARBINARY"):
+        declared += f"({'MAX' if current_bytes == -1 else current_bytes})"
+    return declared == target.upper()
+def _dbapi_connection(conn: Any) -> Any:
+    """Return the DB-API connection behind ``conn`` (a SQLAlchemy or pyodbc connection)."""
+    if hasattr(conn, "cursor"):
+        return conn
+    return conn.connection
+
+
+def _dbapi_cursor(conn: Any) -> Any:
+    """Return a DB-API cursor for ``conn`` (a SQLAlchemy or pyodbc connection)."""
+    return _dbapi_connection(conn).cursor()
+
+
+def write_lob_updates(conn: Any, cursor: Any, rows: list[tuple[Any, ...]], log_file: str) -> int:
+    """Insert analyzer rows into ``LOB_COLUMN_UPDATES`` in one round trip.
+
+    ``rows`` follow :data:`LOB_UPDATE_COLUMNS`.  If the batch fails it is
+    rolled back and retried row by row, so only the rows that really fail
+    are left out; each of them is logged.  Returns the number of rows written.
+
+    ``cursor`` is a DB-API cursor, so the batches are committed and rolled
+    back on the DB-API connection behind ``conn``; a SQLAlchemy
+    ``Connection`` does not see work done through a raw cursor.
+    """
+    table = f"{DB_NAME}.dbo.LOB_COLUMN_UPDATES"
+    dbapi_conn = _dbapi_connection(conn)
+    try:
+        insert_rows(cursor, table, LOB_UPDATE_COLUMNS, rows, LOB_UPDATE_TYPES)
+        dbapi_conn.commit()
+        return len(rows)
+    except Exception as e:
+        dbapi_conn.rollback()
+        logger.warning(f"Bulk insert of {len(rows)} LOB columns failed ({e}); inserting them one at a time")
+
+    written = 0
+    for row in rows:
+        try:
+            insert_rows(cursor, table, LOB_UPDATE_COLUMNS, [row], LOB_UPDATE_TYPES)
+            dbapi_conn.commit()
+            written += 1
+        except Exception as e:
+            dbapi_conn.rollback()
+            error_msg = f"Error inserting LOB column {row[0]}.{row[1]}.{row[2]}: {e}"
+            logger.error(error_msg)
+            log_exception_to_file(error_msg, log_file)
+    return written
+def profile_lob_table(
+    conn: Any,
+    schema_name: str,
+    table_name: str,
+    columns: list[dict[str, Any]],
+    timeout: int,
+    log_file: str,
+) -> list[dict[str, Any]]:
+    """Measure one table's LOB columns and build their ``LOB_COLUMN_UPDATES`` rows."""
+    try:
+        lengths = get_max_lengths(
+            conn,
+            schema_name,
+            table_name,
+            [(r.get("ColumnName"), r.get("DataType")) for r in columns],
+            timeout,
+        )
+    except Exception as e:
+        lengths = {}
+        error_msg = f"Error profiling LOB columns of {schema_name}.{table_name}: {e}"
+        logger.error(error_msg)
+        log_exception_to_file(error_msg, log_file)
+
+    records = []
+    for row_dict in columns:
+        column_name = row_dict.get("ColumnName")
+        datatype = row_dict.get("DataType")
+        max_length, max_bytes = lengths.get(column_name, (None, None))
+        records.append({
+            "SchemaName": schema_name,
+            "TableName": table_name,
+            "ColumnName": column_name,
+            "DataType": datatype,
+            "CurrentLength": row_dict.get("CurrentLength"),
+            "RowCnt": row_dict.get("RowCnt") or 0,
+            "MaxLen": max_length,
+            "MaxBytes": max_bytes,
+            "AlterStatement": build_alter_column_sql(
+                schema_name,
+                table_name,
+                column_name,
+                datatype,
+                max_length,
+            ),
+        })
+    return records
 def gather_lob_columns(
     conn: Any,
     config: dict[str, Any],
     log_file: str,
 ) -> None:
-    """Gather information about LOB columns and determine optimal sizes."""
+    """Gather information about LOB columns and determine optimal sizes.
+
+    With ``incremental`` set (the default) tables whose row count,
+    ``modify_date`` and last write match ``LOB_TABLE_STATE`` keep their rows
+    from the last run and are not scanned again; rows of every other table
+    are replaced.  ``track_writes`` (see :func:`usage_stats_visible`) set to
+    False treats every table as changed.
+    """
     logger.info("Gathering information about LOB columns")
+    track_writes = config.get("track_writes", True)
 
     with transaction_scope(conn):
+        if not config.get("incremental", True):
+            execute_sql_with_timeout(
+                conn, f"DELETE FROM {DB_NAME}.dbo.LOB_TABLE_STATE", timeout=config["sql_timeout"]
+            )
+        execute_sql_with_timeout(
+            conn,
+            f"""
+            DELETE U FROM {DB_NAME}.dbo.LOB_COLUMN_UPDATES U
+            WHERE NOT EXISTS (
+                SELECT 1 FROM ({_unchanged_tables_sql(track_writes)}) k
+                WHERE k.SchemaName = U.SchemaName AND k.TableName = U.TableName
+            )
+            """,
+            timeout=config["sql_timeout"],
+        )
+        # Commit the clean-up before the inserts, which go through a raw
+        # DB-API cursor and commit on their own.
+        conn.commit()
+
         # Query for LOB columns
         query = f"""
         SELECT
@@ -180,10 +518,12 @@ def gather_lob_columns(
                  THEN c.max_length ELSE NULL END AS CurrentLength,
             CASE WHEN EXISTS (SELECT 1 FROM sys.partitions p WHERE p.object_id = t.object_id AND p.index_id IN (0,1))
                 THEN (SELECT SUM(p.rows) FROM sys.partitions p WHERE p.object_id = t.object_id AND p.index_id IN (0,1))
-                ELSE 0 END AS RowCnt
+                ELSE 0 END AS RowCnt,
+            CASE WHEN k.TableName IS NULL THEN 0 ELSE 1 END AS Unchanged
         FROM {DB_NAME}.sys.tables t
         INNER JOIN {DB_NAME}.sys.schemas s ON t.schema_id=s.schema_id
         INNER JOIN {DB_NAME}.sys.columns c ON t.object_id=c.object_id
+        LEFT JOIN ({_unchanged_tables_sql(track_writes)}) k ON k.SchemaName = s.[NAME] AND k.TableName = t.[NAME]
         WHERE t.[NAME] NOT IN (
             'TablesToConvert','TablesToConvert_Financial','TablesToConvert_Operations'
         )
@@ -195,6 +535,10 @@ def gather_lob_columns(
         ORDER BY s.[NAME], t.[NAME], c.[NAME]
         """
 
+        batch_size = config.get(
+            "batch_size", ETLConstants.DEFAULT_BULK_INSERT_BATCH_SIZE
+        )
+
         cursor = execute_sql_with_timeout(
             conn, query, timeout=config["sql_timeout"]
         )
@@ -212,10 +556,14 @@ def gather_lob_columns(
                 rows = [dict(zip(columns, row)) for row in rows_data]
                 logger.info(f"Using SQLAlchemy keys/fetchall, got {len(rows)} rows")
             elif hasattr(cursor, "description"):
-                # Standard DB-API cursor (pyodbc)
+                # Standard DB-API cursor (pyodbc), read batch_size rows at a time
                 columns = [desc[0] for desc in cursor.description]
-                rows_data = cursor.fetchall()
-                rows = [dict(zip(columns, row)) for row in rows_data]
+                rows = []
+                while True:
+                    rows_data = cursor.fetchmany(batch_size)
+                    if not rows_data:
+                        break
+                    rows.extend(dict(zip(columns, row)) for row in rows_data)
                 logger.info(f"Using DB-API description, got {len(rows)} rows")
             else:
                 # Last resort fallback
@@ -230,20 +578,11 @@ def gather_lob_columns(
             logger.info("No LOB columns found to process")
             return
 
-        batch_size = config.get(
-            "batch_size", ETLConstants.DEFAULT_BULK_INSERT_BATCH_SIZE
-        )
-
         processed = 0
         progress = tqdm(total=len(rows), desc="Analyzing LOB Columns", unit="column")
         
-        # Prepare insert query using SQLAlchemy style
-        insert_sql = f"""
-            INSERT INTO {DB_NAME}.dbo.LOB_COLUMN_UPDATES
-            (SchemaName, TableName, ColumnName, DataType, CurrentLength, RowCnt, MaxLen, AlterStatement)
-            VALUES (:schema_name, :table_name, :column_name, :datatype, :current_length, :row_cnt, :max_len, :alter_statement)
-        """
-        
+        candidates = []
+        unchanged: set[tuple[str, str]] = set()
         for row in rows:
             # Enhanced: Handle all SQLAlchemy row types
             try:
@@ -284,77 +623,343 @@ def gather_lob_columns(
             ):
                 logger.info(f"Skipping {schema_name}.{table_name}.{column_name}: row count is {row_cnt}")
                 continue
+            if row_dict.get("Unchanged"):
+                unchanged.add((schema_name, table_name))
+                progress.update(1)
+                continue
+            candidates.append(row_dict)
 
-            try:
-                max_length = get_max_length(
-                    conn,
-                    schema_name,
-                    table_name,
-                    column_name,
-                    datatype,
-                    config["sql_timeout"],
-                )
-                alter_column_sql = build_alter_column_sql(
-                    schema_name,
-                    table_name,
-                    column_name,
-                    datatype,
-                    max_length,
-                )
+        if unchanged:
+            logger.info(f"Skipping {len(unchanged)} tables unchanged since the last LOB analysis")
 
-                # Use SQLAlchemy-style parameterized query execution
-                try:
-                    conn.execute(
-                        sqlalchemy.text(insert_sql),
-                        {
-                            'schema_name': schema_name,
-                            'table_name': table_name,
-                            'column_name': column_name,
-                            'datatype': datatype,
-                            'current_length': row_dict.get("CurrentLength"),
-                            'row_cnt': row_cnt,
-                            'max_len': max_length,
-                            'alter_statement': alter_column_sql,
-                        }
-                    )
-                except Exception as e:
-                    conn.rollback()
-                    error_msg = (
-                        f"Error inserting LOB column {schema_name}.{table_name}.{column_name}: {e}"
-                    )
-                    logger.error(error_msg)
-                    log_exception_to_file(error_msg, log_file)
-                    
-            except Exception as e:
-                conn.rollback()
-                error_msg = (
-                    f"Error processing LOB column {schema_name}.{table_name}.{column_name}: {e}"
-                )
+        # The rows arrive ordered by schema and table, so each table's
+        # columns are adjacent and can be profiled with one scan.
+        tables = [
+            (key, list(group))
+            for key, group in groupby(candidates, key=lambda r: (r.get("SchemaName"), r.get("TableName")))
+        ]
+        scans = len(tables)
+        workers = max(1, int(config.get("workers", ETLConstants.DEFAULT_TABLE_WORKERS)))
+
+        insert_cursor = _dbapi_cursor(conn)
+        pending: list[tuple[Any, ...]] = []
+
+        def flush() -> None:
+            if pending:
+                write_lob_updates(conn, insert_cursor, pending, log_file)
+                pending.clear()
+
+        def insert_records(records: list[dict[str, Any]]) -> None:
+            nonlocal processed
+            for params in records:
+                pending.append(tuple(params[name] for name in LOB_UPDATE_COLUMNS))
+                processed += 1
+                progress.update(1)
+                if len(pending) >= batch_size:
+                    flush()
+
+        if workers > 1 and len(tables) > 1:
+            # Tables are measured on their own connections; the results are
+            # written through ``conn`` on this thread as each table finishes.
+            def profile(item: tuple[tuple[str, str], list[dict[str, Any]]]) -> list[dict[str, Any]]:
+                (schema_name, table_name), group = item
+                with get_target_connection() as worker_conn:
+                    return profile_lob_table(worker_conn, schema_name, table_name, group, config["sql_timeout"], log_file)
+
+            def record(outcome: TaskOutcome) -> None:
+                if outcome.ok:
+                    insert_records(outcome.result)
+                    return
+                (schema_name, table_name), _ = outcome.item
+                error_msg = f"Error profiling LOB columns of {schema_name}.{table_name}: {outcome.error}"
                 logger.error(error_msg)
                 log_exception_to_file(error_msg, log_file)
-                
-            processed += 1
-            progress.update(1)
 
-            if processed % batch_size == 0:
-                conn.commit()
+            run_parallel(tables, profile, workers, desc="Analyzing LOB Tables", unit="table", on_complete=record)
+        else:
+            for (schema_name, table_name), group in tables:
+                insert_records(
+                    profile_lob_table(conn, schema_name, table_name, group, config["sql_timeout"], log_file)
+                )
 
+        flush()
         progress.close()
-        if processed % batch_size != 0:
+        logger.info(
+            f"Analyzed and cataloged {processed} LOB columns with {scans} table scans "
+            f"({processed} with one scan per column)"
+        )
+def _alter_table_columns(
+    conn: Any,
+    statements: list[tuple[int, str]],
+    config: dict[str, Any],
+    retry_policy: RetryPolicy,
+    log_file: str,
+) -> None:
+    """Run one table's ALTER statements in order on ``conn``."""
+    for idx, alter_sql in statements:
+        def alter_column() -> None:
+            sanitize_sql(
+                conn,
+                alter_sql,
+                timeout=config['sql_timeout'],
+            )
             conn.commit()
-        logger.info(f"Analyzed and cataloged {processed} LOB columns")
+
+        try:
+            retry_policy.run(
+                alter_column,
+                f"LOB column alter (statement {idx})",
+                on_retry=lambda _exc: conn.rollback(),
+                retryable=is_lock_error,
+            )
+        except Exception as e:
+            conn.rollback()
+            error_msg = f"Failed to alter column (statement {idx}): {e}"
+            logger.error(error_msg)
+            log_exception_to_file(error_msg, log_file)
+            raise
+@dataclass
+class LobTableChanges:
+    """The column changes ``LOB_COLUMN_UPDATES`` holds for one table."""
+
+    schema: str
+    table: str
+    row_count: int = 0
+    statements: list[tuple[int, str]] = field(default_factory=list)
+    column_types: dict[str, str] = field(default_factory=dict)
+
+
+# Target types that can truncate, with their size.
+_SIZED_TYPE_RE = re.compile(r"(?:VAR)?CHAR\((\d+)\)", re.IGNORECASE)
+
+
+def _quote_literal(value: str) -> str:
+    return value.replace("'", "''")
+
+
+def _quote_name(value: str) -> str:
+    return value.replace("]", "]]")
+
+
+def use_table_rebuild(changes: LobTableChanges, rebuild_rows: int) -> bool:
+    """Return True when ``changes`` should be applied by rebuilding the table.
+
+    Each ``ALTER COLUMN`` to or from a LOB type rewrites the table, so a
+    table with several changes is rebuilt once instead when it holds at
+    least ``rebuild_rows`` rows.  ``0`` turns rebuilds off.  Every changed
+    column needs a measured length (see ``column_types``).
+    """
+    return (
+        rebuild_rows > 0
+        and len(changes.column_types) > 1
+        and len(changes.column_types) == len(changes.statements)
+        and (changes.row_count or 0) >= rebuild_rows
+    )
+
+
+def _rebuild_plan(conn: Any, schema: str, table: str, timeout: int) -> Optional[tuple[list[str], Optional[str]]]:
+    """Return the table's columns and PK statement, or None if it cannot be rebuilt.
+
+    ``SELECT ... INTO`` only carries columns, nullability and identity over,
+    so tables with indexes other than the primary key, foreign keys,
+    defaults, checks, triggers or computed columns keep the ALTER path.
+    """
+    object_name = _quote_literal(f"[{_quote_name(schema)}].[{_quote_name(table)}]")
+    cursor = execute_sql_with_timeout(
+        conn,
+        f"""
+        SELECT c.name, c.is_computed,
+            CASE WHEN EXISTS (SELECT 1 FROM sys.indexes i WHERE i.object_id = c.object_id AND i.index_id > 0 AND i.is_primary_key = 0)
+                OR EXISTS (SELECT 1 FROM sys.foreign_keys f WHERE f.parent_object_id = c.object_id OR f.referenced_object_id = c.object_id)
+                OR EXISTS (SELECT 1 FROM sys.default_constraints d WHERE d.parent_object_id = c.object_id)
+                OR EXISTS (SELECT 1 FROM sys.check_constraints k WHERE k.parent_object_id = c.object_id)
+                OR EXISTS (SELECT 1 FROM sys.triggers r WHERE r.parent_id = c.object_id)
+            THEN 1 ELSE 0 END AS HasDependents
+        FROM sys.columns c
+        WHERE c.object_id = OBJECT_ID(N'{object_name}')
+        ORDER BY c.column_id
+        """,
+        timeout=timeout,
+    )
+    columns = cursor.fetchall()
+    if not columns or any(row[1] or row[2] for row in columns):
+        return None
+
+    cursor = execute_sql_with_timeout(
+        conn,
+        f"""
+        SELECT kc.name, i.type_desc, c.name, ic.is_descending_key
+        FROM sys.key_constraints kc
+        JOIN sys.indexes i ON i.object_id = kc.parent_object_id AND i.index_id = kc.unique_index_id
+        JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+        JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+        WHERE kc.parent_object_id = OBJECT_ID(N'{object_name}') AND kc.type = 'PK'
+        ORDER BY ic.key_ordinal
+        """,
+        timeout=timeout,
+    )
+    key_rows = cursor.fetchall()
+    pk_sql = None
+    if key_rows:
+        key_columns = ", ".join(
+            f"[{_quote_name(row[2])}] {'DESC' if row[3] else 'ASC'}" for row in key_rows
+        )
+        pk_sql = (
+            f"ALTER TABLE [{_quote_name(schema)}].[{_quote_name(table)}] "
+            f"ADD CONSTRAINT [{_quote_name(key_rows[0][0])}] PRIMARY KEY {key_rows[0][1]} ({key_columns})"
+        )
+    return [row[0] for row in columns], pk_sql
+
+
+def build_rebuild_sql(
+    schema: str,
+    table: str,
+    columns: list[str],
+    column_types: dict[str, str],
+    pk_sql: Optional[str] = None,
+) -> str:
+    """Build the batch that copies ``table`` with new column types and swaps it in.
+
+    ``column_types`` maps lower-cased column names to their new type.  The
+    copy is written to ``<table>__lob``, the original is dropped and the copy
+    renamed in its place, and the primary key is added back, all in one
+    transaction that ``XACT_ABORT`` rolls back if any step fails.
+
+    ``CAST`` to a sized type truncates silently, so the batch first checks
+    that no value is longer than its new type allows and raises an error
+    before anything is copied or dropped if ``LOB_COLUMN_UPDATES`` is out of
+    date.
+    """
+    work = f"{table}__lob"
+    too_long = []
+    for column in columns:
+        size = _SIZED_TYPE_RE.fullmatch(column_types.get(column.lower(), ""))
+        if size:
+            too_long.append(f"LEN(CAST([{_quote_name(column)}] AS NVARCHAR(MAX))) > {size.group(1)}")
+    select_list = ",\n    ".join(
+        f"CAST([{_quote_name(column)}] AS {column_types[column.lower()]}) AS [{_quote_name(column)}]"
+        if column.lower() in column_types
+        else f"[{_quote_name(column)}]"
+        for column in columns
+    )
+    statements = []
+    if too_long:
+        message = _quote_literal(
+            f"Rebuilding [{schema}].[{table}] would truncate data; re-run the LOB analysis"
+        )
+        statements.append(
+            f"IF EXISTS (SELECT 1 FROM [{_quote_name(schema)}].[{_quote_name(table)}] "
+            f"WHERE {' OR '.join(too_long)})\n    THROW 50000, N'{message}', 1"
+        )
+    statements += [
+        f"DROP TABLE IF EXISTS [{_quote_name(schema)}].[{_quote_name(work)}]",
+        f"SELECT\n    {select_list}\nINTO [{_quote_name(schema)}].[{_quote_name(work)}]\n"
+        f"FROM [{_quote_name(schema)}].[{_quote_name(table)}] WITH (TABLOCK)",
+        f"DROP TABLE [{_quote_name(schema)}].[{_quote_name(table)}]",
+        f"EXEC sp_rename N'{_quote_literal(f'[{_quote_name(schema)}].[{_quote_name(work)}]')}', "
+        f"N'{_quote_literal(table)}'",
+    ]
+    if pk_sql:
+        statements.append(pk_sql)
+    # XACT_ABORT rolls the whole swap back on any error and NOCOUNT keeps
+    # row-count messages from hiding an error behind an undrained result.
+    statements = ["SET XACT_ABORT ON", "SET NOCOUNT ON", "BEGIN TRANSACTION", *statements]
+    statements += ["COMMIT TRANSACTION", "SET NOCOUNT OFF"]
+    return ";\n".join(statements) + ";"
+
+
+def _rebuild_table(
+    conn: Any,
+    changes: LobTableChanges,
+    config: dict[str, Any],
+    retry_policy: RetryPolicy,
+    log_file: str,
+) -> bool:
+    """Apply all of a table's column changes with one copy-and-swap.
+
+    Returns False without changing anything when the table has objects the
+    copy would lose; the caller then falls back to the ALTER statements.
+    """
+    plan = _rebuild_plan(conn, changes.schema, changes.table, config["sql_timeout"])
+    if plan is None:
+        logger.info(
+            f"{changes.schema}.{changes.table} has indexes or constraints besides its primary key; "
+            "altering its columns one at a time"
+        )
+        return False
+    columns, pk_sql = plan
+    rebuild_sql = build_rebuild_sql(changes.schema, changes.table, columns, changes.column_types, pk_sql)
+
+    def rebuild() -> None:
+        sanitize_sql(conn, rebuild_sql, timeout=config["sql_timeout"])
+        conn.commit()
+
+    try:
+        retry_policy.run(
+            rebuild,
+            f"LOB table rebuild ({changes.schema}.{changes.table})",
+            on_retry=lambda _exc: conn.rollback(),
+            retryable=is_lock_error,
+        )
+    except Exception as e:
+        conn.rollback()
+        error_msg = f"Failed to rebuild {changes.schema}.{changes.table} with new LOB column types: {e}"
+        logger.error(error_msg)
+        log_exception_to_file(error_msg, log_file)
+        raise
+    logger.info(
+        f"Rebuilt {changes.schema}.{changes.table} ({changes.row_count} rows) "
+        f"with {len(changes.column_types)} column changes"
+    )
+    return True
+
+
+def _update_table_columns(
+    conn: Any,
+    changes: LobTableChanges,
+    config: dict[str, Any],
+    retry_policy: RetryPolicy,
+    log_file: str,
+) -> bool:
+    """Apply one table's changes, returning True if the table was rebuilt."""
+    rebuild_rows = int(config.get("rebuild_rows", ETLConstants.DEFAULT_LOB_REBUILD_ROWS))
+    if use_table_rebuild(changes, rebuild_rows) and _rebuild_table(
+        conn, changes, config, retry_policy, log_file
+    ):
+        return True
+    _alter_table_columns(conn, changes.statements, config, retry_policy, log_file)
+    return False
+
+
 def execute_lob_column_updates(
     conn: Any,
     config: dict[str, Any],
     log_file: str,
 ) -> None:
-    """Execute the ALTER statements to optimize LOB columns."""
+    """Execute the ALTER statements to optimize LOB columns.
+
+    Statements are grouped by table.  Tables with several changes and at
+    least ``rebuild_rows`` rows are rebuilt once with all the new column
+    types; the others have their columns altered one after another.  With
+    ``workers`` above 1 different tables are updated concurrently on their
+    own connections.
+    """
     logger.info("Executing ALTER TABLE statements for LOB columns")
+    retry_policy = RetryPolicy(
+        config.get("max_retry_attempts", ETLConstants.MAX_RETRY_ATTEMPTS),
+        RetryBudget(config.get("retry_budget", ETLConstants.DEFAULT_RETRY_BUDGET)),
+    )
+    workers = max(1, int(config.get("workers", ETLConstants.DEFAULT_TABLE_WORKERS)))
 
     with transaction_scope(conn):
         query = f"""
-        SELECT REPLACE(S.ALTERSTATEMENT,' NULL',';') AS Alter_Statement
+        SELECT S.SchemaName, S.TableName, REPLACE(S.ALTERSTATEMENT,' NULL',';') AS Alter_Statement,
+            S.ColumnName, S.MaxLen, S.RowCnt,
+            TYPE_NAME(c.user_type_id) AS CurrentType, c.max_length AS CurrentBytes
         FROM {DB_NAME}.dbo.LOB_COLUMN_UPDATES S
+        INNER JOIN {DB_NAME}.sys.columns c
+            ON c.object_id = OBJECT_ID(N'{DB_NAME}.' + QUOTENAME(S.SchemaName) + N'.' + QUOTENAME(S.TableName))
+            AND c.name = S.ColumnName
         WHERE S.TABLENAME NOT LIKE '%LOB_COL%'
         ORDER BY S.MAXLEN DESC
         """
@@ -388,41 +993,83 @@ def execute_lob_column_updates(
             logger.error(f"Error processing cursor results: {e}")
             return
 
-        for idx, row in enumerate(tqdm(rows, desc="Optimizing LOB Columns", unit="column"), 1):
+        # Group by table, keeping the tables in order of their longest
+        # column and each table's statements in their original order.
+        tables: dict[tuple[Any, Any], LobTableChanges] = {}
+        already_applied = 0
+        for idx, row in enumerate(rows, 1):
             # Handle SQLAlchemy RowMapping objects properly
             if hasattr(row, '_mapping'):
                 # SQLAlchemy RowMapping object
-                alter_sql = row._mapping.get('Alter_Statement')
-            elif isinstance(row, dict):
-                # Regular dictionary
-                alter_sql = row.get('Alter_Statement')
-            elif hasattr(row, 'get'):
-                # Dict-like object with get method
+                row = row._mapping
+            if hasattr(row, 'get'):
+                # Dict or dict-like object with get method
                 alter_sql = row.get('Alter_Statement')
+                key = (row.get('SchemaName'), row.get('TableName'))
+                column = row.get('ColumnName')
+                max_length = row.get('MaxLen')
+                row_count = row.get('RowCnt')
+                current = (row.get('CurrentType'), row.get('CurrentBytes'))
             else:
                 # Try to access as attribute or index
                 try:
-                    alter_sql = getattr(row, 'Alter_Statement', None) or row[0]
+                    alter_sql = getattr(row, 'Alter_Statement', None) or row[2]
+                    key = (row[0], row[1])
+                    column, max_length, row_count, *current = (tuple(row[3:8]) + (None,) * 5)[:5]
                 except (AttributeError, IndexError, TypeError):
                     logger.error(f"Cannot extract Alter_Statement from row type {type(row)}: {row}")
                     continue
 
+            if alter_sql and column_has_type(*current, lob_target_type(max_length)):
+                already_applied += 1
+                continue
             if alter_sql:
-                try:
-                    sanitize_sql(
-                        conn,
-                        alter_sql,
-                        timeout=config['sql_timeout'],
-                    )
-                    conn.commit()
-                except Exception as e:
-                    conn.rollback()
-                    error_msg = f"Failed to alter column (statement {idx}): {e}"
-                    logger.error(error_msg)
-                    log_exception_to_file(error_msg, log_file)
-                    raise
-
-    logger.info(f"Completed optimizing {len(rows)} LOB columns")
+                changes = tables.setdefault(key, LobTableChanges(*key))
+                changes.statements.append((idx, alter_sql))
+                changes.row_count = max(changes.row_count, row_count or 0)
+                # A column that was never measured has no safe target size,
+                # which keeps its table on the ALTER path.
+                if column and max_length is not None:
+                    changes.column_types[column.lower()] = lob_target_type(max_length)
+
+        if already_applied:
+            logger.info(f"Skipping {already_applied} LOB columns that already have their target type")
+
+        rebuilt = 0
+        if workers > 1 and len(tables) > 1:
+            errors: list[BaseException] = []
+
+            def update_table(changes: LobTableChanges) -> bool:
+                with get_target_connection() as worker_conn:
+                    return _update_table_columns(worker_conn, changes, config, retry_policy, log_file)
+
+            def record(outcome: TaskOutcome) -> None:
+                nonlocal rebuilt
+                if not outcome.ok:
+                    errors.append(outcome.error)
+                elif outcome.result:
+                    rebuilt += 1
+
+            run_parallel(
+                list(tables.values()),
+                update_table,
+                workers,
+                desc="Optimizing LOB Tables",
+                unit="table",
+                on_complete=record,
+            )
+            if errors:
+                logger.error(f"LOB column ALTERs failed for {len(errors)} tables")
+                raise errors[0]
+        else:
+            for changes in tqdm(list(tables.values()), desc="Optimizing LOB Columns", unit="table"):
+                if _update_table_columns(conn, changes, config, retry_policy, log_file):
+                    rebuilt += 1
+
+    logger.info(
+        f"Completed optimizing {len(rows) - already_applied} LOB columns in {len(tables)} tables "
+        f"({rebuilt} rebuilt in one pass)"
+    )
 def show_completion_message() -> bool:
     """Show a message box indicating completion."""
     root = tk.Tk()
@@ -463,12 +1110,25 @@ def main() -> None:
             config["sql_timeout"] = int(os.environ.get("SQL_TIMEOUT"))
         if os.environ.get("BATCH_SIZE"):
             config["batch_size"] = int(os.environ.get("BATCH_SIZE"))
+        if os.environ.get("LOB_WORKERS"):
+            config["workers"] = int(os.environ.get("LOB_WORKERS"))
+        if os.environ.get("LOB_REBUILD_ROWS"):
+            config["rebuild_rows"] = int(os.environ.get("LOB_REBUILD_ROWS"))
+        if os.environ.get("LOB_FULL_SCAN") == "1":
+            config["incremental"] = False
 
         # Override config with command line arguments
         if args.include_empty:
             config["include_empty_tables"] = True
         if args.batch_size:
             config["batch_size"] = args.batch_size
+        if args.workers:
+            config["workers"] = args.workers
+        if args.rebuild_rows is not None:
+            config["rebuild_rows"] = args.rebuild_rows
+        if args.full:
+            config["incremental"] = False
+        check_pool_capacity(config)
 
         # Set up log file path
         config['log_file'] = args.log_file or os.path.join(
@@ -485,12 +1145,16 @@ def main() -> None:
                 create_lob_tracking_table(conn, config)
                 
                 # Step 2: Gather LOB column information
+                config["track_writes"] = usage_stats_visible(conn, config["sql_timeout"])
                 gather_lob_columns(conn, config, config['log_file'])
                 
                 # Step 3: Execute column alterations
                 execute_lob_column_updates(conn, config, config['log_file'])
+
+                # Step 4: Remember which tables are done for the next run
+                record_lob_table_state(conn, config)
                 
-                # Step 4: Show completion message
+                # Step 5: Show completion message
                 show_completion_message()
                 logger.info(
                     "Run completed - successes: %s failures: %s",
@@ -522,5 +1186,8 @@ def main() -> None:
             root.destroy()
         except Exception as msgbox_exc:
             logger.error(f"Failed to show error message box: {msgbox_exc}")
+    finally:
+        dispose_engines()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
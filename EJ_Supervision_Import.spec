@@ -63,13 +63,25 @@ a = Analysis(
         # ETL dependencies
         'etl.configurable_importer',
         'etl.base_importer',
+        'etl.bulk_loader',
+        'etl.joins_import',
         'etl.core',
+        'etl.parallel',
+        'etl.pk_builder',
+        'etl.planner',
         'etl.runner',
+        'etl.scheduler',
+        'etl.metadata_writer',
+        'etl.range_copy',
+        'etl.run_report',
+        'etl.tsql_lexer',
         
         # Utils dependencies  
         'utils.logging_helper',
         'utils.etl_helpers',
         'utils.progress_tracker',
+        'utils.checkpoint_store',
+        'utils.retry_policy',
         
         # Config dependencies
         'config.settings',
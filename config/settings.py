@@ -29,8 +29,25 @@ class ETLConstants:
     DEFAULT_SQL_TIMEOUT = 300
     DEFAULT_BULK_INSERT_BATCH_SIZE = 100
     MAX_RETRY_ATTEMPTS = 3
+    DEFAULT_RETRY_BUDGET = 25
+    DEFAULT_RETRY_BASE_DELAY = 1.0
+    DEFAULT_RETRY_MAX_DELAY = 30.0
     CONNECTION_TIMEOUT = 30
+    DEFAULT_DB_POOL_SIZE = 5
+    DEFAULT_DB_MAX_OVERFLOW = 10
+    DEFAULT_DB_POOL_TIMEOUT = 30
     DEFAULT_CSV_CHUNK_SIZE = 50000
+    DEFAULT_TABLE_WORKERS = 1
+    DEFAULT_PK_WORKERS = 1
+    DEFAULT_METADATA_FLUSH_ROWS = 50
+    DEFAULT_METADATA_FLUSH_SECONDS = 30
+    DEFAULT_CHECKPOINT_FLUSH_MARKS = 25
+    DEFAULT_CHECKPOINT_FLUSH_SECONDS = 5
+    DEFAULT_LARGE_TABLE_ROWS = 0  # 0 disables key-range copies
+    DEFAULT_LARGE_TABLE_SLICE_ROWS = 5_000_000
+    DEFAULT_LARGE_TABLE_SLICE_WORKERS = 1
+    DROP_BATCH_SIZE = 100  # tables per DROP TABLE statement
+    DEFAULT_LOB_REBUILD_ROWS = 1_000_000  # 0 always alters LOB columns one at a time
 
 class Settings(BaseSettings):
     """Application configuration."""
@@ -61,8 +78,13 @@ class Settings(BaseSettings):
     # Performance settings
     sql_timeout: int = Field(default=ETLConstants.DEFAULT_SQL_TIMEOUT)
     csv_chunk_size: int = Field(default=ETLConstants.DEFAULT_CSV_CHUNK_SIZE)
+    table_workers: int = Field(default=ETLConstants.DEFAULT_TABLE_WORKERS)
+    pk_workers: int = Field(default=ETLConstants.DEFAULT_PK_WORKERS)
     max_retry_attempts: int = Field(default=ETLConstants.MAX_RETRY_ATTEMPTS)
     connection_timeout: int = Field(default=ETLConstants.CONNECTION_TIMEOUT)
+    db_pool_size: int = Field(default=ETLConstants.DEFAULT_DB_POOL_SIZE)
+    db_max_overflow: int = Field(default=ETLConstants.DEFAULT_DB_MAX_OVERFLOW)
+    db_pool_timeout: int = Field(default=ETLConstants.DEFAULT_DB_POOL_TIMEOUT)
     
     @property
     def mssql_target_conn_str(self) -> Optional[str]:
@@ -5,6 +5,8 @@ from .connections import (
     get_target_connection,
     get_mysql_connection,
     get_engine,
+    get_target_engine,
+    dispose_engines,
     get_connection,
 )
 from .health import check_connection, check_target_connection
@@ -14,6 +16,8 @@ __all__ = [
     "get_target_connection",
     "get_mysql_connection",
     "get_engine",
+    "get_target_engine",
+    "dispose_engines",
     "get_connection",
     "check_connection",
     "check_target_connection",
@@ -47,18 +47,29 @@ def get_engine(url: URL | str) -> Engine:
     key = str(url)
     engine = _engines.get(key)
     if engine is None:
-        # Use default pool settings since they're not in the current settings class
         engine = sqlalchemy.create_engine(
             url,
-            pool_size=5,
-            max_overflow=10,
-            pool_timeout=30,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
             pool_pre_ping=True,
         )
         _engines[key] = engine
     return engine
 
 
+def pool_capacity() -> int:
+    """Return how many connections one engine's pool can hand out at once."""
+    return settings.db_pool_size + settings.db_max_overflow
+
+
+def dispose_engines() -> None:
+    """Close the pooled connections of every cached engine and forget them."""
+    while _engines:
+        _, engine = _engines.popitem()
+        engine.dispose()
+
+
 def get_connection(url: URL | str) -> Connection:
     """Return a pooled connection for ``url``."""
     return get_engine(url).connect()
@@ -69,6 +80,19 @@ def get_mssql_connection(conn_str: str) -> Connection:
     return get_connection(build_mssql_url(conn_str))
 
 
+def _target_conn_str() -> str:
+    # Check environment variable first, then settings property
+    conn_str = os.environ.get('MSSQL_TARGET_CONN_STR') or settings.mssql_target_conn_str
+    if not conn_str:
+        raise ValueError("No target connection string configured")
+    return conn_str
+
+
+def get_target_engine() -> Engine:
+    """Return the shared engine for the configured MSSQL target database."""
+    return get_engine(build_mssql_url(_target_conn_str()))
+
+
 def get_source_connection() -> Connection:
     """Connect to the configured MSSQL source database."""
     # Check environment variable first, then settings property
@@ -80,11 +104,7 @@ def get_source_connection() -> Connection:
 
 def get_target_connection() -> Connection:
     """Connect to the configured MSSQL target database."""
-    # FIXED: Check environment variable first, then settings property
-    conn_str = os.environ.get('MSSQL_TARGET_CONN_STR') or settings.mssql_target_conn_str
-    if not conn_str:
-        raise ValueError("No target connection string configured")
-    return get_mssql_connection(conn_str)
+    return get_target_engine().connect()
 
 
 def get_mysql_connection(
@@ -112,6 +132,8 @@ __all__ = [
     "build_mssql_url",
     "build_mysql_url",
     "get_engine",
+    "get_target_engine",
+    "dispose_engines",
     "get_connection",
     "get_mssql_connection",
     "get_source_connection",
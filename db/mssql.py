@@ -12,6 +12,8 @@ from typing import Any
 from .connections import (
     build_mssql_url,
     get_engine,
+    get_target_engine,
+    dispose_engines,
     get_connection,
     get_mssql_connection,
     get_source_connection,
@@ -24,6 +26,8 @@ Connection = Any
 __all__ = [
     "build_mssql_url",
     "get_engine",
+    "get_target_engine",
+    "dispose_engines",
     "get_connection",
     "get_mssql_connection",
     "get_source_connection",
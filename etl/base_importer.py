@@ -3,17 +3,17 @@ from __future__ import annotations
 import logging
 import os
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
 import tkinter as tk
 from tkinter import messagebox
-import pandas as pd
-import urllib
 import sqlalchemy
 from typing import Any, Optional
-from sqlalchemy.types import Text
 from sqlalchemy.exc import SQLAlchemyError
 import pyodbc
 from utils.etl_helpers import SQLExecutionError
-from db.connections import get_target_connection
+from db.connections import dispose_engines, get_target_connection, get_target_engine, pool_capacity
 from utils.etl_helpers import (
     load_sql,
     run_sql_script,
@@ -21,8 +21,51 @@ from utils.etl_helpers import (
     transaction_scope,
     execute_sql_with_timeout,
 )
+from utils.checkpoint_store import CheckpointStore
 from utils.progress_tracker import ProgressTracker
+from utils.retry_policy import RetryBudget, RetryPolicy, is_lock_error, is_transient
+from etl.bulk_loader import load_frames, read_header
+from etl.joins_import import (
+    JOIN_COLUMN_TYPES,
+    JOIN_STR_COLUMNS,
+    clear_fingerprint,
+    ensure_fingerprint_table,
+    fingerprint_file,
+    import_is_current,
+    normalized_chunks,
+    save_fingerprint,
+)
+from etl.metadata_writer import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    TableResultBuffer,
+    build_update_statements,
+)
+from etl.parallel import TaskOutcome, run_parallel, run_pipelined
+from etl.pk_builder import (
+    ConstraintBatch,
+    build_constraint_batch,
+    resolve_index_options,
+    validate_index_options,
+)
+from etl.planner import build_plan, format_plan, write_plan
+from etl.range_copy import (
+    build_create_sql,
+    build_key_range_sql,
+    build_slice_sql,
+    plan_slices,
+    split_select_into,
+)
+from etl.run_report import RunReport
+from etl.scheduler import (
+    TableDurationHistory,
+    order_longest_first,
+    order_table_groups_longest_first,
+    table_key,
+)
+from etl.tsql_lexer import parse_select_into
 from etl.core import (
+    ConfigError,
     sanitize_sql,
     safe_tqdm,
     load_config,
@@ -55,6 +98,34 @@ class BaseDBImporter:
             ),
         )
         self.progress = ProgressTracker(self.progress_file)
+        self.checkpoint_file = os.environ.get(
+            "CHECKPOINT_FILE",
+            os.path.join(
+                os.environ.get("EJ_LOG_DIR", ""),
+                f"{self.DB_TYPE}_checkpoints.json",
+            ),
+        )
+        self.checkpoints = CheckpointStore(
+            self.checkpoint_file,
+            ETLConstants.DEFAULT_CHECKPOINT_FLUSH_MARKS,
+            ETLConstants.DEFAULT_CHECKPOINT_FLUSH_SECONDS,
+        )
+        # Unlike the progress file this history survives fresh runs so later
+        # runs can schedule the slowest tables first.
+        self.durations_file = os.environ.get(
+            "DURATIONS_FILE",
+            os.path.join(
+                os.environ.get("EJ_LOG_DIR", ""),
+                f"{self.DB_TYPE}_table_durations.json",
+            ),
+        )
+        self.duration_history = TableDurationHistory(self.durations_file)
+        self.table_results = TableResultBuffer(
+            ETLConstants.DEFAULT_METADATA_FLUSH_ROWS,
+            ETLConstants.DEFAULT_METADATA_FLUSH_SECONDS,
+        )
+        self.retry_policy = RetryPolicy()
+        self.report = RunReport(self.DB_TYPE)
         self.extra_validation = False
 
     def parse_args(self) -> argparse.Namespace:
@@ -73,6 +144,30 @@ class BaseDBImporter:
             action="store_true",
             help="Force a fresh run by clearing migration history",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of tables to copy concurrently",
+        )
+        parser.add_argument(
+            "--pk-workers",
+            type=int,
+            help="Number of tables to build primary keys for concurrently",
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="Build each table's primary key as soon as its copy finishes",
+        )
+        parser.add_argument(
+            "--plan",
+            action="store_true",
+            help="Estimate rows, bytes and duration per table without copying any data",
+        )
+        parser.add_argument(
+            "--plan-file",
+            help="Where to write the JSON plan (defaults to <DB_TYPE>_plan.json in EJ_LOG_DIR)",
+        )
         return parser.parse_args()
 
     def clear_migration_history(self, conn: Any) -> None:
@@ -112,7 +207,11 @@ class BaseDBImporter:
         optional_vars = {
             'EJ_LOG_DIR': "Directory for log files (defaults to current directory)",
             'INCLUDE_EMPTY_TABLES': "Set to '1' to include empty tables (defaults to '0')",
-            'SQL_TIMEOUT': "Timeout in seconds for SQL operations (defaults to 300)"
+            'SQL_TIMEOUT': "Timeout in seconds for SQL operations (defaults to 300)",
+            'TABLE_WORKERS': "Number of tables to copy concurrently (defaults to 1)",
+            'PK_WORKERS': "Number of tables to build primary keys for concurrently (defaults to 1)",
+            'PIPELINE_BUILDS': "Set to '1' to build each table's primary key as soon as it is copied",
+            'LARGE_TABLE_ROWS': "Row count at which tables are copied in key-range slices (0 disables)"
         }
         
         validate_environment(required_vars, optional_vars)
@@ -128,6 +227,19 @@ class BaseDBImporter:
             "sql_timeout": ETLConstants.DEFAULT_SQL_TIMEOUT,  # seconds
             "csv_chunk_size": ETLConstants.DEFAULT_CSV_CHUNK_SIZE,
             "force_fresh_run": False,  # Add this option
+            "table_workers": ETLConstants.DEFAULT_TABLE_WORKERS,
+            "pk_workers": ETLConstants.DEFAULT_PK_WORKERS,
+            "pipeline_table_builds": False,
+            "metadata_flush_rows": ETLConstants.DEFAULT_METADATA_FLUSH_ROWS,
+            "metadata_flush_seconds": ETLConstants.DEFAULT_METADATA_FLUSH_SECONDS,
+            "large_table_row_threshold": ETLConstants.DEFAULT_LARGE_TABLE_ROWS,
+            "large_table_slice_rows": ETLConstants.DEFAULT_LARGE_TABLE_SLICE_ROWS,
+            "large_table_slice_workers": ETLConstants.DEFAULT_LARGE_TABLE_SLICE_WORKERS,
+            "max_retry_attempts": ETLConstants.MAX_RETRY_ATTEMPTS,
+            "retry_budget": ETLConstants.DEFAULT_RETRY_BUDGET,
+            "reuse_joins_import": True,
+            "pk_index_options": {},
+            "pk_index_options_by_table": {},
         }
         
         self.config = load_config(args.config_file, default_config)
@@ -145,6 +257,16 @@ class BaseDBImporter:
             self.config["sql_timeout"] = int(os.environ.get("SQL_TIMEOUT"))
         if os.environ.get("CSV_CHUNK_SIZE"):
             self.config["csv_chunk_size"] = int(os.environ.get("CSV_CHUNK_SIZE"))
+        if os.environ.get("TABLE_WORKERS"):
+            self.config["table_workers"] = int(os.environ.get("TABLE_WORKERS"))
+        if os.environ.get("PK_WORKERS"):
+            self.config["pk_workers"] = int(os.environ.get("PK_WORKERS"))
+        if os.environ.get("PIPELINE_BUILDS") == "1":
+            self.config["pipeline_table_builds"] = True
+        if os.environ.get("LARGE_TABLE_ROWS"):
+            self.config["large_table_row_threshold"] = int(os.environ.get("LARGE_TABLE_ROWS"))
+        if os.environ.get("REIMPORT_JOINS") == "1":
+            self.config["reuse_joins_import"] = False
         
         # NEW: Check for force fresh run - either from GUI (RESUME != "1") or command line
         if os.environ.get("RESUME") != "1" or getattr(args, "force_fresh_run", False):
@@ -158,6 +280,36 @@ class BaseDBImporter:
             self.config["skip_pk_creation"] = True
         if hasattr(args, "csv_chunk_size") and args.csv_chunk_size:
             self.config["csv_chunk_size"] = args.csv_chunk_size
+        if getattr(args, "workers", None):
+            self.config["table_workers"] = args.workers
+        if getattr(args, "pk_workers", None):
+            self.config["pk_workers"] = args.pk_workers
+        if getattr(args, "pipeline", False):
+            self.config["pipeline_table_builds"] = True
+        self.config["table_workers"] = max(1, int(self.config["table_workers"]))
+        self.config["pk_workers"] = max(1, int(self.config["pk_workers"]))
+        needed = self.required_connections()
+        if needed > pool_capacity():
+            raise ConfigError(
+                f"table_workers={self.config['table_workers']}, pk_workers={self.config['pk_workers']} and "
+                f"large_table_slice_workers={self.config['large_table_slice_workers']} can hold {needed} "
+                f"connections at once but the pool allows {pool_capacity()} "
+                f"(DB_POOL_SIZE={settings.db_pool_size} + DB_MAX_OVERFLOW={settings.db_max_overflow}); "
+                "lower the worker counts or raise DB_MAX_OVERFLOW"
+            )
+        self.config["pk_index_options"] = validate_index_options(self.config["pk_index_options"])
+        self.config["pk_index_options_by_table"] = {
+            str(table).strip().lower(): validate_index_options(options, f"pk_index_options_by_table[{table}]")
+            for table, options in (self.config["pk_index_options_by_table"] or {}).items()
+        }
+        self.table_results = TableResultBuffer(
+            self.config["metadata_flush_rows"],
+            self.config["metadata_flush_seconds"],
+        )
+        self.retry_policy = RetryPolicy(
+            self.config["max_retry_attempts"],
+            RetryBudget(self.config["retry_budget"]),
+        )
         
         # Set up paths
         self.config['log_file'] = getattr(args, "log_file", None) or os.path.join(
@@ -165,11 +317,38 @@ class BaseDBImporter:
             self.config["log_filename"]
         )
         
+        self.config['report_file'] = os.path.join(
+            os.environ.get("EJ_LOG_DIR", ""),
+            f"{self.DB_TYPE}_run_report.json",
+        )
+
+        self.config['plan_file'] = getattr(args, "plan_file", None) or os.path.join(
+            os.environ.get("EJ_LOG_DIR", ""),
+            f"{self.DB_TYPE}_plan.json",
+        )
+
         self.config['csv_file'] = getattr(args, "csv_file", None) or os.path.join(
             os.environ.get("EJ_CSV_DIR", ""),
             self.config["csv_filename"]
         )
 
+    def required_connections(self) -> int:
+        """Return the most pooled target connections the configured workers hold at once.
+
+        The main connection is held for the whole run, next to the background
+        joins import during preprocessing.  Each copy worker holds its own
+        connection plus one per slice worker for large tables, and pipelined
+        builds run the primary key workers alongside the copies.
+        """
+        table_workers = self.config["table_workers"]
+        slice_workers = max(1, int(self.config.get("large_table_slice_workers") or 1))
+        copies = table_workers * (1 + slice_workers) if slice_workers > 1 else table_workers
+        if self.config.get("pipeline_table_builds"):
+            busy = copies + self.config["pk_workers"]
+        else:
+            busy = max(copies, self.config["pk_workers"])
+        return 1 + max(1, busy)
+
     def run_sql_file(self, conn: Any, name: str, filename: str) -> None:
         """Load a SQL file and execute it with optional validation."""
         sql = load_sql(filename, self.db_name)
@@ -182,12 +361,9 @@ class BaseDBImporter:
         """Import JOIN statements from CSV to build selection queries."""
         logger.info(f"Importing JOINS from {self.DB_TYPE} Selects CSV")
         
-        # Set up database connection for pandas
-        conn_str = os.environ['MSSQL_TARGET_CONN_STR']
-        params = urllib.parse.quote_plus(conn_str)
-        db_url = f"mssql+pyodbc:///?odbc_connect={params}"
-        engine = sqlalchemy.create_engine(db_url)
-        
+        # Shared pooled engine; disposed at the end of run()
+        engine = get_target_engine()
+
         csv_path = self.config['csv_file']
         log_file = self.config['log_file']
         
@@ -202,31 +378,60 @@ class BaseDBImporter:
         table_name = (
             f'TableUsedSelects_{self.DB_TYPE}' if self.DB_TYPE != 'Justice' else 'TableUsedSelects'
         )
-        total_rows = 0
-        first = True
-        for chunk in safe_tqdm(
-            pd.read_csv(csv_path, delimiter='|', encoding='utf-8', chunksize=chunksize),
-            desc="Importing JOINs",
-            unit="rows",
-        ):
-            chunk = chunk.astype({
-                'DatabaseName': 'str', 'SchemaName': 'str', 'TableName': 'str',
-                'Freq': 'str', 'InScopeFreq': 'str', 'Select_Only': 'str',
-                'fConvert': 'str', 'Drop_IfExists': 'str', 'Selection': 'str',
-                'Select_Into': 'str'
-            })
-            total_rows += len(chunk)
-            chunk.to_sql(
+        fingerprint = fingerprint_file(csv_path)
+        raw_conn = engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            try:
+                ensure_fingerprint_table(cursor)
+                if self.config.get("reuse_joins_import", True) and import_is_current(
+                    cursor, table_name, fingerprint
+                ):
+                    raw_conn.commit()
+                    logger.info(
+                        f"Joins import cache hit: {csv_path} is unchanged "
+                        f"(sha256 {fingerprint.sha256[:12]}); keeping {table_name}"
+                    )
+                    return engine
+                clear_fingerprint(cursor, table_name)
+                raw_conn.commit()
+            finally:
+                cursor.close()
+
+            rejected = []
+            stats = load_frames(
+                raw_conn,
+                normalized_chunks(csv_path, chunksize, rejected),
                 table_name,
-                con=engine,
-                if_exists='replace' if first else 'append',
-                index=False,
-                dtype={'Select_Into': Text(), 'Drop_IfExists': Text()},
+                str_columns=JOIN_STR_COLUMNS,
+                column_types=JOIN_COLUMN_TYPES,
+                desc="Importing JOINs",
+                columns=read_header(csv_path),
+            )
+
+            # A load that rejected rows is not cached, so the next run
+            # reloads the file and reports the rejects again.
+            if not rejected:
+                cursor = raw_conn.cursor()
+                try:
+                    save_fingerprint(cursor, table_name, fingerprint, stats.rows)
+                    raw_conn.commit()
+                finally:
+                    cursor.close()
+        finally:
+            raw_conn.close()
+
+        if rejected:
+            details = "\n".join(
+                f"  line {r.line}: invalid {r.column} value {r.value!r}" for r in rejected
             )
-            first = False
+            error_msg = f"Rejected {len(rejected)} malformed rows from {csv_path}:\n{details}"
+            logger.warning(error_msg)
+            log_exception_to_file(error_msg, log_file)
 
         logger.info(
-            f"Successfully imported {total_rows} JOIN definitions from {csv_path}"
+            f"Successfully imported {stats.rows} JOIN definitions from {csv_path} "
+            f"({stats.rows_per_second:,.0f} rows/s)"
         )
         return engine
 
@@ -241,29 +446,67 @@ class BaseDBImporter:
         db_name = validate_sql_identifier(self.db_name)
         successful_tables = 0
         failed_tables = 0
-        start_idx = self.progress.get("table_operations")
+        skipped_tables = 0
+        workers = self.config.get("table_workers", ETLConstants.DEFAULT_TABLE_WORKERS)
+
+        if workers > 1:
+            with transaction_scope(conn):
+                rows = self._fetch_table_operation_rows(conn, db_name, table_name)
+            rows = order_longest_first(rows, "table_operations", self.duration_history)
+            try:
+                self._execute_table_operations_parallel(conn, rows, workers, log_file)
+            finally:
+                self._flush_table_results(conn, log_file)
+            self.duration_history.save()
+            return
 
         try:
             with transaction_scope(conn):
                 rows = self._fetch_table_operation_rows(conn, db_name, table_name)
+                rows = order_longest_first(rows, "table_operations", self.duration_history)
 
-                for idx, row_dict in enumerate(
-                    safe_tqdm(rows, desc="Drop/Select", unit="table"), 1
-                ):
-                    if idx <= start_idx:
-                        continue
-                    try:
-                        if self._process_table_operation_row(conn, row_dict, idx, log_file):
-                            successful_tables += 1
-                            self.progress.update("table_operations", idx)
-                        else:
-                            failed_tables += 1
-                    except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as row_error:
-                        table = f"{row_dict.get('SchemaName')}.{row_dict.get('TableName')}"
-                        error_msg = f"Row processing error during DROP/SELECT for {table}: {row_error}"
-                        logger.error(error_msg)
-                        log_exception_to_file(error_msg, log_file)
-                        raise
+                try:
+                    for idx, row_dict in enumerate(
+                        safe_tqdm(rows, desc="Drop/Select", unit="table"), 1
+                    ):
+                        row_id = row_dict.get("RowID")
+                        key = table_key(row_dict)
+                        if self.checkpoints.is_done("table_operations", row_id, key):
+                            skipped_tables += 1
+                            continue
+                        self.checkpoints.start("table_operations", row_id, key)
+                        try:
+                            started = time.perf_counter()
+                            # Every attempt runs on ``conn``, so only errors
+                            # that leave it usable are retried.
+                            processed = self.retry_policy.run(
+                                lambda: self._process_table_operation_row(conn, row_dict, idx, log_file),
+                                f"DROP/SELECT {self.DB_TYPE}.{row_dict.get('SchemaName')}.{row_dict.get('TableName')}",
+                                retryable=is_lock_error,
+                            )
+                            if processed:
+                                successful_tables += 1
+                                self._record_duration("table_operations", row_dict, started)
+                                self.checkpoints.complete("table_operations", row_id, key)
+                                self.progress.update(
+                                    "table_operations",
+                                    self.checkpoints.count("table_operations"),
+                                    total=len(rows),
+                                )
+                            else:
+                                failed_tables += 1
+                                self.checkpoints.fail("table_operations", row_id, key)
+                        except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as row_error:
+                            self.checkpoints.fail("table_operations", row_id, key, error=row_error)
+                            table = f"{row_dict.get('SchemaName')}.{row_dict.get('TableName')}"
+                            error_msg = f"Row processing error during DROP/SELECT for {table}: {row_error}"
+                            logger.error(error_msg)
+                            log_exception_to_file(error_msg, log_file)
+                            raise
+                        if self.table_results.due():
+                            self._flush_table_results(conn, log_file)
+                finally:
+                    self._flush_table_results(conn, log_file)
 
         except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as query_error:
             error_msg = f"Fatal query error during table operations: {query_error}"
@@ -271,11 +514,358 @@ class BaseDBImporter:
             log_exception_to_file(error_msg, log_file)
             raise
 
+        self.duration_history.save()
+        if skipped_tables:
+            logger.info(f"Skipped {skipped_tables} tables completed in an earlier run")
         logger.info(f"Table operations completed: {successful_tables} successful, {failed_tables} failed")
 
+    def _record_duration(self, phase: str, row_dict: Any, started: float) -> None:
+        """Store how long a table took so later runs can schedule it."""
+        self.duration_history.record(
+            phase,
+            table_key(row_dict),
+            time.perf_counter() - started,
+            rows=row_dict.get("RowCount"),
+        )
+
+    def _execute_table_operations_parallel(
+        self,
+        conn: Any,
+        rows: list[dict[str, Any]],
+        workers: int,
+        log_file: str,
+    ) -> None:
+        """Run DROP/SELECT INTO for independent tables on a pool of connections.
+
+        Each table is processed on its own pooled connection.  Failures are
+        captured per table so the remaining tables still finish; the first
+        error is re-raised once the pool has drained.  Buffered table results
+        are flushed through ``conn`` on the calling thread.
+        """
+        pending = [
+            (idx, row)
+            for idx, row in enumerate(rows, 1)
+            if not self.checkpoints.is_done("table_operations", row.get("RowID"), table_key(row))
+        ]
+        if len(pending) < len(rows):
+            logger.info(f"Skipped {len(rows) - len(pending)} tables completed in an earlier run")
+        successful_tables = 0
+        failed_tables = 0
+        errors: list[BaseException] = []
+
+        def copy_table(work: tuple[int, dict[str, Any]]) -> bool:
+            idx, row_dict = work
+            return self._copy_table(idx, row_dict, log_file)
+
+        def record(outcome: TaskOutcome) -> None:
+            nonlocal successful_tables, failed_tables
+            idx, row_dict = outcome.item
+            row_id = row_dict.get("RowID")
+            if outcome.ok and outcome.result:
+                successful_tables += 1
+                self.checkpoints.complete("table_operations", row_id, table_key(row_dict))
+                self.progress.update(
+                    "table_operations",
+                    self.checkpoints.count("table_operations"),
+                    total=len(rows),
+                )
+            else:
+                failed_tables += 1
+                self.checkpoints.fail(
+                    "table_operations", row_id, table_key(row_dict), error=outcome.error
+                )
+                if outcome.error is not None:
+                    table = f"{row_dict.get('SchemaName')}.{row_dict.get('TableName')}"
+                    error_msg = f"Row processing error during DROP/SELECT for {table}: {outcome.error}"
+                    logger.error(error_msg)
+                    log_exception_to_file(error_msg, log_file)
+                    errors.append(outcome.error)
+            if self.table_results.due():
+                self._flush_table_results(conn, log_file)
+
+        run_parallel(
+            pending,
+            copy_table,
+            workers,
+            desc="Drop/Select",
+            unit="table",
+            on_complete=record,
+        )
+
+        logger.info(f"Table operations completed: {successful_tables} successful, {failed_tables} failed")
+        if errors:
+            raise errors[0]
+
+    def _copy_table(self, idx: int, row_dict: dict[str, Any], log_file: str) -> bool:
+        """Copy one table on its own pooled connection, retrying transient errors."""
+        self.checkpoints.start("table_operations", row_dict.get("RowID"), table_key(row_dict))
+        started = time.perf_counter()
+
+        def attempt() -> bool:
+            # A fresh connection per attempt recovers from dropped links
+            with get_target_connection() as worker_conn:
+                return self._process_table_operation_row(worker_conn, row_dict, idx, log_file)
+
+        processed = self.retry_policy.run(
+            attempt,
+            f"DROP/SELECT {self.DB_TYPE}.{row_dict.get('SchemaName')}.{row_dict.get('TableName')}",
+        )
+        if processed:
+            self._record_duration("table_operations", row_dict, started)
+        return processed
+
+    def execute_pipelined_builds(self, conn: Any) -> None:
+        """Copy the tables and build each one's constraints as soon as it is copied.
+
+        Replaces the barriers between :meth:`execute_table_operations`,
+        :meth:`drop_empty_tables` and :meth:`create_primary_keys`.  When a
+        table's SELECT INTO finishes, its NOT NULL/PK batch is queued on a
+        second pool of ``pk_workers`` connections while the copy pool moves
+        on, so index builds overlap with the remaining copies.  Tables that
+        came out empty and are not kept are dropped in one batch at the end.
+        Tables copied in an earlier run but still missing their PK are queued
+        straight away.
+        """
+        log_file = self.config['log_file']
+        tables_table = (
+            f"TablesToConvert_{self.DB_TYPE}" if self.DB_TYPE != 'Justice' else 'TablesToConvert'
+        )
+        tables_table = validate_sql_identifier(tables_table)
+        db_name = validate_sql_identifier(self.db_name)
+
+        def schema_table(row: Any) -> str:
+            # PK rows carry the target database name, copy rows the source's
+            return f"{row.get('SchemaName')}.{row.get('TableName')}".lower()
+
+        def pk_done(group: list[dict[str, Any]]) -> bool:
+            return self.checkpoints.is_done("pk_creation", group[-1].get("RowID"), table_key(group[-1]))
+
+        pk_groups: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+        if self.config['skip_pk_creation']:
+            logger.info("Skipping primary key and constraint creation as requested in configuration")
+        else:
+            for first, group in self._pk_table_groups(conn, log_file):
+                pk_groups[schema_table(group[-1])] = (first, group)
+
+        with transaction_scope(conn):
+            rows = self._fetch_table_operation_rows(conn, db_name, tables_table)
+        rows = order_longest_first(rows, "table_operations", self.duration_history)
+        copies = [
+            (idx, row)
+            for idx, row in enumerate(rows, 1)
+            if not self.checkpoints.is_done("table_operations", row.get("RowID"), table_key(row))
+        ]
+        if len(copies) < len(rows):
+            logger.info(f"Skipped {len(rows) - len(copies)} tables completed in an earlier run")
+        copying = {schema_table(row) for _, row in copies}
+        ready = [item for key, item in pk_groups.items() if key not in copying and not pk_done(item[1])]
+
+        overrides = self._empty_table_overrides()
+        keep_empty = self.config.get("include_empty_tables")
+        empty_tables: list[tuple[str, str]] = []
+        successful_tables = 0
+        failed_tables = 0
+        errors: list[BaseException] = []
+
+        def copy_table(work: tuple[int, dict[str, Any]]) -> bool:
+            idx, row_dict = work
+            return self._copy_table(idx, row_dict, log_file)
+
+        def copied(outcome: TaskOutcome) -> Optional[tuple[int, list[dict[str, Any]]]]:
+            nonlocal successful_tables, failed_tables
+            idx, row_dict = outcome.item
+            row_id = row_dict.get("RowID")
+            if not (outcome.ok and outcome.result):
+                failed_tables += 1
+                self.checkpoints.fail("table_operations", row_id, table_key(row_dict), error=outcome.error)
+                if outcome.error is not None:
+                    table = f"{row_dict.get('SchemaName')}.{row_dict.get('TableName')}"
+                    error_msg = f"Row processing error during DROP/SELECT for {table}: {outcome.error}"
+                    logger.error(error_msg)
+                    log_exception_to_file(error_msg, log_file)
+                    errors.append(outcome.error)
+                return None
+
+            successful_tables += 1
+            self.checkpoints.complete("table_operations", row_id, table_key(row_dict))
+            self.progress.update(
+                "table_operations", self.checkpoints.count("table_operations"), total=len(rows)
+            )
+            # Read the copied row count before the buffer is flushed
+            result = self.table_results.get(row_id) if row_id is not None else None
+            row_count = row_dict.get("ScopeRowCount")
+            if result is not None and result.row_count is not None:
+                row_count = result.row_count
+            if self.table_results.due():
+                self._flush_table_results(conn, log_file)
+
+            if int(row_count or 0) <= 0 and not keep_empty:
+                schema_name = validate_sql_identifier(row_dict.get("SchemaName"))
+                table_name = validate_sql_identifier(row_dict.get("TableName"))
+                if not self._is_protected_empty_table(schema_name, table_name, overrides):
+                    empty_tables.append((schema_name, table_name))
+                    return None
+            # The table was just recreated, so its PK is built even if an
+            # earlier run had checkpointed it.  The PK rows were fetched
+            # before the copy; give them the copied row count so the PK
+            # step does not go by the spreadsheet's ScopeRowCount.
+            pk_item = pk_groups.get(schema_table(row_dict))
+            if pk_item is None:
+                return None
+            first, group = pk_item
+            return first, [{**pk_row, "ScopeRowCount": row_count} for pk_row in group]
+
+        def build_table(work: tuple[int, list[dict[str, Any]]]) -> tuple[float, Optional[ConstraintBatch]]:
+            first_idx, group = work
+            return self._create_table_constraints(None, group, first_idx, log_file)
+
+        def built(outcome: TaskOutcome) -> None:
+            _, group = outcome.item
+            if outcome.ok:
+                self._record_pk_table(group, outcome.result, len(pk_groups))
+                return
+            table = f"{group[-1].get('SchemaName')}.{group[-1].get('TableName')}"
+            logger.error(f"PK creation failed for {table}: {outcome.error}")
+            errors.append(outcome.error)
+
+        try:
+            run_pipelined(
+                copies,
+                copy_table,
+                build_table,
+                self.config.get("table_workers", ETLConstants.DEFAULT_TABLE_WORKERS),
+                self.config.get("pk_workers", ETLConstants.DEFAULT_PK_WORKERS),
+                on_first=copied,
+                on_second=built,
+                ready=ready,
+                desc="Copy/PK",
+                unit="table",
+            )
+        finally:
+            self._flush_table_results(conn, log_file)
+        self.duration_history.save()
+        if empty_tables:
+            with transaction_scope(conn):
+                self._drop_tables(conn, empty_tables, log_file)
+
+        logger.info(f"Table operations completed: {successful_tables} successful, {failed_tables} failed")
+        if errors:
+            logger.error(f"Pipelined builds failed for {len(errors)} tables")
+            raise errors[0]
+        logger.info(f"All Primary Key/NOT NULL statements executed FOR THE {self.DB_TYPE} DATABASE.")
+
+    def plan_run(self, conn: Any) -> dict[str, Any]:
+        """Estimate the run without copying data (``--plan``).
+
+        The gather script is run into a session temp table, so the real
+        ``TablesToConvert`` and the copy results recorded in it are left
+        alone.  Tables are kept only if ``TableUsedSelects.fConvert`` selects
+        them, as the joins step would.  Source sizes come from
+        ``sys.dm_db_partition_stats`` and the plan is written to ``plan_file``.
+        """
+        logger.info(f"Planning {self.DB_TYPE} import (no data will be copied)")
+        table_name = f"TablesToConvert_{self.DB_TYPE}" if self.DB_TYPE != 'Justice' else 'TablesToConvert'
+        table_name = validate_sql_identifier(table_name)
+        db_name = validate_sql_identifier(self.db_name)
+        plan_table = f"#{table_name}_Plan"
+
+        self.prepare_plan_tables(conn, plan_table)
+        try:
+            with transaction_scope(conn):
+                rows = self._fetch_plan_rows(conn, db_name, plan_table)
+                sizes = self._fetch_source_sizes(conn, rows)
+        finally:
+            execute_sql_with_timeout(
+                conn, f"DROP TABLE IF EXISTS {plan_table}", timeout=self.config["sql_timeout"]
+            )
+
+        plan = build_plan(
+            rows,
+            sizes,
+            self.duration_history,
+            {
+                "table_operations": self.config.get("table_workers", ETLConstants.DEFAULT_TABLE_WORKERS),
+                "pk_creation": self.config.get("pk_workers", ETLConstants.DEFAULT_PK_WORKERS),
+            },
+        )
+        plan["database"] = self.DB_TYPE
+        logger.info(f"{self.DB_TYPE} run plan:\n{format_plan(plan)}")
+        write_plan(plan, self.config["plan_file"])
+        return plan
+
+    def _fetch_plan_rows(self, conn: Any, db_name: str, plan_table: str) -> list[dict[str, Any]]:
+        """Return the tables a run would copy from the gathered ``plan_table``.
+
+        Before the joins CSV has ever been imported there is no
+        ``TableUsedSelects`` table, so every gathered table is planned.
+        """
+        table_used_selects = (
+            f'TableUsedSelects_{self.DB_TYPE}' if self.DB_TYPE != 'Justice' else 'TableUsedSelects'
+        )
+        table_used_selects = validate_sql_identifier(table_used_selects)
+        exists = execute_sql_with_timeout(
+            conn,
+            f"SELECT OBJECT_ID(N'{db_name}.dbo.{table_used_selects}')",
+            timeout=self.config["sql_timeout"],
+        ).fetchone()
+        if exists and exists[0] is not None:
+            query = f"""
+                SELECT S.RowID, S.DatabaseName, S.SchemaName, S.TableName, TUS.fConvert,
+                       TUS.InScopeFreq AS ScopeRowCount, S.[RowCount]
+                FROM {plan_table} S
+                INNER JOIN {db_name}.dbo.{table_used_selects} TUS
+                    ON S.DatabaseName = TUS.DatabaseName
+                    AND S.SchemaName = TUS.SchemaName
+                    AND S.TableName = TUS.TableName
+                WHERE TUS.fConvert=1
+            """
+        else:
+            logger.warning(f"{table_used_selects} not found; planning every gathered table")
+            query = (
+                f"SELECT S.RowID, S.DatabaseName, S.SchemaName, S.TableName, S.fConvert, S.ScopeRowCount, S.[RowCount] "
+                f"FROM {plan_table} S WHERE S.fConvert=1"
+            )
+        cursor = execute_sql_with_timeout(conn, query, timeout=self.config["sql_timeout"])
+        columns = [c[0] for c in cursor.description] if hasattr(cursor, "description") else list(cursor.keys())
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def _fetch_source_sizes(self, conn: Any, rows: list[Any]) -> dict[str, tuple[int, int]]:
+        """Read row counts and used bytes per table from the source databases."""
+        sizes: dict[str, tuple[int, int]] = {}
+        for source_db in sorted({row.get("DatabaseName") or self.DB_TYPE for row in rows}):
+            source_db = validate_sql_identifier(source_db)
+            query = f"""
+                SELECT s.[name] AS SchemaName, t.[name] AS TableName,
+                       SUM(ps.row_count) AS [Rows],
+                       SUM(ps.used_page_count) * 8192 AS [Bytes]
+                FROM {source_db}.sys.dm_db_partition_stats ps
+                    INNER JOIN {source_db}.sys.tables t ON t.object_id = ps.object_id
+                    INNER JOIN {source_db}.sys.schemas s ON s.schema_id = t.schema_id
+                WHERE ps.index_id <= 1
+                GROUP BY s.[name], t.[name]
+            """
+            try:
+                cursor = execute_sql_with_timeout(conn, query, timeout=self.config["sql_timeout"])
+                for schema_name, table, row_count, used_bytes in cursor.fetchall():
+                    key = table_key(
+                        {"DatabaseName": source_db, "SchemaName": schema_name, "TableName": table}
+                    )
+                    sizes[key] = (int(row_count or 0), int(used_bytes or 0))
+            except (SQLAlchemyError, pyodbc.Error) as e:  # pragma: no cover - depends on DB
+                logger.warning(f"Could not read partition stats for {source_db}: {e}")
+        return sizes
+
     def drop_empty_tables(self, conn: Any) -> None:
-        """Drop any tables that ended up with zero rows."""
+        """Drop any tables that ended up with zero rows.
+
+        Nothing is dropped when ``include_empty_tables`` is set.  Tables
+        listed in ``always_include_tables`` are kept; the rest are dropped
+        with batched multi-table ``DROP TABLE`` statements.
+        """
         log_file = self.config['log_file']
+        if self.config.get("include_empty_tables"):
+            logger.info("Keeping empty tables (include_empty_tables is set)")
+            return
         tables_table = (
             f"TablesToConvert_{self.DB_TYPE}" if self.DB_TYPE != 'Justice' else 'TablesToConvert'
         )
@@ -318,45 +908,74 @@ class BaseDBImporter:
             logger.error(f"Failed processing empty table query: {e}")
             return
 
-        # ENHANCED: Support both key names and add logging
+        overrides = self._empty_table_overrides()
+        logger.info(f"Found {len(overrides)} tables in always_include_tables override list: {list(overrides)}")
+
+        tables = []
+        for row in rows:
+            schema_name = validate_sql_identifier(row.get("SchemaName") or row.get("schemaname"))
+            table_name = validate_sql_identifier(row.get("TableName") or row.get("tablename"))
+            if not self._is_protected_empty_table(schema_name, table_name, overrides):
+                tables.append((schema_name, table_name))
+
+        with transaction_scope(conn):
+            self._drop_tables(conn, tables, log_file)
+
+    def _empty_table_overrides(self) -> set[str]:
+        """Return the lower-cased ``always_include_tables`` entries."""
+        # ENHANCED: Support both key names
         always_include_tables = (
             self.config.get("always_include_tables", []) or 
             self.config.get("always-inclusive_tables", [])
         )
-        
-        overrides = {
-            t.strip().lower() for t in always_include_tables
-        }
-        
-        logger.info(f"Found {len(overrides)} tables in always_include_tables override list: {list(overrides)}")
-
-        with transaction_scope(conn):
-            for row in rows:
-                schema_name = validate_sql_identifier(row.get("SchemaName") or row.get("schemaname"))
-                table_name = validate_sql_identifier(row.get("TableName") or row.get("tablename"))
-                
-                # ENHANCED: More comprehensive pattern matching
-                patterns = [
-                    f"{schema_name}.{table_name}".lower(),
-                    f"{self.db_name}.{schema_name}.{table_name}".lower(),
-                    f"{self.DB_TYPE.lower()}.{schema_name}.{table_name}".lower(),
-                    # Add table name only pattern for flexibility
-                    table_name.lower()
-                ]
+        return {t.strip().lower() for t in always_include_tables}
+
+    def _is_protected_empty_table(self, schema_name: str, table_name: str, overrides: set[str]) -> bool:
+        """Return ``True`` if an empty table is kept because of ``always_include_tables``."""
+        # ENHANCED: More comprehensive pattern matching
+        patterns = [
+            f"{schema_name}.{table_name}".lower(),
+            f"{self.db_name}.{schema_name}.{table_name}".lower(),
+            f"{self.DB_TYPE.lower()}.{schema_name}.{table_name}".lower(),
+            # Add table name only pattern for flexibility
+            table_name.lower()
+        ]
+
+        # Check if this table is protected
+        if any(p in overrides for p in patterns):
+            logger.info(f"PROTECTED: Not dropping empty table {schema_name}.{table_name} (found in always_include_tables)")
+            return True
+        return False
 
-                # Check if this table is protected
-                is_protected = any(p in overrides for p in patterns)
-                
-                if is_protected:
-                    logger.info(f"PROTECTED: Not dropping empty table {schema_name}.{table_name} (found in always_include_tables)")
-                    continue
+    def _drop_tables(self, conn: Any, tables: list[tuple[str, str]], log_file: str) -> None:
+        """Drop ``(schema, table)`` pairs with one ``DROP TABLE`` per batch.
 
+        A batch that fails is retried one table at a time so a single bad
+        table is reported without keeping the others.
+        """
+        for start in range(0, len(tables), ETLConstants.DROP_BATCH_SIZE):
+            batch = tables[start:start + ETLConstants.DROP_BATCH_SIZE]
+            for schema_name, table_name in batch:
                 logger.info(f"DROPPING: Empty table {schema_name}.{table_name} (0 rows, not protected)")
-                drop_sql = f"DROP TABLE IF EXISTS {schema_name}.{table_name}"
+            names = ", ".join(f"{schema_name}.{table_name}" for schema_name, table_name in batch)
+            try:
+                sanitize_sql(
+                    conn,
+                    f"DROP TABLE IF EXISTS {names}",
+                    timeout=self.config["sql_timeout"],
+                )
+                continue
+            except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as e:
+                if len(batch) == 1:
+                    logger.error(f"Error dropping table {names}: {e}")
+                    log_exception_to_file(str(e), log_file)
+                    continue
+                logger.warning(f"Batched DROP of {len(batch)} tables failed ({e}); dropping them one at a time")
+            for schema_name, table_name in batch:
                 try:
                     sanitize_sql(
                         conn,
-                        drop_sql,
+                        f"DROP TABLE IF EXISTS {schema_name}.{table_name}",
                         timeout=self.config["sql_timeout"],
                     )
                 except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as e:
@@ -366,8 +985,13 @@ class BaseDBImporter:
                     log_exception_to_file(str(e), log_file)
 
     def _fetch_table_operation_rows(self, conn: Any, db_name: str, table_name: str) -> list[dict[str, Any]]:
-        """Retrieve rows describing table operations to perform."""
-        
+        """Retrieve lightweight headers describing table operations to perform.
+
+        The generated DROP and SELECT INTO text can run to megabytes for a
+        full database, so it is left out here and fetched one table at a time
+        by :meth:`_load_table_statements` when the table is processed.
+        """
+
         # Determine the correct TableUsedSelects table name based on DB_TYPE
         table_used_selects = (
             f'TableUsedSelects_{self.DB_TYPE}' if self.DB_TYPE != 'Justice' else 'TableUsedSelects'
@@ -375,16 +999,14 @@ class BaseDBImporter:
         table_used_selects = validate_sql_identifier(table_used_selects)
         
         query = f"""
-            SELECT S.RowID, S.DatabaseName, S.SchemaName, S.TableName, S.fConvert, S.ScopeRowCount,
-                   CAST(S.Drop_IfExists AS NVARCHAR(MAX)) AS Drop_IfExists,
-                   CAST(CAST(S.Select_Into AS NVARCHAR(MAX)) + CAST(ISNULL(S.Joins, N'') AS NVARCHAR(MAX)) AS NVARCHAR(MAX)) AS [Select_Into]
+            SELECT S.RowID, S.DatabaseName, S.SchemaName, S.TableName, S.fConvert, S.ScopeRowCount, S.[RowCount]
             FROM {db_name}.dbo.{table_name} S
             INNER JOIN {db_name}.dbo.{table_used_selects} TUS 
                 ON S.DatabaseName = TUS.DatabaseName 
                 AND S.SchemaName = TUS.SchemaName 
                 AND S.TableName = TUS.TableName
             WHERE S.fConvert=1
-            ORDER BY S.DatabaseName, S.SchemaName, S.TableName
+            ORDER BY S.[RowCount] DESC, S.DatabaseName, S.SchemaName, S.TableName
         """
 
         cursor = execute_sql_with_timeout(
@@ -423,6 +1045,28 @@ class BaseDBImporter:
                 logger.error(f"Failed to process query results: {e}")
                 return []
 
+    def _load_table_statements(self, conn: Any, row_id: int) -> dict[str, str]:
+        """Fetch the DROP and SELECT INTO text for a single work item."""
+        table_name = (
+            f"TablesToConvert_{self.DB_TYPE}" if self.DB_TYPE != "Justice" else "TablesToConvert"
+        )
+        table_name = validate_sql_identifier(table_name)
+        db_name = validate_sql_identifier(self.db_name)
+
+        query = f"""
+            SELECT CAST(S.Drop_IfExists AS NVARCHAR(MAX)) AS Drop_IfExists,
+                   CAST(CAST(S.Select_Into AS NVARCHAR(MAX)) + CAST(ISNULL(S.Joins, N'') AS NVARCHAR(MAX)) AS NVARCHAR(MAX)) AS [Select_Into]
+            FROM {db_name}.dbo.{table_name} S
+            WHERE S.RowID = {int(row_id)}
+        """
+        row = execute_sql_with_timeout(
+            conn, query, timeout=self.config["sql_timeout"]
+        ).fetchone()
+        if row is None:
+            logger.warning(f"No statements found for RowID {row_id} in {table_name}")
+            return {"Drop_IfExists": "", "Select_Into": ""}
+        return {"Drop_IfExists": row[0] or "", "Select_Into": row[1] or ""}
+
     def _should_process_table(
         self, scope_row_count: Any, schema_name: str | None = None,
         table_name: str | None = None
@@ -468,15 +1112,27 @@ class BaseDBImporter:
         # Table has rows, include it
         return True
 
-    def _validate_table_copy(
+    def _record_table_result(
         self,
-        conn: Any,
-        row_id: int,
-        actual_rows: int,
-        log_file: str,
+        row_id: Optional[int],
+        actual_rows: Optional[int],
+        seconds: float,
+        status: str = STATUS_DONE,
     ) -> None:
-        """Update metadata table with the actual row count."""
-        if row_id is None or actual_rows is None:
+        """Buffer a table's outcome for the next metadata flush."""
+        if row_id is None:
+            return
+        self.table_results.add(row_id, actual_rows, seconds, status)
+
+    def _flush_table_results(self, conn: Any, log_file: str) -> None:
+        """Write buffered table results back with set-based UPDATEs.
+
+        The flush commits so results survive a crash of the remaining run.  On
+        failure the results are kept in the buffer and retried by the next
+        flush.
+        """
+        results = self.table_results.take()
+        if not results:
             return
 
         tables_table = (
@@ -485,23 +1141,273 @@ class BaseDBImporter:
         tables_table = validate_sql_identifier(tables_table)
         db_name = validate_sql_identifier(self.db_name)
 
-        # Use named parameters with SQLAlchemy text() syntax
-        update_sql = (
-            f"UPDATE {db_name}.dbo.{tables_table} SET ScopeRowCount = :actual_rows WHERE RowID = :row_id"
+        try:
+            for update_sql in build_update_statements(f"{db_name}.dbo.{tables_table}", results):
+                sanitize_sql(conn, update_sql, timeout=self.config["sql_timeout"])
+            conn.commit()
+            logger.debug(f"Flushed {len(results)} table results to {tables_table}")
+        except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as exc:
+            self.table_results.restore(results)
+            msg = f"Failed to write {len(results)} table results to {tables_table}: {exc}"
+            logger.error(msg)
+            log_exception_to_file(msg, log_file)
+            try:
+                conn.rollback()
+            except (SQLAlchemyError, pyodbc.Error):  # pragma: no cover - depends on DB
+                pass
+
+    def _build_count_sql(self, select_into_sql: str, full_table_name: str) -> str:
+        """Rewrite a SELECT INTO statement into a COUNT query over its source."""
+        parsed = parse_select_into(select_into_sql)
+        if parsed is None:
+            # We don't attempt to count rows directly from the table as it may not exist yet
+            logger.debug(f"Skipping row count validation for {full_table_name} (no SELECT INTO pattern found)")
+            return ""
+
+        if parsed.distinct:
+            # For DISTINCT queries, use the first column with COUNT(DISTINCT )
+            first_column = parsed.column_expressions[0]
+            return f"SELECT COUNT(DISTINCT {first_column}) {parsed.from_clause}"
+
+        return f"SELECT COUNT(*) {parsed.from_clause}"
+
+    def _count_source_rows(
+        self, conn: Any, select_into_sql: str, full_table_name: str
+    ) -> Optional[int]:
+        """Count the rows a SELECT INTO is expected to copy.
+
+        This reads the whole source a second time, so it only runs when extra
+        validation is enabled.
+        """
+        try:
+            count_sql = self._build_count_sql(select_into_sql, full_table_name)
+        except Exception as ex:
+            logger.warning(f"Error processing SELECT statement for {full_table_name}: {ex}")
+            return None
+        if not count_sql:
+            return None
+
+        try:
+            logger.debug(f"Executing count validation: {count_sql}")
+            count_result = execute_sql_with_timeout(
+                conn, count_sql, timeout=self.config["sql_timeout"]
+            )
+            actual_count = count_result.fetchone()[0]
+            logger.debug(f"Validated row count for {full_table_name}: {actual_count}")
+            return actual_count
+        except (SQLAlchemyError, pyodbc.Error) as count_error:
+            logger.warning(f"Count query failed for {full_table_name}: {count_error}")
+            return None
+
+    def _select_into_with_rowcount(self, conn: Any, select_into_sql: str) -> Optional[int]:
+        """Run a SELECT INTO and return the number of rows it inserted.
+
+        The count comes from ``ROWCOUNT_BIG()`` in the same batch, so neither
+        the source nor the new table has to be scanned again.  Returns ``None``
+        if the driver did not hand back the result set.
+        """
+        batch = "\n".join([
+            "DECLARE @rows BIGINT",
+            "SET NOCOUNT ON",
+            select_into_sql.strip().rstrip(";"),
+            "SET @rows = ROWCOUNT_BIG()",
+            "SET NOCOUNT OFF",
+            "SELECT @rows AS InsertedRows",
+        ])
+        result = sanitize_sql(conn, batch, timeout=self.config["sql_timeout"])
+        try:
+            row = result.fetchone() if result is not None else None
+        except (SQLAlchemyError, pyodbc.Error):
+            row = None
+        return int(row[0]) if row and row[0] is not None else None
+
+    def _is_large_table(self, row_dict: Any) -> bool:
+        """Return ``True`` when a table should be copied in key-range slices."""
+        threshold = int(self.config.get("large_table_row_threshold") or 0)
+        row_count = row_dict.get("RowCount")
+        return threshold > 0 and row_count is not None and int(row_count) >= threshold
+
+    def _find_slice_key(self, conn: Any, row_dict: Any) -> Optional[str]:
+        """Return the leading integer column of the source PK or clustered index."""
+        source_db = validate_sql_identifier(row_dict.get("DatabaseName") or self.DB_TYPE)
+        schema_name = validate_sql_identifier(row_dict.get("SchemaName"))
+        table_name = validate_sql_identifier(row_dict.get("TableName"))
+        query = f"""
+            SELECT TOP (1) c.[name]
+            FROM {source_db}.sys.indexes i
+                INNER JOIN {source_db}.sys.index_columns ic
+                    ON ic.object_id = i.object_id AND ic.index_id = i.index_id AND ic.key_ordinal = 1
+                INNER JOIN {source_db}.sys.columns c
+                    ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+                INNER JOIN {source_db}.sys.types ty ON ty.user_type_id = c.user_type_id
+            WHERE i.object_id = OBJECT_ID(N'{source_db}.[{schema_name}].[{table_name}]')
+                AND (i.is_primary_key = 1 OR i.index_id = 1)
+                AND c.is_nullable = 0
+                AND ty.[name] IN ('tinyint', 'smallint', 'int', 'bigint')
+            ORDER BY i.is_primary_key DESC, i.index_id
+        """
+        row = execute_sql_with_timeout(
+            conn, query, timeout=self.config["sql_timeout"]
+        ).fetchone()
+        return validate_sql_identifier(row[0]) if row else None
+
+    def _target_columns(self, conn: Any, target: str) -> tuple[bool, list[str]]:
+        """Return whether ``target`` exists and, if it has an identity, its columns."""
+        db_name = validate_sql_identifier(self.db_name)
+        object_name = target.replace("'", "''")
+        cursor = execute_sql_with_timeout(
+            conn,
+            f"SELECT c.[name], c.is_identity FROM {db_name}.sys.columns c "
+            f"WHERE c.object_id = OBJECT_ID(N'{object_name}') ORDER BY c.column_id",
+            timeout=self.config["sql_timeout"],
         )
+        rows = cursor.fetchall()
+        has_identity = any(row[1] for row in rows)
+        return bool(rows), [row[0] for row in rows] if has_identity else []
 
+    def _run_slice(self, conn: Any, slice_sql: str) -> int:
+        """Load one slice in its own transaction and return the rows inserted."""
+        result = sanitize_sql(conn, slice_sql, timeout=self.config["sql_timeout"])
         try:
-            # Pass parameters as a dictionary for named parameters
+            row = result.fetchone() if result is not None else None
+        except (SQLAlchemyError, pyodbc.Error):
+            row = None
+        conn.commit()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    def _copy_large_table(
+        self,
+        conn: Any,
+        row_dict: Any,
+        drop_sql: str,
+        select_into_sql: str,
+        idx: int,
+    ) -> Optional[int]:
+        """Copy a large table in checkpointed key-range slices.
+
+        The empty target is created from the SELECT INTO, then each slice is
+        filled by its own ``INSERT ... SELECT`` and recorded in the progress
+        file.  If the run is interrupted, a rerun with the target still
+        present continues with the slices that have not finished, so a
+        retry or a resumed run after a failed slice does not reload the
+        others.  The checkpoint is removed once the copy succeeds.  Returns
+        the number of rows copied, or ``None`` if the table has no usable
+        integer key and must be copied with a single SELECT INTO.
+        """
+        parts = split_select_into(select_into_sql)
+        full_table_name = f"{row_dict.get('SchemaName')}.{row_dict.get('TableName')}"
+        if parts is None:
+            logger.info(f"Copying {full_table_name} in one statement (unparseable SELECT INTO)")
+            return None
+        key_column = self._find_slice_key(conn, row_dict)
+        if not key_column:
+            logger.info(f"Copying {full_table_name} in one statement (no integer key to slice on)")
+            return None
+        select_part, target, from_clause = parts
+
+        state_key = f"large_table:{table_key(row_dict)}"
+        state = self.progress.get_state(state_key)
+        exists, identity_columns = self._target_columns(conn, target)
+        if not (state and state.get("key") == key_column and exists):
+            low, high = execute_sql_with_timeout(
+                conn,
+                build_key_range_sql(from_clause, key_column),
+                timeout=self.config["sql_timeout"],
+            ).fetchone()
+            slices = []
+            if low is not None:
+                slices = plan_slices(
+                    int(low),
+                    int(high),
+                    int(row_dict.get("RowCount") or 0),
+                    int(self.config.get("large_table_slice_rows") or ETLConstants.DEFAULT_LARGE_TABLE_SLICE_ROWS),
+                )
+            sanitize_sql(conn, drop_sql, timeout=self.config["sql_timeout"])
             sanitize_sql(
                 conn,
-                update_sql,
-                params={'actual_rows': actual_rows, 'row_id': row_id},
+                build_create_sql(select_part, target, from_clause),
                 timeout=self.config["sql_timeout"],
             )
-        except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as exc:
-            msg = f"Failed to update row count for RowID {row_id}: {exc}"
-            logger.error(msg)
-            log_exception_to_file(msg, log_file)
+            conn.commit()
+            _, identity_columns = self._target_columns(conn, target)
+            state = {"key": key_column, "slices": [list(s) for s in slices], "done": {}}
+            self.progress.set_state(state_key, state)
+
+        pending = [
+            (n, tuple(bounds))
+            for n, bounds in enumerate(state["slices"])
+            if str(n) not in state["done"]
+        ]
+        logger.info(
+            f"RowID:{idx} Sliced copy of {full_table_name} on [{key_column}]: "
+            f"{len(pending)} of {len(state['slices'])} slices to load"
+        )
+
+        workers = max(1, int(self.config.get("large_table_slice_workers") or 1))
+
+        def slice_sql(bounds: tuple[int, int]) -> str:
+            return build_slice_sql(
+                select_part,
+                target,
+                from_clause,
+                key_column,
+                bounds[0],
+                bounds[1],
+                columns=identity_columns,
+                tablock=workers == 1,
+            )
+
+        def checkpoint(n: int, rows: int) -> None:
+            state["done"][str(n)] = rows
+            self.progress.set_state(state_key, state)
+
+        if workers == 1:
+            for n, bounds in safe_tqdm(pending, desc=full_table_name, unit="slice"):
+                checkpoint(n, self._run_slice(conn, slice_sql(bounds)))
+        else:
+            def load_slice(work: tuple[int, tuple[int, int]]) -> int:
+                with get_target_connection() as slice_conn:
+                    return self._run_slice(slice_conn, slice_sql(work[1]))
+
+            errors: list[BaseException] = []
+
+            def record(outcome: TaskOutcome) -> None:
+                if outcome.ok:
+                    checkpoint(outcome.item[0], outcome.result)
+                else:
+                    errors.append(outcome.error)
+
+            run_parallel(
+                pending, load_slice, workers, desc=full_table_name, unit="slice", on_complete=record
+            )
+            if errors:
+                raise errors[0]
+
+        copied = sum(int(rows) for rows in state["done"].values())
+        self.progress.clear_state(state_key)
+        return copied
+
+    def _count_target_rows(
+        self, conn: Any, db_name: str, schema_name: str, table_name: str
+    ) -> int:
+        """Count the rows in a copied table."""
+        full_table_name = f"{schema_name}.{table_name}"
+        if self.DB_TYPE == "Operations":
+            fully_qualified_table_name = f"{db_name}.{schema_name}.Operations_{table_name}"
+        elif self.DB_TYPE == "Financial":
+            fully_qualified_table_name = f"{db_name}.{schema_name}.Financial_{table_name}"
+        elif self.DB_TYPE == "base":
+            # Base tests use schema.table only
+            fully_qualified_table_name = full_table_name
+        else:
+            fully_qualified_table_name = f"{db_name}.{full_table_name}"
+
+        count_cur = execute_sql_with_timeout(
+            conn,
+            f"SELECT COUNT(*) FROM {fully_qualified_table_name}",
+            timeout=self.config["sql_timeout"],
+        )
+        return count_cur.fetchone()[0]
 
     def _process_table_operation_row(
         self, conn: Any, row_dict: dict[str, Any], idx: int, log_file: str
@@ -515,96 +1421,36 @@ class BaseDBImporter:
             logger.info(f"RowID:{idx} Skipping table ({self.DB_TYPE}.{full_table_name}) - fConvert={fconvert}")
             return True  # Return True to indicate successful processing (skip)
     
+        started = time.perf_counter()
+        row_id = row_dict.get("RowID")
+        if "Drop_IfExists" not in row_dict and row_id is not None:
+            # Work items arrive as headers; load this table's SQL text on demand
+            row_dict = {**dict(row_dict), **self._load_table_statements(conn, row_id)}
         drop_sql = row_dict.get("Drop_IfExists", "")
         select_into_sql = row_dict.get("Select_Into", "")
-        row_id = row_dict.get("RowID")
 
         table_name = validate_sql_identifier(row_dict.get("TableName"))
         schema_name = validate_sql_identifier(row_dict.get("SchemaName"))
         db_name = validate_sql_identifier(self.db_name)  # Ensure we have the database name
         scope_row_count = row_dict.get("ScopeRowCount")
-
-        # Create both versions of the table name - with and without database prefix
         full_table_name = f"{schema_name}.{table_name}"
-        fully_qualified_name = f"{db_name}.{full_table_name}"
 
-        # Only check row count if fConvert is 1
-        if fconvert == 1 and select_into_sql:
-            try:
-                # Check if we have a SELECT INTO statement to work with
-                if " INTO " in select_into_sql.upper():
-                    # Find the position of " INTO " with proper parenthesis handling
-                    paren_count = 0
-                    into_pos = -1
-                    
-                    for i in range(len(select_into_sql)):
-                        if select_into_sql[i:i+1] == "(":
-                            paren_count += 1
-                        elif select_into_sql[i:i+1] == ")":
-                            paren_count -= 1
-                        elif select_into_sql[i:i+6].upper() == " INTO " and paren_count == 0:
-                            into_pos = i
-                            break
-                    
-                    if into_pos > -1:
-                        # Get the SELECT part of the query (before INTO)
-                        select_part = select_into_sql[:into_pos].strip()
-                        
-                        # Transform the SELECT to COUNT as requested
-                        count_sql = ""
-                        if select_part.upper().startswith("SELECT DISTINCT"):
-                            # For DISTINCT queries, find the first column to use with COUNT(DISTINCT)
-                            columns_part = select_part[len("SELECT DISTINCT"):].strip()
-                            from_pos = columns_part.upper().find(" FROM ")
-                            
-                            if from_pos > -1:
-                                # Extract first column for COUNT(DISTINCT )
-                                first_column = columns_part[:from_pos].split(",")[0].strip()
-                                from_clause = columns_part[from_pos:].strip()
-                                count_sql = f"SELECT COUNT(DISTINCT {first_column}) {from_clause}"
-                            else:
-                                # Skip count if we can't parse properly
-                                logger.debug(f"Skipping count validation for {full_table_name} (can't parse DISTINCT query)")
-                        else:
-                            # For non-DISTINCT queries
-                            if select_part.upper().startswith("SELECT"):
-                                # Replace first SELECT with COUNT(*)
-                                select_clause = select_part[len("SELECT"):].strip()
-                                from_pos = select_clause.upper().find(" FROM ")
-                                
-                                if from_pos > -1:
-                                    from_clause = select_clause[from_pos:].strip()
-                                    count_sql = f"SELECT COUNT(*) {from_clause}"
-                                else:
-                                    # Skip count if we can't parse FROM clause
-                                    logger.debug(f"Skipping count validation for {full_table_name} (can't parse FROM clause)")
-                            else:
-                                # Skip for unparseable queries
-                                logger.debug(f"Skipping count validation for {full_table_name} (unparseable query)")
-                        
-                        # Execute the count query if we were able to build one
-                        if count_sql:
-                            try:
-                                logger.debug(f"Executing count validation: {count_sql}")
-                                count_result = execute_sql_with_timeout(
-                                    conn, count_sql, timeout=self.config["sql_timeout"]
-                                )
-                                actual_count = count_result.fetchone()[0]
-                                
-                                # Use the actual count instead of the static ScopeRowCount
-                                scope_row_count = actual_count
-                                logger.debug(f"Validated row count for {full_table_name}: {actual_count}")
-                            except (SQLAlchemyError, pyodbc.Error) as count_error:
-                                logger.warning(
-                                    f"Count query failed for {full_table_name}, using original ScopeRowCount ({scope_row_count}): {count_error}"
-                                )
-                        
-                else:
-                    # We don't attempt to count rows directly from the table as it may not exist yet
-                    logger.debug(f"Skipping row count validation for {full_table_name} (no SELECT INTO pattern found)")
-
-            except Exception as ex:
-                logger.warning(f"Error processing SELECT statement for {full_table_name}: {ex}")
+        # The pre-copy source count doubles the reads of the copy phase, so it
+        # is only taken when extra validation was requested.
+        expected_count = None
+        if self.extra_validation and select_into_sql:
+            expected_count = self._count_source_rows(conn, select_into_sql, full_table_name)
+            if expected_count is not None:
+                if self._skip_empty_copy(row_dict, expected_count, idx, started):
+                    return True
+                scope_row_count = expected_count
+        elif (
+            select_into_sql.strip()
+            and self._can_skip_empty_copy(row_dict, scope_row_count)
+            and self._source_is_empty(conn, select_into_sql, full_table_name)
+        ):
+            self._record_skipped_copy(row_dict, idx, started)
+            return True
 
         if not drop_sql.strip():
             return True
@@ -613,59 +1459,45 @@ class BaseDBImporter:
             f"RowID:{idx} Drop If Exists:({self.DB_TYPE}.{full_table_name})"
         )
         try:
-            sanitize_sql(
-                conn,
-                drop_sql,
-                timeout=self.config["sql_timeout"],
-            )
-
-            if select_into_sql.strip():
-                logger.info(
-                    f"RowID:{idx} Select INTO:({self.DB_TYPE}.{full_table_name})"
+            inserted_count = None
+            if select_into_sql.strip() and self._is_large_table(row_dict):
+                # Sliced copies drop the target themselves so that a rerun
+                # can resume from the last finished slice.
+                inserted_count = self._copy_large_table(
+                    conn, row_dict, drop_sql, select_into_sql, idx
                 )
+
+            if inserted_count is None:
                 sanitize_sql(
                     conn,
-                    select_into_sql,
+                    drop_sql,
                     timeout=self.config["sql_timeout"],
                 )
 
-                # Determine inserted row count and update metadata table
-                # FIXED: Use the fully qualified name instead of just schema.table
-                fully_qualified_name = f"{db_name}.{full_table_name}"
-
-                # Add this block to handle prefixed table names
-                if self.DB_TYPE == "Operations":
-                    actual_table_name = f"Operations_{table_name}"
-                    fully_qualified_table_name = f"{db_name}.{schema_name}.{actual_table_name}"
-                elif self.DB_TYPE == "Financial":
-                    actual_table_name = f"Financial_{table_name}"
-                    fully_qualified_table_name = f"{db_name}.{schema_name}.{actual_table_name}"
-                else:
-                    # For Justice DB (and base tests), use schema.table only
-                    if self.DB_TYPE == "base":
-                        fully_qualified_table_name = full_table_name
-                    else:
-                        fully_qualified_table_name = fully_qualified_name
-
-                count_cur = execute_sql_with_timeout(
-                    conn,
-                    f"SELECT COUNT(*) FROM {fully_qualified_table_name}",
-                    timeout=self.config["sql_timeout"],
-                )
-                inserted_count = count_cur.fetchone()[0]
+                if select_into_sql.strip():
+                    logger.info(
+                        f"RowID:{idx} Select INTO:({self.DB_TYPE}.{full_table_name})"
+                    )
+                    inserted_count = self._select_into_with_rowcount(conn, select_into_sql)
+                    if inserted_count is None:
+                        inserted_count = self._count_target_rows(conn, db_name, schema_name, table_name)
+
+            if inserted_count is not None:
+                if expected_count is not None and expected_count != inserted_count:
+                    logger.warning(
+                        f"Row count mismatch for {full_table_name}: expected {expected_count}, inserted {inserted_count}"
+                    )
                 scope_row_count = inserted_count
 
             conn.commit()
-            self._validate_table_copy(
-                conn,
-                row_id,
-                scope_row_count,
-                log_file,
-            )
+            self._record_table_result(row_id, scope_row_count, time.perf_counter() - started)
             return True
 
         except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as sql_error:
             conn.rollback()
+            self._record_table_result(
+                row_id, None, time.perf_counter() - started, STATUS_FAILED
+            )
             error_msg = (
                 f"SQL execution error for row {idx} ({full_table_name}): {str(sql_error)}"
             )
@@ -673,6 +1505,57 @@ class BaseDBImporter:
             log_exception_to_file(error_msg, log_file)
             raise
 
+    def _can_skip_empty_copy(self, row_dict: Any, row_count: Any) -> bool:
+        """Return ``True`` if a table with ``row_count`` rows may go uncopied.
+
+        Only a count of zero qualifies, and only when neither
+        ``include_empty_tables`` nor ``always_include_tables`` keeps the table.
+        """
+        if row_count is None or int(row_count) > 0:
+            return False
+        schema_name = validate_sql_identifier(row_dict.get("SchemaName"))
+        table_name = validate_sql_identifier(row_dict.get("TableName"))
+        if self._should_process_table(row_count, schema_name, table_name):
+            return False
+        return not self._is_protected_empty_table(schema_name, table_name, self._empty_table_overrides())
+
+    def _record_skipped_copy(self, row_dict: Any, idx: int, started: float) -> None:
+        schema_name = validate_sql_identifier(row_dict.get("SchemaName"))
+        table_name = validate_sql_identifier(row_dict.get("TableName"))
+        logger.info(f"RowID:{idx} Skipping copy of empty table ({self.DB_TYPE}.{schema_name}.{table_name})")
+        self._record_table_result(row_dict.get("RowID"), 0, time.perf_counter() - started)
+
+    def _skip_empty_copy(self, row_dict: Any, row_count: Any, idx: int, started: float) -> bool:
+        """Return ``True`` and record the table as empty if its copy can be skipped.
+
+        Any stale copy from an earlier run is removed by
+        :meth:`drop_empty_tables`, since its recorded row count is 0.
+        """
+        if not self._can_skip_empty_copy(row_dict, row_count):
+            return False
+        self._record_skipped_copy(row_dict, idx, started)
+        return True
+
+    def _source_is_empty(self, conn: Any, select_into_sql: str, full_table_name: str) -> bool:
+        """Return ``True`` only if the FROM clause of the copy yields no row.
+
+        ``ScopeRowCount`` comes from the joins spreadsheet and can be stale,
+        so a table it reports as empty is probed with ``SELECT TOP (1)``,
+        which stops at the first row.  Statements that cannot be parsed and
+        failed probes count as not empty, so the table is copied.
+        """
+        parts = split_select_into(select_into_sql)
+        if parts is None:
+            return False
+        try:
+            probe = execute_sql_with_timeout(
+                conn, f"SELECT TOP (1) 1 {parts[2]}", timeout=self.config["sql_timeout"]
+            )
+            return probe.fetchone() is None
+        except (SQLAlchemyError, pyodbc.Error) as probe_error:
+            logger.warning(f"Empty-source probe failed for {full_table_name}: {probe_error}")
+            return False
+
     def create_primary_keys(self, conn: Any) -> None:
         """Create primary keys and NOT NULL constraints."""
         if self.config['skip_pk_creation']:
@@ -680,6 +1563,36 @@ class BaseDBImporter:
             return
 
         log_file = self.config['log_file']
+        groups = self._pk_table_groups(conn, log_file)
+        workers = self.config.get("pk_workers", ETLConstants.DEFAULT_PK_WORKERS)
+        pending = [
+            (first, group)
+            for first, group in groups
+            if not self.checkpoints.is_done("pk_creation", group[-1].get("RowID"), table_key(group[-1]))
+        ]
+        if len(pending) < len(groups):
+            logger.info(f"Skipped PK creation for {len(groups) - len(pending)} tables completed in an earlier run")
+
+        def finished(group: list[dict[str, Any]], result: tuple[float, Optional[ConstraintBatch]]) -> None:
+            self._record_pk_table(group, result, len(groups))
+
+        if workers > 1:
+            self._create_primary_keys_parallel(pending, workers, log_file, finished)
+        else:
+            with transaction_scope(conn):
+                for first, group in safe_tqdm(pending, desc="PK Creation", unit="table"):
+                    finished(group, self._create_table_constraints(conn, group, first, log_file))
+
+        self.duration_history.save()
+        logger.info(f"All Primary Key/NOT NULL statements executed FOR THE {self.DB_TYPE} DATABASE.")
+
+    def _pk_table_groups(self, conn: Any, log_file: str) -> list[tuple[int, list[dict[str, Any]]]]:
+        """Generate the PK scripts and return them grouped per table, longest first.
+
+        Each group is ``(first_idx, rows)`` with the table's NOT NULL rows
+        before its PK row.  The scripts are built from the source metadata,
+        so this does not depend on the tables having been copied.
+        """
         pk_table = (
             f"PrimaryKeyScripts_{self.DB_TYPE}" if self.DB_TYPE != 'Justice' else "PrimaryKeyScripts"
         )
@@ -722,15 +1635,104 @@ class BaseDBImporter:
         db_name = validate_sql_identifier(self.db_name)
         with transaction_scope(conn):
             rows = self._fetch_pk_rows(conn, db_name, pk_table, tables_table)
+        rows = order_table_groups_longest_first(rows, "pk_creation", self.duration_history)
+
+        # Each table's NOT NULL statements run before its PK on one
+        # connection; different tables are independent of each other.
+        groups = []
+        first = 1
+        for _, group in groupby(rows, key=table_key):
+            group = list(group)
+            groups.append((first, group))
+            first += len(group)
+        return groups
+
+    def _record_pk_table(
+        self, group: list[dict[str, Any]], result: tuple[float, Optional[ConstraintBatch]], total: int
+    ) -> None:
+        """Checkpoint a finished table and add it to the progress and run report."""
+        seconds, batch = result
+        key = table_key(group[-1])
+        # The group's rows share one table; resume checks its last row.
+        # Unlike a copy, a PK cannot be added twice (error 1779), so this
+        # mark is written straight away instead of waiting for the batch.
+        self.checkpoints.complete("pk_creation", group[-1].get("RowID"), key)
+        self.checkpoints.flush()
+        self.progress.update("pk_creation", self.checkpoints.count("pk_creation"), total=total)
+        self.report.add_table(
+            "pk_creation",
+            key,
+            seconds,
+            previous_seconds=self.duration_history.get("pk_creation", key),
+            statements=batch.statements if batch else 0,
+            statements_run=batch.statements_run if batch else 0,
+            not_null_skipped=batch.skipped_not_null if batch else 0,
+        )
+        self.duration_history.record("pk_creation", key, seconds, rows=group[-1].get("RowCount"))
+
+    def _create_table_constraints(
+        self, conn: Optional[Any], group: list[dict[str, Any]], first_idx: int, log_file: str
+    ) -> tuple[float, Optional[ConstraintBatch]]:
+        """Build one table's NOT NULL and PK constraints in a single batch.
+
+        With ``conn`` set every attempt runs on it, so only deadlocks and
+        lock timeouts are retried; with ``None`` each attempt opens its own
+        pooled connection and dropped connections are retried as well.
+        Returns the seconds taken and the batch that ran (``None`` if the
+        table was filtered out).  The caller checkpoints the table's rows.
+        """
+        key = table_key(group[-1])
+        self.checkpoints.start("pk_creation", group[-1].get("RowID"), key)
+        started = time.perf_counter()
 
-            start_idx = self.progress.get("pk_creation")
-            for idx, row in enumerate(safe_tqdm(rows, desc="PK Creation", unit="table"), 1):
-                if idx <= start_idx:
-                    continue
-                self._process_pk_row(conn, row, idx, log_file)
-                self.progress.update("pk_creation", idx)
+        def attempt() -> Optional[ConstraintBatch]:
+            if conn is not None:
+                return self._process_pk_group(conn, group, first_idx, log_file)
+            with get_target_connection() as worker_conn:
+                return self._process_pk_group(worker_conn, group, first_idx, log_file)
 
-        logger.info(f"All Primary Key/NOT NULL statements executed FOR THE {self.DB_TYPE} DATABASE.")
+        try:
+            batch = self.retry_policy.run(
+                attempt,
+                f"PK creation {self.DB_TYPE}.{group[-1].get('SchemaName')}.{group[-1].get('TableName')}",
+                retryable=is_lock_error if conn is not None else is_transient,
+            )
+        except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as e:
+            self.checkpoints.fail("pk_creation", group[-1].get("RowID"), key, error=e)
+            raise
+        return time.perf_counter() - started, batch
+
+    def _create_primary_keys_parallel(
+        self,
+        pending: list[tuple[int, list[dict[str, Any]]]],
+        workers: int,
+        log_file: str,
+        finished: Any,
+    ) -> None:
+        """Build the constraints of independent tables on a pool of connections.
+
+        Like the parallel copy, failures are captured per table so the other
+        tables still finish, and the first error is re-raised afterwards.
+        """
+        errors: list[BaseException] = []
+
+        def build(work: tuple[int, list[dict[str, Any]]]) -> tuple[float, Optional[ConstraintBatch]]:
+            first_idx, group = work
+            return self._create_table_constraints(None, group, first_idx, log_file)
+
+        def record(outcome: TaskOutcome) -> None:
+            _, group = outcome.item
+            if outcome.ok:
+                finished(group, outcome.result)
+            else:
+                table = f"{group[-1].get('SchemaName')}.{group[-1].get('TableName')}"
+                logger.error(f"PK creation failed for {table}: {outcome.error}")
+                errors.append(outcome.error)
+
+        run_parallel(pending, build, workers, desc="PK Creation", unit="table", on_complete=record)
+        if errors:
+            logger.error(f"PK creation failed for {len(errors)} tables")
+            raise errors[0]
 
     def _fetch_pk_rows(self, conn: Any, db_name: str, pk_table: str, tables_table: str) -> list[dict[str, Any]]:
         # Verify the tables exist before running the main query
@@ -758,7 +1760,7 @@ class BaseDBImporter:
                 FROM {db_name}.dbo.{pk_table} S
                 WHERE S.ScriptType='PK'
             )
-            SELECT S.TYPEY, TTC.ScopeRowCount, S.DatabaseName, S.SchemaName, S.TableName,
+            SELECT S.TYPEY, TTC.RowID, TTC.ScopeRowCount, TTC.[RowCount], S.DatabaseName, S.SchemaName, S.TableName,
                    REPLACE(S.Script, 'FLAG NOT NULL', 'BIT NOT NULL') AS [Script], TTC.fConvert
             FROM CTE_PKS S
             INNER JOIN {db_name}.dbo.{tables_table} TTC WITH (NOLOCK)
@@ -795,30 +1797,68 @@ class BaseDBImporter:
             logger.error(f"Error processing PK query results: {e}")
             return []
 
-    def _process_pk_row(self, conn: Any, row_dict: dict[str, Any], idx: int, log_file: str) -> None:
-        createpk_sql = row_dict.get('Script')
-        scope_row_count = row_dict.get('ScopeRowCount')
-        schema_name = validate_sql_identifier(row_dict.get('SchemaName'))
-        table_name = validate_sql_identifier(row_dict.get('TableName'))
+    def _nullable_columns(self, conn: Any, schema_name: str, table_name: str) -> Optional[set[str]]:
+        """Return the lower-cased nullable columns of a target table, or ``None`` if unknown."""
+        db_name = validate_sql_identifier(self.db_name)
+        try:
+            cursor = execute_sql_with_timeout(
+                conn,
+                f"SELECT c.[name] FROM {db_name}.sys.columns c "
+                f"WHERE c.object_id = OBJECT_ID(N'{db_name}.{schema_name}.{table_name}') AND c.is_nullable = 1",
+                timeout=self.config["sql_timeout"],
+            )
+            return {str(row[0]).lower() for row in cursor.fetchall()}
+        except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as e:
+            logger.warning(f"Could not read column nullability of {schema_name}.{table_name}: {e}")
+            return None
+
+    def _process_pk_group(
+        self, conn: Any, group: list[dict[str, Any]], idx: int, log_file: str
+    ) -> Optional[ConstraintBatch]:
+        """Run a table's NOT NULL alters and PK as one batch.
+
+        Alters for columns that are already NOT NULL on the target are left
+        out; see :mod:`etl.pk_builder`.
+        """
+        scope_row_count = group[0].get('ScopeRowCount')
+        schema_name = validate_sql_identifier(group[0].get('SchemaName'))
+        table_name = validate_sql_identifier(group[0].get('TableName'))
         full_table_name = f"{schema_name}.{table_name}"
 
         logger.info(f"RowID:{idx} PK Creation:({self.DB_TYPE}.{full_table_name})")
-        if self._should_process_table(scope_row_count, schema_name, table_name):
-            try:
+        if not self._should_process_table(scope_row_count, schema_name, table_name):
+            return None
+        index_options = resolve_index_options(
+            self.config.get('pk_index_options', {}),
+            self.config.get('pk_index_options_by_table', {}),
+            schema_name,
+            table_name,
+        )
+        batch = build_constraint_batch(
+            group, self._nullable_columns(conn, schema_name, table_name), index_options
+        )
+        if batch.skipped_not_null:
+            logger.info(
+                f"Skipped {batch.skipped_not_null} of {batch.statements} NOT NULL/PK statements "
+                f"already satisfied on {self.DB_TYPE}.{full_table_name}"
+            )
+        try:
+            if batch.sql:
                 sanitize_sql(
                     conn,
-                    createpk_sql,
+                    batch.sql,
                     timeout=self.config['sql_timeout'],
                 )
-                conn.commit()
-            except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as e:
-                conn.rollback()
-                error_msg = (
-                    f"Error executing PK statements for row {idx} ({self.DB_TYPE}.{full_table_name}): {e}"
-                )
-                logger.error(error_msg)
-                log_exception_to_file(error_msg, log_file)
-                raise
+            conn.commit()
+        except (SQLExecutionError, SQLAlchemyError, pyodbc.Error) as e:
+            conn.rollback()
+            error_msg = (
+                f"Error executing PK statements for row {idx} ({self.DB_TYPE}.{full_table_name}): {e}"
+            )
+            logger.error(error_msg)
+            log_exception_to_file(error_msg, log_file)
+            raise
+        return batch
 
     def show_completion_message(self, next_step_name: Optional[str] = None) -> bool:
         """Show a message box indicating completion and asking to continue."""
@@ -841,6 +1881,8 @@ class BaseDBImporter:
 
     def run(self) -> bool:
         """Template method - main execution flow."""
+        joins_import = None
+        joins_joined = False
         try:
             # Parse command line args and load config
             args = self.parse_args()
@@ -850,9 +1892,12 @@ class BaseDBImporter:
             self.validate_environment()
             self.load_config(args)
 
+            plan_only = getattr(args, "plan", False)
+
             # Always delete progress files for fresh start when run from GUI
-            if os.environ.get("RESUME") != "1":
+            if os.environ.get("RESUME") != "1" and not plan_only:
                 self.progress.delete()
+                self.checkpoints.delete()
 
             # Set up logging level
             if hasattr(args, "verbose") and args.verbose:
@@ -869,38 +1914,65 @@ class BaseDBImporter:
             conn_val = settings.mssql_target_conn_str if settings.mssql_target_conn_str else None
             self.db_name = settings.mssql_target_db_name or parse_database_name(conn_val)
 
-            # Begin database operations
-            with get_target_connection() as target_conn:
+            if plan_only:
+                with get_target_connection() as target_conn:
+                    self.plan_run(target_conn)
+                return False
+
+            # Begin database operations. The joins CSV import does not depend
+            # on the scope scripts, so it runs on its own connection while
+            # they execute and is joined before the joins are applied.
+            self.report = RunReport(self.DB_TYPE)
+            timed = self.report.time_phase
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="joins-import") as background, \
+                    get_target_connection() as target_conn:
+                joins_import = background.submit(self._timed, "import_joins", self.import_joins)
+
                 # NEW: Clear migration history for fresh run
                 if self.config.get("force_fresh_run", False):
                     self.clear_migration_history(target_conn)
                 
                 # Execute specific pre-processing steps
-                self.execute_preprocessing(target_conn)
+                with timed("preprocessing"):
+                    self.execute_preprocessing(target_conn)
                 
                 # Prepare SQL commands for drops and inserts
-                self.prepare_drop_and_select(target_conn)
+                with timed("prepare_drop_and_select"):
+                    self.prepare_drop_and_select(target_conn)
                 
-                # Import joins from CSV
-                self.import_joins()
+                # Wait for the joins import; re-raises its error if it failed
+                joins_joined = True
+                joins_import.result()
                 
                 # Update joins in tables
-                self.update_joins_in_tables(target_conn)
+                with timed("update_joins"):
+                    self.update_joins_in_tables(target_conn)
                 
-                # Execute table operations
-                self.execute_table_operations(target_conn)
+                if self.config.get("pipeline_table_builds"):
+                    # Copy, drop-if-empty and PK per table without barriers
+                    with timed("pipelined_builds"):
+                        self.execute_pipelined_builds(target_conn)
+                else:
+                    # Execute table operations
+                    with timed("table_operations"):
+                        self.execute_table_operations(target_conn)
 
-                # Drop any empty tables that were created
-                self.drop_empty_tables(target_conn)
+                    # Drop any empty tables that were created
+                    with timed("drop_empty_tables"):
+                        self.drop_empty_tables(target_conn)
 
-                # Create primary keys and constraints
-                self.create_primary_keys(target_conn)
+                    # Create primary keys and constraints
+                    with timed("pk_creation"):
+                        self.create_primary_keys(target_conn)
+
+                self._write_report()
                 
                 # Show completion message and determine next steps
                 next_step_name = self.get_next_step_name()
                 proceed = self.show_completion_message(next_step_name)
 
                 self.progress.delete()
+                self.checkpoints.delete()
 
                 if proceed and next_step_name:
                     logger.info(f"User chose to proceed to {next_step_name}.")
@@ -948,7 +2020,27 @@ class BaseDBImporter:
                 logger.error(f"Failed to show error message box: {msgbox_exc}")
             
             return False
+        finally:
+            # A step that failed before the joins import was joined leaves
+            # the import's own error unretrieved; report it here.
+            if joins_import is not None and not joins_joined and not joins_import.cancelled():
+                joins_error = joins_import.exception()
+                if joins_error is not None:
+                    logger.error("Background joins import failed", exc_info=joins_error)
+            self.checkpoints.close()
+            # Close every pooled connection this run opened
+            dispose_engines()
     
+    def _timed(self, phase: str, func: Any, *args: Any) -> Any:
+        with self.report.time_phase(phase):
+            return func(*args)
+
+    def _write_report(self) -> None:
+        try:
+            self.report.write(self.config["report_file"])
+        except Exception as exc:
+            logger.error(f"Failed to write run report: {exc}")
+
     # Methods that must be implemented by subclasses
     
     def execute_preprocessing(self, conn: Any) -> None:
@@ -959,6 +2051,10 @@ class BaseDBImporter:
         """Prepare SQL statements for dropping and selecting data."""
         raise NotImplementedError("Subclasses must implement prepare_drop_and_select()")
     
+    def prepare_plan_tables(self, conn: Any, plan_table: str) -> None:
+        """Gather the tables to convert into ``plan_table`` for ``--plan``."""
+        raise NotImplementedError("Subclasses must implement prepare_plan_tables()")
+
     def update_joins_in_tables(self, conn: Any) -> None:
         """Update tables with JOINs."""
         raise NotImplementedError("Subclasses must implement update_joins_in_tables()")
@@ -4,11 +4,12 @@ from typing import Any, Iterable, Tuple
 import argparse
 import logging
 import os
+import re
 import tkinter as tk
 from tkinter import messagebox
 from etl.base_importer import BaseDBImporter
 from etl.core import safe_tqdm
-from utils.etl_helpers import transaction_scope
+from utils.etl_helpers import load_sql, run_sql_script_no_tracking, transaction_scope
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +60,30 @@ class ConfigurableDBImporter(BaseDBImporter):
             type=int,
             help="Number of rows per chunk when reading the CSV file.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of tables to copy concurrently on separate connections.",
+        )
+        parser.add_argument(
+            "--pk-workers",
+            type=int,
+            help="Number of tables to build primary keys for concurrently on separate connections.",
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="Build each table's primary key as soon as its copy finishes instead of after all copies.",
+        )
+        parser.add_argument(
+            "--plan",
+            action="store_true",
+            help="Estimate rows, bytes and duration per table without copying any data.",
+        )
+        parser.add_argument(
+            "--plan-file",
+            help="Where to write the JSON plan (defaults to <DB_TYPE>_plan.json in EJ_LOG_DIR).",
+        )
         parser.add_argument(
             "--config-file",
             default="config/secure_config.json",
@@ -87,6 +112,19 @@ class ConfigurableDBImporter(BaseDBImporter):
         logger.info("Gathering list of %s tables with SQL Commands to be migrated.", self.DB_TYPE)
         self.run_sql_file(conn, "gather_drops_and_selects", self.gather_drop_select_script)
 
+    def prepare_plan_tables(self, conn: Any, plan_table: str) -> None:
+        """Run the gather script with its output redirected to ``plan_table``."""
+        logger.info("Gathering list of %s tables into %s for the run plan.", self.DB_TYPE, plan_table)
+        tables_to_convert = f"TablesToConvert_{self.DB_TYPE}" if self.DB_TYPE != 'Justice' else 'TablesToConvert'
+        sql = re.sub(
+            rf"\b{re.escape(self.db_name)}\.dbo\.{tables_to_convert}\b",
+            plan_table,
+            load_sql(self.gather_drop_select_script, self.db_name),
+            flags=re.IGNORECASE,
+        )
+        # Untracked: the temp table only lives as long as this session
+        run_sql_script_no_tracking(conn, f"plan_{self.DB_TYPE}", sql, timeout=self.config["sql_timeout"])
+
     def _check_missing_tables_in_joins(self, conn: Any) -> None:
         """Check for tables that exist in TablesToConvert but not in TableUsedSelects."""
         try:
@@ -0,0 +1,237 @@
+"""Loading the joins CSV into ``TableUsedSelects*``.
+
+``Freq``, ``InScopeFreq`` and ``fConvert`` are parsed and validated on the
+client with vectorised pandas operations (using the pyarrow CSV engine when
+it is installed), so the table is created with INT and BIT columns and no
+server-side clean-up passes are needed.  Rows with values that cannot be
+parsed are rejected and reported with the file line the record starts on.
+
+The joins spreadsheet rarely changes between rehearsal runs, so every import
+also records a fingerprint of the file (size, modification time and SHA-256)
+in ``ImportFingerprints`` on the target database.  When the same file is
+imported again and the table still holds the rows it was loaded with, the
+load is skipped.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import importlib.util
+import logging
+import os
+from dataclasses import dataclass, replace
+from typing import Any, Iterator, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINT_TABLE = "dbo.ImportFingerprints"
+
+# Joins CSV columns loaded as text.
+JOIN_STR_COLUMNS = (
+    'DatabaseName', 'SchemaName', 'TableName', 'Select_Only',
+    'Drop_IfExists', 'Selection', 'Select_Into',
+)
+
+# Columns parsed on the client and loaded typed.
+JOIN_COLUMN_TYPES = {
+    'Freq': 'INT NOT NULL',
+    'InScopeFreq': 'INT NOT NULL',
+    'fConvert': 'BIT NOT NULL',
+}
+
+_INT_MIN, _INT_MAX = -(2 ** 31), 2 ** 31 - 1
+
+
+@dataclass(frozen=True)
+class RejectedRow:
+    """A CSV row left out of the load."""
+
+    line: int
+    column: str
+    value: str
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identity of an imported file."""
+
+    size: int
+    mtime: float
+    sha256: str
+
+
+def fingerprint_file(path: str, block_size: int = 1 << 20) -> FileFingerprint:
+    """Return the size, modification time and SHA-256 of ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    stat = os.stat(path)
+    return FileFingerprint(stat.st_size, round(stat.st_mtime, 3), digest.hexdigest())
+
+
+def ensure_fingerprint_table(cursor: Any) -> None:
+    cursor.execute(
+        f"IF OBJECT_ID('{FINGERPRINT_TABLE}', 'U') IS NULL "
+        f"CREATE TABLE {FINGERPRINT_TABLE} ("
+        "TableName NVARCHAR(256) NOT NULL PRIMARY KEY, "
+        "FileSize BIGINT NOT NULL, "
+        "FileMtime FLOAT NOT NULL, "
+        "Sha256 CHAR(64) NOT NULL, "
+        "[RowCount] BIGINT NOT NULL, "
+        "ImportedAt DATETIME2 NOT NULL DEFAULT SYSDATETIME())"
+    )
+
+
+def stored_fingerprint(cursor: Any, table: str) -> Optional[tuple[FileFingerprint, int]]:
+    """Return the fingerprint and row count recorded for ``table``."""
+    cursor.execute(
+        f"SELECT FileSize, FileMtime, Sha256, [RowCount] FROM {FINGERPRINT_TABLE} WHERE TableName = ?",
+        (table,),
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return FileFingerprint(int(row[0]), float(row[1]), str(row[2]).strip()), int(row[3])
+
+
+def table_row_count(cursor: Any, table: str) -> Optional[int]:
+    """Return the number of rows in ``table`` or ``None`` if it does not exist."""
+    cursor.execute("SELECT OBJECT_ID(?, 'U')", (table,))
+    row = cursor.fetchone()
+    if row is None or row[0] is None:
+        return None
+    cursor.execute(f"SELECT COUNT_BIG(*) FROM {table}")
+    return int(cursor.fetchone()[0])
+
+
+def import_is_current(cursor: Any, table: str, fingerprint: FileFingerprint) -> bool:
+    """Return ``True`` if ``table`` was loaded from this exact file and is unchanged."""
+    stored = stored_fingerprint(cursor, table)
+    if stored is None:
+        return False
+    previous, rows = stored
+    if (previous.size, previous.sha256) != (fingerprint.size, fingerprint.sha256):
+        return False
+    return table_row_count(cursor, table) == rows
+
+
+def clear_fingerprint(cursor: Any, table: str) -> None:
+    cursor.execute(f"DELETE FROM {FINGERPRINT_TABLE} WHERE TableName = ?", (table,))
+
+
+def save_fingerprint(cursor: Any, table: str, fingerprint: FileFingerprint, rows: int) -> None:
+    clear_fingerprint(cursor, table)
+    cursor.execute(
+        f"INSERT INTO {FINGERPRINT_TABLE} (TableName, FileSize, FileMtime, Sha256, [RowCount]) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (table, fingerprint.size, fingerprint.mtime, fingerprint.sha256, rows),
+    )
+
+
+def csv_engine() -> Optional[str]:
+    """Return ``"pyarrow"`` if it is installed, otherwise ``None`` (pandas' C parser)."""
+    return "pyarrow" if importlib.util.find_spec("pyarrow") is not None else None
+
+
+def read_joins_csv(path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yield the joins CSV as DataFrames with the typed columns read as text.
+
+    The pyarrow engine does not support ``chunksize`` and reads the file in
+    one multi-threaded pass; the C parser reads it in chunks.
+    """
+    options = dict(delimiter="|", encoding="utf-8", dtype={c: str for c in JOIN_COLUMN_TYPES})
+    engine = csv_engine()
+    if engine:
+        yield pd.read_csv(path, engine=engine, **options)
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, **options)
+
+
+def _parse_integers(values: pd.Series, drop: str = "") -> pd.Series:
+    """Parse text to numbers; blanks and ``nan`` become 0, garbage becomes NaN."""
+    text = values.fillna("").astype(str).str.strip()
+    if drop:
+        text = text.str.replace(drop, "", regex=False)
+    text = text.mask(text.str.lower().isin(["", "nan"]), "0")
+    return pd.to_numeric(text, errors="coerce")
+
+
+def normalize_joins(chunk: pd.DataFrame, first_line: int) -> tuple[pd.DataFrame, list[RejectedRow]]:
+    """Return ``chunk`` with typed ``Freq``/``InScopeFreq``/``fConvert`` and the rejected rows.
+
+    ``first_line`` is the file line number of the first row in ``chunk``.
+    Thousands separators are removed from the frequencies; ``fConvert`` must
+    be 0 or 1 (``1.0`` is accepted).
+    """
+    parsed = {
+        "Freq": _parse_integers(chunk["Freq"], drop=","),
+        "InScopeFreq": _parse_integers(chunk["InScopeFreq"], drop=","),
+        "fConvert": _parse_integers(chunk["fConvert"]),
+    }
+    valid = {
+        "Freq": parsed["Freq"].between(_INT_MIN, _INT_MAX) & (parsed["Freq"] % 1 == 0),
+        "InScopeFreq": parsed["InScopeFreq"].between(_INT_MIN, _INT_MAX) & (parsed["InScopeFreq"] % 1 == 0),
+        "fConvert": parsed["fConvert"].isin([0, 1]),
+    }
+
+    rejected: list[RejectedRow] = []
+    keep = pd.Series(True, index=chunk.index)
+    lines = pd.Series(range(first_line, first_line + len(chunk)), index=chunk.index)
+    for column, ok in valid.items():
+        bad = ~ok & keep
+        for idx in chunk.index[bad]:
+            rejected.append(RejectedRow(int(lines[idx]), column, str(chunk.at[idx, column])))
+        keep &= ok
+
+    clean = chunk[keep].copy()
+    clean["Freq"] = parsed["Freq"][keep].astype("int64")
+    clean["InScopeFreq"] = parsed["InScopeFreq"][keep].astype("int64")
+    clean["fConvert"] = parsed["fConvert"][keep].astype(bool)
+    rejected.sort(key=lambda r: r.line)
+    return clean, rejected
+
+
+def record_start_lines(path: str, rows: set[int]) -> dict[int, int]:
+    """Map data row positions (0 is the row after the header) to file line numbers.
+
+    Blank lines are skipped and quoted fields may span lines, as in
+    ``read_csv``, so the position of a row in the frames is not a fixed
+    offset from its line in the file.
+    """
+    lines: dict[int, int] = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter="|")
+        position = -1  # the header
+        end = 0
+        for record in reader:
+            start, end = end + 1, reader.line_num
+            if not record:
+                continue
+            if position in rows:
+                lines[position] = start
+                if len(lines) == len(rows):
+                    break
+            position += 1
+    return lines
+
+
+def normalized_chunks(path: str, chunksize: int, rejected: list[RejectedRow]) -> Iterator[pd.DataFrame]:
+    """Yield normalised chunks of the joins CSV, appending rejects to ``rejected``.
+
+    The rejects are added once the file has been read, with their file line
+    numbers looked up in a second pass over the file.
+    """
+    found: list[RejectedRow] = []
+    position = 0
+    for chunk in read_joins_csv(path, chunksize):
+        clean, bad = normalize_joins(chunk, position)
+        found.extend(bad)
+        position += len(chunk)
+        yield clean
+    if found:
+        lines = record_start_lines(path, {r.line for r in found})
+        rejected.extend(replace(r, line=lines.get(r.line, r.line)) for r in found)
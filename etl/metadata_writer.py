@@ -0,0 +1,108 @@
+"""Buffered write-back of per-table copy results to ``TablesToConvert``.
+
+Updating ``ScopeRowCount`` with one round trip per table adds thousands of
+small transactions to the copy phase.  ``TableResultBuffer`` keeps the
+results in memory and turns them into a single set-based ``UPDATE`` per
+chunk whenever enough tables have finished or enough time has passed.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+_STATUSES = {STATUS_DONE, STATUS_FAILED}
+
+# Rows per UPDATE statement; keeps the CASE expressions to a manageable size.
+FLUSH_CHUNK_SIZE = 500
+
+
+@dataclass
+class TableResult:
+    """Outcome of copying one ``TablesToConvert`` row."""
+
+    row_id: int
+    row_count: Optional[int]
+    seconds: float
+    status: str
+
+
+class TableResultBuffer:
+    """Collect table results and decide when they should be flushed."""
+
+    def __init__(self, flush_rows: int = 50, flush_seconds: float = 30.0) -> None:
+        self.flush_rows = max(1, int(flush_rows))
+        self.flush_seconds = float(flush_seconds)
+        self._lock = threading.Lock()
+        self._pending: dict[int, TableResult] = {}
+        self._last_flush = time.monotonic()
+
+    def add(self, row_id: int, row_count: Optional[int], seconds: float, status: str = STATUS_DONE) -> None:
+        """Buffer the result for ``row_id``; a later result replaces an earlier one."""
+        if status not in _STATUSES:
+            raise ValueError(f"Invalid table status: {status}")
+        with self._lock:
+            self._pending[int(row_id)] = TableResult(
+                int(row_id),
+                None if row_count is None else int(row_count),
+                float(seconds),
+                status,
+            )
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def get(self, row_id: int) -> Optional[TableResult]:
+        return self._pending.get(int(row_id))
+
+    def due(self) -> bool:
+        """Return ``True`` once the row or time threshold has been reached."""
+        if not self._pending:
+            return False
+        return (
+            len(self._pending) >= self.flush_rows
+            or time.monotonic() - self._last_flush >= self.flush_seconds
+        )
+
+    def take(self) -> list[TableResult]:
+        """Remove and return everything buffered so far."""
+        with self._lock:
+            results = list(self._pending.values())
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+        return results
+
+    def restore(self, results: list[TableResult]) -> None:
+        """Put back results whose flush failed unless newer ones arrived."""
+        with self._lock:
+            for result in results:
+                self._pending.setdefault(result.row_id, result)
+
+
+def build_update_statements(table: str, results: list[TableResult]) -> list[str]:
+    """Build set-based UPDATE statements for ``results``.
+
+    Only integers, fixed status strings and formatted floats are inlined, so
+    no user-controlled text reaches the SQL.
+    """
+    statements = []
+    for start in range(0, len(results), FLUSH_CHUNK_SIZE):
+        chunk = results[start:start + FLUSH_CHUNK_SIZE]
+        counts = " ".join(
+            f"WHEN {r.row_id} THEN {r.row_count}" for r in chunk if r.row_count is not None
+        )
+        seconds = " ".join(f"WHEN {r.row_id} THEN {r.seconds:.3f}" for r in chunk)
+        statuses = " ".join(f"WHEN {r.row_id} THEN '{r.status}'" for r in chunk)
+        row_ids = ", ".join(str(r.row_id) for r in chunk)
+        count_expr = f"CASE RowID {counts} ELSE ScopeRowCount END" if counts else "ScopeRowCount"
+        statements.append(
+            f"UPDATE {table} SET ScopeRowCount = {count_expr}, "
+            f"CopySeconds = CASE RowID {seconds} END, "
+            f"CopyStatus = CASE RowID {statuses} END "
+            f"WHERE RowID IN ({row_ids})"
+        )
+    return statements
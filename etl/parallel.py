@@ -0,0 +1,130 @@
+"""Bounded worker pools for running independent per-table operations.
+
+The importers copy and index thousands of unrelated tables.  ``run_parallel``
+fans that work out over a fixed number of threads, each of which is expected
+to check out its own pooled connection, and captures the outcome of every
+item so a single failing table does not hide the results of the others.
+``run_pipelined`` chains two such pools so an item's second step (building a
+table's primary key) starts as soon as its first step (the copy) finishes,
+instead of after every item has been through the first step.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from etl.core import safe_tqdm
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TaskOutcome:
+    """Result of running a single work item in the pool."""
+
+    item: Any
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def run_parallel(
+    items: Iterable[Any],
+    func: Callable[[Any], Any],
+    max_workers: int,
+    desc: str = "Processing",
+    unit: str = "item",
+    on_complete: Optional[Callable[[TaskOutcome], None]] = None,
+) -> list[TaskOutcome]:
+    """Run ``func`` for every item on at most ``max_workers`` threads.
+
+    Items are submitted in the order given, so callers control scheduling by
+    sorting ``items`` beforehand.  Exceptions raised by ``func`` are captured
+    on the returned :class:`TaskOutcome` instead of being propagated.
+    ``on_complete`` is invoked on the calling thread as each item finishes.
+    """
+    work = list(items)
+    outcomes: list[TaskOutcome] = []
+    if not work:
+        return outcomes
+
+    workers = max(1, min(int(max_workers), len(work)))
+    logger.info(f"{desc}: running {len(work)} items on {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="etl-worker") as pool:
+        futures = {pool.submit(func, item): item for item in work}
+        for future in safe_tqdm(as_completed(futures), total=len(futures), desc=desc, unit=unit):
+            item = futures[future]
+            try:
+                outcome = TaskOutcome(item, result=future.result())
+            except Exception as exc:
+                outcome = TaskOutcome(item, error=exc)
+            outcomes.append(outcome)
+            if on_complete:
+                on_complete(outcome)
+
+    return outcomes
+
+
+def run_pipelined(
+    items: Iterable[Any],
+    first: Callable[[Any], Any],
+    second: Callable[[Any], Any],
+    first_workers: int,
+    second_workers: int,
+    on_first: Callable[[TaskOutcome], Optional[Any]],
+    on_second: Optional[Callable[[TaskOutcome], None]] = None,
+    ready: Iterable[Any] = (),
+    desc: str = "Processing",
+    unit: str = "item",
+) -> None:
+    """Run ``first`` for every item and hand each result on to ``second``.
+
+    ``on_first`` is invoked on the calling thread as each first step
+    finishes and returns the work item for ``second``, or ``None`` if the
+    item needs no second step.  ``ready`` items skip straight to ``second``.
+    The two steps run on separate pools, so the second step of one item
+    overlaps with the first step of the next.  Exceptions are captured on
+    the :class:`TaskOutcome` passed to the callbacks, as in
+    :func:`run_parallel`.
+    """
+    work = list(items)
+    first_workers = max(1, int(first_workers))
+    second_workers = max(1, int(second_workers))
+    logger.info(
+        f"{desc}: running {len(work)} items on {first_workers} workers, "
+        f"second step on {second_workers} workers"
+    )
+
+    with ThreadPoolExecutor(max_workers=first_workers, thread_name_prefix="etl-worker") as first_pool, \
+            ThreadPoolExecutor(max_workers=second_workers, thread_name_prefix="etl-second") as second_pool:
+        running: dict[Future, tuple[bool, Any]] = {}
+        for item in work:
+            running[first_pool.submit(first, item)] = (True, item)
+        for item in ready:
+            running[second_pool.submit(second, item)] = (False, item)
+
+        def completions() -> Iterator[tuple[bool, TaskOutcome]]:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    is_first, item = running.pop(future)
+                    try:
+                        outcome = TaskOutcome(item, result=future.result())
+                    except Exception as exc:
+                        outcome = TaskOutcome(item, error=exc)
+                    yield is_first, outcome
+
+        for is_first, outcome in safe_tqdm(completions(), desc=desc, unit=unit):
+            if is_first:
+                follow_up = on_first(outcome)
+                if follow_up is not None:
+                    running[second_pool.submit(second, follow_up)] = (False, follow_up)
+            elif on_second:
+                on_second(outcome)
@@ -0,0 +1,154 @@
+"""Collapsing a table's NOT NULL and primary key statements into one batch.
+
+``PrimaryKeyScripts`` holds one ``ALTER COLUMN ... NOT NULL`` per key column
+followed by the ``ADD CONSTRAINT ... PRIMARY KEY``.  Every ALTER COLUMN is a
+size-of-data operation, yet ``SELECT INTO`` usually carries the source
+column's NOT NULL over to the copy, so most of them change nothing.
+:func:`build_constraint_batch` drops the alters for columns the target table
+already declares NOT NULL and joins what is left into one batch, so each
+table costs a single round trip and only the scans that are really needed.
+
+The PK statement can also be given index build options (``SORT_IN_TEMPDB``,
+``MAXDOP``, ``ONLINE``, ``DATA_COMPRESSION``, ``FILLFACTOR``) from the JSON
+config, for the whole run and per table.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional
+
+from etl.core import ConfigError
+
+_NOT_NULL_RE = re.compile(
+    r"\bALTER\s+COLUMN\s+(\[(?:[^\]]|\]\])+\]|[A-Za-z_][\w@#$]*)\s+.*\bNOT\s+NULL\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+_PRIMARY_KEY_RE = re.compile(r"\bPRIMARY\s+KEY\b", re.IGNORECASE)
+_WITH_OPTIONS_RE = re.compile(r"\)\s*WITH\s*\(", re.IGNORECASE)
+
+_ON_OFF = ("ON", "OFF")
+INDEX_OPTION_VALUES = {
+    "SORT_IN_TEMPDB": _ON_OFF,
+    "ONLINE": _ON_OFF,
+    "DATA_COMPRESSION": ("NONE", "ROW", "PAGE"),
+}
+INDEX_OPTION_RANGES = {
+    "MAXDOP": (0, 64),
+    "FILLFACTOR": (1, 100),
+}
+
+
+def validate_index_options(options: Mapping[str, Any], source: str = "pk_index_options") -> dict[str, str]:
+    """Return ``options`` normalised to upper-case names and T-SQL values.
+
+    Raises :class:`ConfigError` for unknown options or values out of range.
+    Booleans are accepted for the ON/OFF options.
+    """
+    normalised = {}
+    for name, value in (options or {}).items():
+        option = str(name).upper()
+        if option in INDEX_OPTION_VALUES:
+            if isinstance(value, bool):
+                value = "ON" if value else "OFF"
+            text = str(value).upper()
+            if text not in INDEX_OPTION_VALUES[option]:
+                raise ConfigError(
+                    f"{source}: {option} must be one of {', '.join(INDEX_OPTION_VALUES[option])}, got {value!r}"
+                )
+            normalised[option] = text
+        elif option in INDEX_OPTION_RANGES:
+            low, high = INDEX_OPTION_RANGES[option]
+            try:
+                number = int(value)
+            except (TypeError, ValueError):
+                number = None
+            if isinstance(value, bool) or number is None or not low <= number <= high:
+                raise ConfigError(f"{source}: {option} must be an integer from {low} to {high}, got {value!r}")
+            normalised[option] = str(number)
+        else:
+            known = sorted(INDEX_OPTION_VALUES) + sorted(INDEX_OPTION_RANGES)
+            raise ConfigError(f"{source}: unknown index option {name!r} (expected one of {', '.join(known)})")
+    return normalised
+
+
+def resolve_index_options(
+    defaults: Mapping[str, str],
+    per_table: Mapping[str, Mapping[str, str]],
+    schema_name: str,
+    table_name: str,
+) -> dict[str, str]:
+    """Merge the run-wide options with the overrides for ``schema.table``.
+
+    ``per_table`` keys are matched case-insensitively against
+    ``schema.table`` and the bare table name.
+    """
+    options = dict(defaults)
+    for key in (f"{schema_name}.{table_name}".lower(), table_name.lower()):
+        if key in per_table:
+            options.update(per_table[key])
+            break
+    return options
+
+
+def apply_index_options(script: str, options: Mapping[str, str]) -> str:
+    """Append ``WITH (...)`` to a PRIMARY KEY statement that has no options yet."""
+    if not options or not _PRIMARY_KEY_RE.search(script) or _WITH_OPTIONS_RE.search(script):
+        return script
+    clause = ", ".join(f"{name} = {value}" for name, value in options.items())
+    return f"{script.rstrip().rstrip(';')} WITH ({clause})"
+
+
+@dataclass
+class ConstraintBatch:
+    """The statements to run for one table and what was left out."""
+
+    sql: str
+    statements: int
+    skipped_not_null: int
+
+    @property
+    def statements_run(self) -> int:
+        return self.statements - self.skipped_not_null
+
+
+def not_null_column(script: str) -> Optional[str]:
+    """Return the unquoted column an ``ALTER COLUMN ... NOT NULL`` targets."""
+    match = _NOT_NULL_RE.search(script or "")
+    if not match:
+        return None
+    name = match.group(1)
+    if name.startswith("["):
+        name = name[1:-1].replace("]]", "]")
+    return name
+
+
+def build_constraint_batch(
+    rows: Iterable[Any],
+    nullable: Optional[set[str]],
+    index_options: Optional[Mapping[str, str]] = None,
+) -> ConstraintBatch:
+    """Join a table's NOT NULL and PK scripts, skipping alters already satisfied.
+
+    ``rows`` are the table's ``PrimaryKeyScripts`` rows in execution order.
+    ``nullable`` holds the lower-cased names of the target columns that still
+    allow NULL; ``None`` means it is unknown and every alter is kept.
+    ``index_options`` are added to the PRIMARY KEY statement.
+    """
+    statements = []
+    skipped = 0
+    total = 0
+    for row in rows:
+        script = (row.get("Script") or "").strip()
+        if not script:
+            continue
+        total += 1
+        column = not_null_column(script)
+        if column is not None and nullable is not None and column.lower() not in nullable:
+            skipped += 1
+            continue
+        statements.append(apply_index_options(script, index_options or {}).rstrip(";"))
+    return ConstraintBatch(";\n".join(statements) + (";" if statements else ""), total, skipped)
@@ -0,0 +1,137 @@
+"""Pre-flight planning of an import run.
+
+``--plan`` mode gathers the tables an importer would copy and estimates, for
+every table, the rows and bytes to move and the time spent in the copy and
+primary key phases.  Estimates come from :mod:`etl.scheduler`, so tables
+seen in an earlier run use their recorded durations.  The projected phase
+durations simulate longest-first scheduling on the configured number of
+workers.  No data is copied.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable, Optional
+
+from etl.scheduler import TableDurationHistory, estimate_seconds, table_key
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("table_operations", "pk_creation")
+
+
+@dataclass
+class TablePlan:
+    """Estimated cost of migrating one table."""
+
+    row_id: Optional[int]
+    table: str
+    rows: int
+    bytes: int
+    copy_seconds: float
+    pk_seconds: float
+
+
+def simulate_makespan(durations: Iterable[float], workers: int) -> float:
+    """Return the wall time of running ``durations`` longest-first on ``workers``."""
+    loads = [0.0] * max(1, int(workers))
+    for seconds in sorted(durations, reverse=True):
+        heapq.heapreplace(loads, loads[0] + seconds)
+    return max(loads)
+
+
+def build_plan(
+    rows: Iterable[Any],
+    sizes: dict[str, tuple[int, int]],
+    history: TableDurationHistory,
+    workers: dict[str, int],
+) -> dict[str, Any]:
+    """Combine table metadata, source sizes and history into a run plan.
+
+    ``sizes`` maps :func:`etl.scheduler.table_key` to ``(rows, bytes)`` read
+    from ``sys.dm_db_partition_stats``; missing tables fall back to the
+    ``RowCount`` captured in ``TablesToConvert``.
+    """
+    tables = []
+    for row in rows:
+        key = table_key(row)
+        size_rows, size_bytes = sizes.get(key, (row.get("RowCount") or 0, 0))
+        estimate_row = {**dict(row), "RowCount": size_rows}
+        tables.append(
+            TablePlan(
+                row_id=row.get("RowID"),
+                table=key,
+                rows=int(size_rows or 0),
+                bytes=int(size_bytes or 0),
+                copy_seconds=round(estimate_seconds(estimate_row, "table_operations", history), 1),
+                pk_seconds=round(estimate_seconds(estimate_row, "pk_creation", history), 1),
+            )
+        )
+    tables.sort(key=lambda t: t.copy_seconds + t.pk_seconds, reverse=True)
+
+    phase_seconds = {
+        "table_operations": [t.copy_seconds for t in tables],
+        "pk_creation": [t.pk_seconds for t in tables],
+    }
+    phases = {
+        phase: {
+            "workers": workers.get(phase, 1),
+            "serial_seconds": round(sum(phase_seconds[phase]), 1),
+            "projected_seconds": round(simulate_makespan(phase_seconds[phase], workers.get(phase, 1)), 1),
+        }
+        for phase in PHASES
+    }
+    return {
+        "tables": [asdict(t) for t in tables],
+        "phases": phases,
+        "total_rows": sum(t.rows for t in tables),
+        "total_bytes": sum(t.bytes for t in tables),
+        "projected_seconds": round(sum(p["projected_seconds"] for p in phases.values()), 1),
+    }
+
+
+def _duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def format_plan(plan: dict[str, Any], limit: int = 25) -> str:
+    """Render the plan as a console table of the most expensive tables."""
+    lines = [
+        f"{'Table':<60} {'Rows':>14} {'MB':>10} {'Copy':>9} {'PK':>9}",
+        "-" * 106,
+    ]
+    for table in plan["tables"][:limit]:
+        lines.append(
+            f"{table['table'][:60]:<60} {table['rows']:>14,} {table['bytes'] / 1048576:>10,.1f} "
+            f"{_duration(table['copy_seconds']):>9} {_duration(table['pk_seconds']):>9}"
+        )
+    remaining = len(plan["tables"]) - limit
+    if remaining > 0:
+        lines.append(f"... {remaining} more tables")
+    lines.append("-" * 106)
+    for phase, info in plan["phases"].items():
+        lines.append(
+            f"{phase:<20} serial {_duration(info['serial_seconds'])}  "
+            f"projected {_duration(info['projected_seconds'])} on {info['workers']} worker(s)"
+        )
+    lines.append(
+        f"{len(plan['tables'])} tables, {plan['total_rows']:,} rows, "
+        f"{plan['total_bytes'] / 1073741824:,.2f} GB, projected {_duration(plan['projected_seconds'])}"
+    )
+    return "\n".join(lines)
+
+
+def write_plan(plan: dict[str, Any], path: str) -> None:
+    """Write the plan as JSON."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2)
+    logger.info(f"Wrote run plan to {path}")
@@ -0,0 +1,94 @@
+"""Key-range slicing of very large SELECT INTO copies.
+
+A single ``SELECT DISTINCT ... INTO`` over a table with hundreds of millions
+of rows runs in one transaction, so a timeout discards all of its work.  For
+such tables the importer creates the empty target first and fills it with one
+``INSERT ... SELECT`` per range of an integer key.  Each slice deletes its own
+range before inserting, which makes re-running a half-finished slice safe.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+from etl.tsql_lexer import parse_select_into
+
+
+def split_select_into(select_into_sql: str) -> Optional[tuple[str, str, str]]:
+    """Split ``SELECT ... INTO target FROM ...`` into its three parts.
+
+    Returns ``(select_part, target, from_clause)`` or ``None`` when the
+    statement does not have that shape.
+    """
+    parsed = parse_select_into(select_into_sql)
+    if parsed is None:
+        return None
+    return parsed.select_part, parsed.target, parsed.from_clause
+
+
+def plan_slices(low: int, high: int, row_count: int, slice_rows: int) -> list[tuple[int, int]]:
+    """Divide the key range ``[low, high]`` into half-open ``(start, stop)`` slices.
+
+    The number of slices follows from ``row_count / slice_rows``; keys are
+    assumed to be spread evenly over the range.
+    """
+    if high < low:
+        return []
+    count = max(1, math.ceil(max(row_count, 1) / max(slice_rows, 1)))
+    width = max(1, math.ceil((high - low + 1) / count))
+    slices = []
+    start = low
+    while start <= high:
+        stop = min(start + width, high + 1)
+        slices.append((start, stop))
+        start = stop
+    return slices
+
+
+def build_key_range_sql(from_clause: str, key_column: str) -> str:
+    """Return the query for the lowest and highest key the copy will read."""
+    return f"SELECT MIN(A.[{key_column}]), MAX(A.[{key_column}]) {from_clause}"
+
+
+def build_create_sql(select_part: str, target: str, from_clause: str) -> str:
+    """Create the empty target table with the shape of the full copy."""
+    return f"SELECT TOP (0) X.* INTO {target} FROM ({select_part} {from_clause}) X"
+
+
+def build_slice_sql(
+    select_part: str,
+    target: str,
+    from_clause: str,
+    key_column: str,
+    start: int,
+    stop: int,
+    columns: Optional[list[str]] = None,
+    tablock: bool = True,
+) -> str:
+    """Return the batch that (re)loads one key slice and reports its row count.
+
+    ``columns`` must be given when the target has an identity column so that
+    ``IDENTITY_INSERT`` can be used.  ``TABLOCK`` allows minimal logging but
+    serialises concurrent inserts, so callers drop it for parallel slices.
+    """
+    hint = " WITH (TABLOCK)" if tablock else ""
+    column_list = ""
+    if columns:
+        column_list = " (" + ", ".join(f"[{c}]" for c in columns) + ")"
+    lines = [
+        "DECLARE @rows BIGINT",
+        "SET NOCOUNT ON",
+        f"DELETE FROM {target} WHERE [{key_column}] >= {int(start)} AND [{key_column}] < {int(stop)}",
+    ]
+    if columns:
+        lines.append(f"SET IDENTITY_INSERT {target} ON")
+    lines.append(
+        f"INSERT INTO {target}{hint}{column_list} SELECT X.* FROM ({select_part} {from_clause}) X "
+        f"WHERE X.[{key_column}] >= {int(start)} AND X.[{key_column}] < {int(stop)}"
+    )
+    lines.append("SET @rows = ROWCOUNT_BIG()")
+    if columns:
+        lines.append(f"SET IDENTITY_INSERT {target} OFF")
+    lines += ["SET NOCOUNT OFF", "SELECT @rows AS InsertedRows"]
+    return "\n".join(lines)
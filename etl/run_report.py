@@ -0,0 +1,107 @@
+"""Per-run timing report.
+
+The importers already log a line per table; the report gathers the numbers
+that matter when comparing runs in one place: the wall time of every phase
+and, per table, how long it took this time next to the duration recorded by
+the previous run.  It is written as JSON next to the log files and
+summarised in the log when the run ends.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RunReport:
+    """Collects phase and per-table timings for one importer run."""
+
+    def __init__(self, db_type: str) -> None:
+        self.db_type = db_type
+        self.started = datetime.now().isoformat(timespec="seconds")
+        self._lock = threading.Lock()
+        self._phases: dict[str, dict[str, Any]] = {}
+        self._tables: dict[str, list[dict[str, Any]]] = {}
+
+    @contextmanager
+    def time_phase(self, phase: str) -> Iterator[None]:
+        """Record the wall time of the ``with`` block under ``phase``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, seconds=round(time.perf_counter() - started, 3))
+
+    def add_phase(self, phase: str, **details: Any) -> None:
+        with self._lock:
+            self._phases.setdefault(phase, {}).update(details)
+
+    def add_table(
+        self,
+        phase: str,
+        table: str,
+        seconds: float,
+        previous_seconds: Optional[float] = None,
+        **details: Any,
+    ) -> None:
+        """Record one table's duration; ``previous_seconds`` is the last run's."""
+        entry = {"table": table, "seconds": round(seconds, 3), "previous_seconds": previous_seconds}
+        entry.update(details)
+        with self._lock:
+            self._tables.setdefault(phase, []).append(entry)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            phases = {name: dict(info) for name, info in self._phases.items()}
+            tables = {name: list(entries) for name, entries in self._tables.items()}
+        for phase, entries in tables.items():
+            totals = phases.setdefault(phase, {})
+            totals["tables"] = len(entries)
+            totals["table_seconds"] = round(sum(e["seconds"] for e in entries), 3)
+            known = [e for e in entries if e["previous_seconds"] is not None]
+            if known:
+                # Only tables timed in both runs are comparable.
+                totals["compared_tables"] = len(known)
+                totals["compared_seconds"] = round(sum(e["seconds"] for e in known), 3)
+                totals["compared_previous_seconds"] = round(sum(e["previous_seconds"] for e in known), 3)
+            for key in {k for e in entries for k, v in e.items() if isinstance(v, int) and k != "seconds"}:
+                totals[key] = sum(e.get(key, 0) for e in entries)
+        return {
+            "db_type": self.db_type,
+            "started": self.started,
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "phases": phases,
+            "tables": tables,
+        }
+
+    def format(self) -> str:
+        """Render the phase totals for the log."""
+        report = self.to_dict()
+        lines = [f"Run report for {self.db_type}:"]
+        for phase, info in report["phases"].items():
+            line = f"  {phase:<20} {info.get('seconds', info.get('table_seconds', 0.0)):>10.1f}s"
+            if "compared_tables" in info:
+                line += (
+                    f"  ({info['compared_tables']} tables: {info['compared_seconds']:.1f}s now, "
+                    f"{info['compared_previous_seconds']:.1f}s previous run)"
+                )
+            lines.append(line)
+        return "\n".join(lines)
+
+    def write(self, path: str) -> None:
+        """Write the report as JSON and log its summary."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logger.info(self.format())
+        logger.info(f"Wrote run report to {path}")
@@ -0,0 +1,132 @@
+"""Longest-first scheduling of per-table work.
+
+A single huge table that starts last holds up the whole run, so the table and
+primary key phases order their work by estimated cost, largest first.  The
+estimate prefers the duration observed for the same table in an earlier run
+and otherwise converts the table's ``RowCount`` to seconds using the
+throughput seen so far.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import threading
+from itertools import groupby
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rows per second assumed for a phase before any history has been recorded.
+DEFAULT_ROWS_PER_SECOND = 50000.0
+
+
+def table_key(row: Any) -> str:
+    """Return the ``database.schema.table`` key used for duration history."""
+    return ".".join(
+        str(row.get(part) or "") for part in ("DatabaseName", "SchemaName", "TableName")
+    ).lower()
+
+
+def _row_count(row: Any) -> int:
+    for column in ("RowCount", "ScopeRowCount"):
+        value = row.get(column)
+        if value is not None:
+            try:
+                return max(int(value), 0)
+            except (TypeError, ValueError):
+                continue
+    return 0
+
+
+class TableDurationHistory:
+    """Per-table phase durations persisted between runs in a JSON file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: dict[str, dict[str, dict[str, float]]] = self._load()
+
+    def _load(self) -> dict[str, dict[str, dict[str, float]]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as exc:
+            logger.error("Failed to read duration history %s: %s", self.path, exc)
+            return {}
+
+    def get(self, phase: str, key: str) -> Optional[float]:
+        """Return the last recorded duration in seconds for ``key``."""
+        entry = self._data.get(phase, {}).get(key)
+        return float(entry["seconds"]) if entry else None
+
+    def record(self, phase: str, key: str, seconds: float, rows: Optional[int] = None) -> None:
+        """Remember how long ``key`` took in ``phase``; call :meth:`save` to persist."""
+        with self._lock:
+            entry: dict[str, float] = {"seconds": round(float(seconds), 3)}
+            if rows is not None:
+                entry["rows"] = int(rows)
+            self._data.setdefault(phase, {})[key] = entry
+
+    def rows_per_second(self, phase: str) -> float:
+        """Median throughput observed for ``phase`` or the default estimate."""
+        rates = [
+            entry["rows"] / entry["seconds"]
+            for entry in self._data.get(phase, {}).values()
+            if entry.get("rows") and entry.get("seconds", 0) > 0
+        ]
+        return statistics.median(rates) if rates else DEFAULT_ROWS_PER_SECOND
+
+    def save(self) -> None:
+        """Write the history file."""
+        if not self.path:
+            return
+        with self._lock:
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, indent=2)
+            except Exception as exc:
+                logger.error("Failed to write duration history %s: %s", self.path, exc)
+
+
+def estimate_seconds(row: Any, phase: str, history: TableDurationHistory) -> float:
+    """Estimate how long ``row`` will take in ``phase``."""
+    seconds = history.get(phase, table_key(row))
+    if seconds is not None:
+        return seconds
+    return _row_count(row) / history.rows_per_second(phase)
+
+
+def order_longest_first(
+    rows: Iterable[Any], phase: str, history: TableDurationHistory
+) -> list[Any]:
+    """Return ``rows`` sorted by estimated duration, longest first.
+
+    The sort is stable so ties keep the order returned by the database.
+    """
+    work = list(rows)
+    work.sort(key=lambda row: estimate_seconds(row, phase, history), reverse=True)
+    return work
+
+
+def order_table_groups_longest_first(
+    rows: Iterable[Any], phase: str, history: TableDurationHistory
+) -> list[Any]:
+    """Order groups of consecutive rows for the same table, longest first.
+
+    Rows belonging to one table stay together and keep their relative order,
+    which the primary key phase relies on to run NOT NULL before PK.
+    """
+    groups = [
+        list(group)
+        for _, group in groupby(rows, key=lambda row: (row.get("SchemaName"), row.get("TableName")))
+    ]
+    groups.sort(key=lambda group: estimate_seconds(group[0], phase, history), reverse=True)
+    return [row for group in groups for row in group]
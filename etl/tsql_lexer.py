@@ -0,0 +1,161 @@
+"""Single-pass T-SQL lexer for locating SELECT ... INTO clauses.
+
+The generated ``Select_Into`` statements list hundreds of columns, contain
+bracketed identifiers and string literals, and may carry comments from the
+joins spreadsheet.  Finding ``INTO`` and ``FROM`` by scanning raw text breaks
+as soon as one of those contains a keyword, comma or parenthesis.  This
+module tokenizes a statement once with a compiled regular expression,
+tracks parenthesis depth, and caches the parsed clauses by a hash of the
+statement text.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+WORD = "word"
+IDENT = "ident"
+STRING = "string"
+NUMBER = "number"
+PUNCT = "punct"
+
+_TOKEN_RE = re.compile(
+    r"""
+      (?P<ws>\s+)
+    | (?P<comment>--[^\n]*|/\*.*?\*/)
+    | (?P<string>N?'(?:[^']|'')*')
+    | (?P<ident>\[(?:[^\]]|\]\])*\]|"(?:[^"]|"")*")
+    | (?P<word>[A-Za-z_@#][\w@#$]*)
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<punct>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    start: int
+    end: int
+    depth: int
+
+    def is_keyword(self, keyword: str) -> bool:
+        return self.kind == WORD and self.text.upper() == keyword
+
+
+def tokenize(sql: str) -> list[Token]:
+    """Split ``sql`` into tokens, dropping whitespace and comments.
+
+    ``depth`` is the parenthesis nesting level the token appears at; an
+    opening parenthesis carries the depth outside it.
+    """
+    tokens: list[Token] = []
+    depth = 0
+    for match in _TOKEN_RE.finditer(sql):
+        kind = match.lastgroup
+        if kind in ("ws", "comment"):
+            continue
+        text = match.group()
+        if text == ")":
+            depth = max(0, depth - 1)
+        tokens.append(Token(kind, text, match.start(), match.end(), depth))
+        if text == "(":
+            depth += 1
+    return tokens
+
+
+@dataclass(frozen=True)
+class SelectInto:
+    """Top-level clauses of a ``SELECT ... INTO target FROM ...`` statement."""
+
+    select_part: str
+    distinct: bool
+    columns: tuple[str, ...]
+    target: str
+    from_clause: str
+
+    @property
+    def column_expressions(self) -> tuple[str, ...]:
+        """Select-list entries with any trailing ``AS alias`` removed."""
+        return tuple(_strip_alias(column) for column in self.columns)
+
+
+def _strip_alias(column: str) -> str:
+    tokens = tokenize(column)
+    for i in range(len(tokens) - 1, 0, -1):
+        if tokens[i].depth == 0 and tokens[i].is_keyword("AS"):
+            return column[:tokens[i].start].rstrip()
+    return column
+
+
+def _parse(sql: str) -> Optional[SelectInto]:
+    tokens = tokenize(sql)
+    if not tokens or not tokens[0].is_keyword("SELECT"):
+        return None
+
+    into_idx = from_idx = None
+    for i, token in enumerate(tokens):
+        if token.depth != 0 or token.kind != WORD:
+            continue
+        keyword = token.text.upper()
+        if into_idx is None and keyword == "INTO":
+            into_idx = i
+        elif into_idx is not None and keyword == "FROM":
+            from_idx = i
+            break
+    if into_idx is None or from_idx is None or from_idx == into_idx + 1:
+        return None
+
+    list_start = 1
+    distinct = tokens[1].is_keyword("DISTINCT")
+    if distinct or tokens[1].is_keyword("ALL"):
+        list_start = 2
+    if list_start >= into_idx:
+        return None
+
+    columns = []
+    column_start = tokens[list_start].start
+    for token in tokens[list_start:into_idx]:
+        if token.depth == 0 and token.text == ",":
+            columns.append(sql[column_start:token.start].strip())
+            column_start = token.end
+    columns.append(sql[column_start:tokens[into_idx].start].strip())
+
+    return SelectInto(
+        select_part=sql[:tokens[into_idx].start].strip(),
+        distinct=distinct,
+        columns=tuple(columns),
+        target=sql[tokens[into_idx + 1].start:tokens[from_idx].start].strip(),
+        from_clause=sql[tokens[from_idx].start:].strip(),
+    )
+
+
+_CACHE_SIZE = 2048
+_cache: "OrderedDict[str, Optional[SelectInto]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def parse_select_into(sql: str) -> Optional[SelectInto]:
+    """Return the clauses of a SELECT INTO statement or ``None``.
+
+    Results are cached by a SHA-1 of the statement so repeated calls (count
+    validation, sliced copies) do not tokenize the same text again, without
+    keeping the statement text alive as a key.
+    """
+    key = hashlib.sha1(sql.encode("utf-8")).hexdigest()
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+    parsed = _parse(sql)
+    with _cache_lock:
+        _cache[key] = parsed
+        if len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return parsed
@@ -7,6 +7,8 @@ GO
         p.[rows] AS [RowCount],
 	    CAST(0 AS BIGINT) AS [ScopeRowCount],
         CAST('' AS VARCHAR(8000)) AS [ScopeComment],
+        CAST(NULL AS DECIMAL(18,3)) AS [CopySeconds],
+        CAST(NULL AS VARCHAR(20)) AS [CopyStatus],
         CAST(1 AS BIT) AS [fConvert],
         'SELECT DISTINCT ' + 
         STUFF((
@@ -2,14 +2,6 @@
 	ALTER TABLE {{DB_NAME}}.dbo.TablesToConvert ALTER COLUMN Select_Into TEXT
 	ALTER TABLE {{DB_NAME}}.dbo.TablesToConvert ALTER COLUMN Select_Only TEXT
 	ALTER TABLE {{DB_NAME}}.dbo.TablesToConvert ALTER COLUMN Joins TEXT
-GO
-	UPDATE {{DB_NAME}}.dbo.TableUsedSelects SET Freq=LTRIM(RTRIM(REPLACE(REPLACE(Freq,',',''),'nan',0)))
-	UPDATE {{DB_NAME}}.dbo.TableUsedSelects SET InScopeFreq=LTRIM(RTRIM(REPLACE(REPLACE(InScopeFreq,',',''),'nan',0)))
-	UPDATE {{DB_NAME}}.dbo.TableUsedSelects SET fConvert=LTRIM(RTRIM(REPLACE(REPLACE(fConvert,'.0',''),'nan',0)))
-GO
-	ALTER TABLE {{DB_NAME}}.dbo.TableUsedSelects ALTER COLUMN Freq INT NOT NULL
-	ALTER TABLE {{DB_NAME}}.dbo.TableUsedSelects ALTER COLUMN InScopeFreq INT NOT NULL
-	ALTER TABLE {{DB_NAME}}.dbo.TableUsedSelects ALTER COLUMN fConvert BIT NOT NULL
 GO
 	UPDATE TTC SET
 		  Joins			=REPLACE(LTRIM(RTRIM(SUBSTRING(S.SELECT_ONLY,CHARINDEX('A WITH (NOLOCK)',S.SELECT_ONLY)+15,8000))),'() AS YoDate','')
@@ -1,9 +1,21 @@
-	DROP TABLE IF EXISTS {{DB_NAME}}.dbo.LOB_COLUMN_UPDATES
-GO
-CREATE TABLE {{DB_NAME}}.dbo.LOB_COLUMN_UPDATES 
+	IF OBJECT_ID('{{DB_NAME}}.dbo.LOB_COLUMN_UPDATES', 'U') IS NULL
+	CREATE TABLE {{DB_NAME}}.dbo.LOB_COLUMN_UPDATES
 	(
 		SchemaName VARCHAR(128) NOT NULL,TableName VARCHAR(128) NOT NULL,ColumnName VARCHAR(128) NOT NULL,DataType VARCHAR(128) NOT NULL,
-		CurrentLength INT NULL,MaxLen INT NULL,RowCnt INT NULL,AlterStatement VARCHAR(MAX) NULL,ProcessDate DATETIME NOT NULL DEFAULT GETDATE(),
+		CurrentLength INT NULL,MaxLen INT NULL,MaxBytes BIGINT NULL,RowCnt INT NULL,AlterStatement VARCHAR(MAX) NULL,ProcessDate DATETIME NOT NULL DEFAULT GETDATE(),
 		PRIMARY KEY (SchemaName, TableName, ColumnName)
 	)
-GO
\ No newline at end of file
+GO
+	IF COL_LENGTH('{{DB_NAME}}.dbo.LOB_COLUMN_UPDATES', 'MaxBytes') IS NULL
+	ALTER TABLE {{DB_NAME}}.dbo.LOB_COLUMN_UPDATES ADD MaxBytes BIGINT NULL
+GO
+	IF OBJECT_ID('{{DB_NAME}}.dbo.LOB_TABLE_STATE', 'U') IS NULL
+	CREATE TABLE {{DB_NAME}}.dbo.LOB_TABLE_STATE
+	(
+		SchemaName VARCHAR(128) NOT NULL,TableName VARCHAR(128) NOT NULL,RowCnt BIGINT NOT NULL,ModifyDate DATETIME NOT NULL,LastUserUpdate DATETIME NULL,ProcessDate DATETIME NOT NULL DEFAULT GETDATE(),
+		PRIMARY KEY (SchemaName, TableName)
+	)
+GO
+	IF COL_LENGTH('{{DB_NAME}}.dbo.LOB_TABLE_STATE', 'LastUserUpdate') IS NULL
+	ALTER TABLE {{DB_NAME}}.dbo.LOB_TABLE_STATE ADD LastUserUpdate DATETIME NULL
+GO
@@ -5,7 +5,13 @@ import argparse
 
 
 from etl.base_importer import BaseDBImporter
+from etl.core import ConfigError
+from etl.joins_import import RejectedRow
+from etl.pk_builder import validate_index_options
+from etl.scheduler import TableDurationHistory
+from utils.checkpoint_store import CheckpointStore
 from utils.progress_tracker import ProgressTracker
+from utils.retry_policy import RetryPolicy
 
 
 def test_validate_environment_missing_all(monkeypatch):
@@ -58,6 +64,28 @@ def test_load_config_env_and_args(monkeypatch, tmp_path):
     assert importer.config['csv_chunk_size'] == 1234
 
 
+def test_required_connections_counts_every_worker():
+    importer = BaseDBImporter()
+    importer.config = {'table_workers': 4, 'pk_workers': 3, 'large_table_slice_workers': 1}
+    assert importer.required_connections() == 5
+
+    importer.config['large_table_slice_workers'] = 2
+    assert importer.required_connections() == 13
+
+    importer.config.update(large_table_slice_workers=1, pipeline_table_builds=True)
+    assert importer.required_connections() == 8
+
+
+def test_load_config_rejects_workers_beyond_pool(tmp_path, monkeypatch):
+    monkeypatch.setenv('EJ_LOG_DIR', str(tmp_path))
+    monkeypatch.setenv('TABLE_WORKERS', '20')
+    monkeypatch.setattr('etl.base_importer.pool_capacity', lambda: 15)
+    args = argparse.Namespace(log_file=None, csv_file=None, config_file=None, verbose=False)
+
+    with pytest.raises(ConfigError, match='table_workers=20'):
+        BaseDBImporter().load_config(args)
+
+
 def test_show_completion_message(monkeypatch):
     importer = BaseDBImporter()
 
@@ -87,8 +115,8 @@ def test_process_table_row_validation(tmp_path, monkeypatch):
     conn = sqlite3.connect(':memory:')
     conn.execute('CREATE TABLE src(id INTEGER)')
     conn.executemany('INSERT INTO src VALUES (?)', [(1,), (2,)])
-    conn.execute("CREATE TABLE 'main.dbo.TablesToConvert_base'(RowID INTEGER PRIMARY KEY, ScopeRowCount INTEGER)")
-    conn.execute("INSERT INTO 'main.dbo.TablesToConvert_base' VALUES (1, 3)")
+    conn.execute("CREATE TABLE 'main.dbo.TablesToConvert_base'(RowID INTEGER PRIMARY KEY, ScopeRowCount INTEGER, CopySeconds REAL, CopyStatus TEXT)")
+    conn.execute("INSERT INTO 'main.dbo.TablesToConvert_base' (RowID, ScopeRowCount) VALUES (1, 3)")
 
     def fake_exec(c, sql, params=None, timeout=100):
         if params:
@@ -99,6 +127,10 @@ def test_process_table_row_validation(tmp_path, monkeypatch):
     monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
     def fake_sanitize(c, sql, params=None, timeout=100):
         sql = sql.replace("main.dbo.TablesToConvert_base", "'main.dbo.TablesToConvert_base'")
+        if "ROWCOUNT_BIG()" in sql:
+            # Emulate the T-SQL batch: run the copy, then report its row count
+            c.execute(_inner_select_into(sql))
+            return c.execute('SELECT COUNT(*) FROM dest')
         return fake_exec(c, sql, params)
     monkeypatch.setattr('etl.base_importer.sanitize_sql', fake_sanitize)
 
@@ -115,7 +147,105 @@ def test_process_table_row_validation(tmp_path, monkeypatch):
     result = importer._process_table_operation_row(conn, row, 1, importer.config['log_file'])
     assert result is True
     assert conn.execute('SELECT COUNT(*) FROM dest').fetchone()[0] == 2
-    assert conn.execute("SELECT ScopeRowCount FROM 'main.dbo.TablesToConvert_base' WHERE RowID=1").fetchone()[0] == 2
+    # Results are buffered until the next flush
+    assert conn.execute("SELECT ScopeRowCount FROM 'main.dbo.TablesToConvert_base' WHERE RowID=1").fetchone()[0] == 3
+
+    importer._flush_table_results(conn, importer.config['log_file'])
+    assert conn.execute(
+        "SELECT ScopeRowCount, CopyStatus FROM 'main.dbo.TablesToConvert_base' WHERE RowID=1"
+    ).fetchone() == (2, 'done')
+    assert len(importer.table_results) == 0
+
+
+def _inner_select_into(batch):
+    """Return the SELECT INTO wrapped by ``_select_into_with_rowcount``."""
+    return batch.split("SET NOCOUNT ON\n", 1)[1].split("\nSET @rows", 1)[0]
+
+
+def test_process_table_row_uses_statement_rowcount(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'include_empty_tables': True,
+        'log_file': str(tmp_path / 'err.log'),
+    }
+    importer.db_name = 'main'
+
+    executed = []
+
+    class Result:
+        def __init__(self, value):
+            self.value = value
+
+        def fetchone(self):
+            return (self.value,)
+
+    def fake_sanitize(c, sql, params=None, timeout=100):
+        executed.append(sql)
+        return Result(42)
+
+    def fail_exec(*args, **kwargs):
+        raise AssertionError("no separate COUNT query expected")
+
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', fake_sanitize)
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fail_exec)
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+    row = {
+        'RowID': 7,
+        'Drop_IfExists': 'DROP TABLE IF EXISTS main.dbo.dest',
+        'Select_Into': 'SELECT DISTINCT A.[id] INTO main.[dbo].[dest] FROM Justice.[dbo].[src] A WITH (NOLOCK) ',
+        'TableName': 'dest',
+        'SchemaName': 'dbo',
+        'ScopeRowCount': 3,
+        'fConvert': 1,
+    }
+
+    assert importer._process_table_operation_row(DummyConn(), row, 1, importer.config['log_file']) is True
+    batch = executed[1]
+    assert _inner_select_into(batch) == row['Select_Into'].strip()
+    assert batch.rstrip().endswith('SELECT @rows AS InsertedRows')
+    assert len(executed) == 2
+    assert importer.table_results.get(7).row_count == 42
+
+
+def test_process_table_row_extra_validation_counts_source(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {'sql_timeout': 100, 'log_file': str(tmp_path / 'err.log')}
+    importer.db_name = 'main'
+    importer.extra_validation = True
+
+    counted = []
+
+    class Result:
+        def fetchone(self):
+            return (5,)
+
+    def fake_exec(c, sql, params=None, timeout=100):
+        counted.append(sql)
+        return Result()
+
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', lambda *a, **k: Result())
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+    row = {
+        'RowID': 1,
+        'Drop_IfExists': 'DROP TABLE IF EXISTS main.dbo.dest',
+        'Select_Into': 'SELECT DISTINCT A.[id], A.[name] INTO main.[dbo].[dest] FROM Justice.[dbo].[src] A WITH (NOLOCK) ',
+        'TableName': 'dest',
+        'SchemaName': 'dbo',
+        'fConvert': 1,
+    }
+
+    importer._process_table_operation_row(DummyConn(), row, 1, importer.config['log_file'])
+    assert counted == ['SELECT COUNT(DISTINCT A.[id]) FROM Justice.[dbo].[src] A WITH (NOLOCK)']
 
 
 def test_progress_helpers(tmp_path):
@@ -129,6 +259,81 @@ def test_progress_helpers(tmp_path):
     assert not path.exists()
 
 
+def test_checkpoint_store_is_keyed_by_row_id(tmp_path):
+    path = tmp_path / "checkpoints.json"
+    store = CheckpointStore(str(path))
+    store.complete("table_operations", 7, "justice.dbo.a")
+    store.fail("table_operations", 3, "justice.dbo.b", error="boom")
+
+    reloaded = CheckpointStore(str(path))
+    assert reloaded.is_done("table_operations", 7, "justice.dbo.a")
+    assert not reloaded.is_done("table_operations", 7, "justice.dbo.other")
+    assert reloaded.status("table_operations", 3) == "failed"
+    assert not reloaded.is_done("pk_creation", 7)
+
+    reloaded.delete()
+    assert not path.exists()
+    assert reloaded.status("table_operations", 7) is None
+
+
+def test_checkpoint_store_batches_saves(tmp_path):
+    path = tmp_path / "checkpoints.json"
+    store = CheckpointStore(str(path), flush_marks=3, flush_seconds=3600)
+    store.start("pk_creation", 1, "justice.dbo.a")
+    store.complete("pk_creation", 1, "justice.dbo.a")
+    assert not path.exists()
+
+    store.complete("pk_creation", 2, "justice.dbo.b")
+    assert CheckpointStore(str(path)).is_done("pk_creation", 2)
+
+    store.complete("pk_creation", 3, "justice.dbo.c")
+    assert not CheckpointStore(str(path)).is_done("pk_creation", 3)
+    store.close()
+    assert CheckpointStore(str(path)).is_done("pk_creation", 3)
+
+
+def test_pk_retry_without_connection_opens_a_new_one(tmp_path, monkeypatch):
+    importer = _pk_importer(tmp_path, monkeypatch, 2, [])
+    importer.retry_policy = RetryPolicy(sleep=lambda s: None)
+    opened = []
+
+    def connect():
+        opened.append(_PkConn())
+        return opened[-1]
+
+    def drop_first(conn, group, idx, log_file):
+        if len(opened) == 1:
+            raise sys.modules['pyodbc'].Error('08S01', 'Communication link failure')
+        return None
+
+    monkeypatch.setattr('etl.base_importer.get_target_connection', connect)
+    monkeypatch.setattr(importer, '_process_pk_group', drop_first)
+    group = [{'RowID': 1, 'DatabaseName': 'main', 'SchemaName': 'dbo', 'TableName': 'a'}]
+
+    importer._create_table_constraints(None, group, 1, importer.config['log_file'])
+    assert len(opened) == 2
+
+    # On a shared connection a dropped link is not retried
+    opened.clear()
+    with pytest.raises(sys.modules['pyodbc'].Error):
+        importer._create_table_constraints(connect(), group, 1, importer.config['log_file'])
+
+
+def test_pk_checkpoint_is_saved_immediately(tmp_path):
+    importer = BaseDBImporter()
+    path = tmp_path / 'checkpoints.json'
+    importer.checkpoints = CheckpointStore(str(path), flush_marks=25, flush_seconds=3600)
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+    group = [{'RowID': 4, 'DatabaseName': 'Justice', 'SchemaName': 'dbo', 'TableName': 'a'}]
+
+    importer.checkpoints.complete('table_operations', 4, 'justice.dbo.a')
+    assert not path.exists()
+    importer._record_pk_table(group, (0.1, None), 1)
+
+    assert CheckpointStore(str(path)).is_done('pk_creation', 4)
+
+
 def test_should_process_table_overrides():
     importer = BaseDBImporter()
     importer.config = {
@@ -216,3 +421,809 @@ def test_process_table_row_error_propagates(tmp_path, monkeypatch):
 
     with pytest.raises(SQLExecutionError):
         importer._process_table_operation_row(conn, row, 1, importer.config["log_file"])
+
+
+def test_execute_table_operations_parallel(tmp_path, monkeypatch):
+    import sqlite3
+
+    db_path = str(tmp_path / 'target.db')
+    setup = sqlite3.connect(db_path)
+    setup.execute('CREATE TABLE src(id INTEGER)')
+    setup.executemany('INSERT INTO src VALUES (?)', [(1,), (2,)])
+    setup.execute("CREATE TABLE 'main.dbo.TablesToConvert_base'(RowID INTEGER PRIMARY KEY, ScopeRowCount INTEGER, CopySeconds REAL, CopyStatus TEXT)")
+    setup.executemany("INSERT INTO 'main.dbo.TablesToConvert_base' (RowID, ScopeRowCount) VALUES (?, 0)", [(i,) for i in range(1, 5)])
+    setup.commit()
+    setup.close()
+
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'include_empty_tables': True,
+        'log_file': str(tmp_path / 'err.log'),
+        'table_workers': 3,
+    }
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+    importer.checkpoints = CheckpointStore(str(tmp_path / 'checkpoints.json'))
+
+    rows = [
+        {
+            'RowID': i,
+            'Drop_IfExists': f'DROP TABLE IF EXISTS dest{i}',
+            'Select_Into': f'CREATE TABLE dest{i} AS SELECT * FROM src',
+            'TableName': f'dest{i}',
+            'SchemaName': 'main',
+            'ScopeRowCount': 0,
+            'fConvert': 1,
+        }
+        for i in range(1, 5)
+    ]
+    monkeypatch.setattr(importer, '_fetch_table_operation_rows', lambda *a: rows)
+    monkeypatch.setattr(
+        'etl.base_importer.get_target_connection',
+        lambda: sqlite3.connect(db_path, timeout=30, check_same_thread=False),
+    )
+
+    def fake_exec(c, sql, params=None, timeout=100):
+        sql = sql.replace("main.dbo.TablesToConvert_base", "'main.dbo.TablesToConvert_base'")
+        if "ROWCOUNT_BIG()" in sql:
+            inner = _inner_select_into(sql)
+            c.execute(inner)
+            return c.execute(f"SELECT COUNT(*) FROM {inner.split()[2]}")
+        if params:
+            return c.execute(sql, params)
+        return c.execute(sql)
+
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', fake_exec)
+
+    main_conn = sqlite3.connect(db_path, timeout=30)
+    importer.execute_table_operations(main_conn)
+
+    check = sqlite3.connect(db_path)
+    for i in range(1, 5):
+        assert check.execute(f'SELECT COUNT(*) FROM dest{i}').fetchone()[0] == 2
+    counts = check.execute("SELECT ScopeRowCount, CopyStatus FROM 'main.dbo.TablesToConvert_base'").fetchall()
+    assert counts == [(2, 'done')] * 4
+    assert importer.progress.get('table_operations') == 4
+
+
+def test_execute_table_operations_parallel_captures_errors(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'log_file': str(tmp_path / 'err.log'),
+        'table_workers': 2,
+    }
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+    importer.checkpoints = CheckpointStore(str(tmp_path / 'checkpoints.json'))
+
+    rows = [{'RowID': i, 'SchemaName': 'dbo', 'TableName': f't{i}'} for i in range(1, 4)]
+    monkeypatch.setattr(importer, '_fetch_table_operation_rows', lambda *a: rows)
+
+    class DummyConn:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    monkeypatch.setattr('etl.base_importer.get_target_connection', DummyConn)
+
+    from utils.etl_helpers import SQLExecutionError
+    processed = []
+
+    def fake_process(conn, row, idx, log_file):
+        processed.append(row['TableName'])
+        if row['TableName'] == 't1':
+            raise SQLExecutionError('SELECT', Exception('boom'), table_name='dbo.t1')
+        return True
+
+    monkeypatch.setattr(importer, '_process_table_operation_row', fake_process)
+
+    with pytest.raises(SQLExecutionError):
+        importer.execute_table_operations(DummyConn())
+
+    assert sorted(processed) == ['t1', 't2', 't3']
+    # Tables that finished after the failure are still checkpointed
+    assert importer.progress.get('table_operations') == 2
+    assert importer.checkpoints.status('table_operations', 1) == 'failed'
+    assert importer.checkpoints.is_done('table_operations', 2)
+    assert importer.checkpoints.is_done('table_operations', 3)
+    assert 'dbo.t1' in (tmp_path / 'err.log').read_text()
+
+
+def test_process_table_row_loads_statements_lazily(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {'sql_timeout': 100, 'log_file': str(tmp_path / 'err.log')}
+    importer.db_name = 'main'
+
+    queries = []
+
+    class Result:
+        def __init__(self, row):
+            self.row = row
+
+        def fetchone(self):
+            return self.row
+
+    def fake_exec(c, sql, params=None, timeout=100):
+        queries.append(sql)
+        return Result(('DROP TABLE IF EXISTS main.dbo.dest', 'SELECT A.[id] INTO main.dbo.dest FROM src A'))
+
+    executed = []
+
+    def fake_sanitize(c, sql, params=None, timeout=100):
+        executed.append(sql)
+        return Result((5,))
+
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', fake_sanitize)
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+    header = {'RowID': 9, 'SchemaName': 'dbo', 'TableName': 'dest', 'fConvert': 1, 'ScopeRowCount': 4}
+
+    assert importer._process_table_operation_row(DummyConn(), header, 1, importer.config['log_file']) is True
+    assert len(queries) == 1 and 'WHERE S.RowID = 9' in queries[0]
+    assert executed[0] == 'DROP TABLE IF EXISTS main.dbo.dest'
+    assert importer.table_results.get(9).row_count == 5
+
+
+def test_copy_large_table_resumes_from_checkpoint(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'log_file': str(tmp_path / 'err.log'),
+        'large_table_row_threshold': 1000,
+        'large_table_slice_rows': 500,
+    }
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+
+    row = {
+        'RowID': 3,
+        'DatabaseName': 'Justice',
+        'SchemaName': 'dbo',
+        'TableName': 'big',
+        'RowCount': 2000,
+        'fConvert': 1,
+        'Drop_IfExists': 'DROP TABLE IF EXISTS main.[dbo].[big]',
+        'Select_Into': 'SELECT DISTINCT A.[id] INTO main.[dbo].[big] FROM Justice.[dbo].[big] A WITH (NOLOCK) ',
+    }
+    # Two of four slices finished before the previous run stopped
+    importer.progress.set_state(
+        'large_table:justice.dbo.big',
+        {'key': 'id', 'slices': [[1, 26], [26, 51], [51, 76], [76, 101]], 'done': {'0': 25, '1': 25}},
+    )
+
+    class Result:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def fetchone(self):
+            return self.rows[0] if self.rows else None
+
+        def fetchall(self):
+            return self.rows
+
+    def fake_exec(c, sql, params=None, timeout=100):
+        if 'sys.indexes' in sql:
+            return Result([('id',)])
+        if 'sys.columns' in sql:
+            return Result([('id', 0)])
+        raise AssertionError(f'unexpected query {sql}')
+
+    executed = []
+
+    def fake_sanitize(c, sql, params=None, timeout=100):
+        executed.append(sql)
+        return Result([(20,)])
+
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', fake_sanitize)
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+    assert importer._process_table_operation_row(DummyConn(), row, 1, importer.config['log_file']) is True
+
+    assert len(executed) == 2
+    assert all(sql.startswith('DECLARE @rows BIGINT') for sql in executed)
+    assert '[id] >= 51 AND [id] < 76' in executed[0]
+    assert importer.table_results.get(3).row_count == 90
+    assert importer.progress.get_state('large_table:justice.dbo.big') is None
+
+
+def test_copy_large_table_keeps_finished_slices_after_failure(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {'sql_timeout': 100, 'log_file': str(tmp_path / 'err.log'), 'large_table_slice_rows': 500}
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    row = {'RowID': 3, 'DatabaseName': 'Justice', 'SchemaName': 'dbo', 'TableName': 'big', 'RowCount': 2000}
+    importer.progress.set_state(
+        'large_table:justice.dbo.big', {'key': 'id', 'slices': [[1, 26], [26, 51], [51, 76]], 'done': {}}
+    )
+
+    class Result:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def fetchone(self):
+            return self.rows[0]
+
+        def fetchall(self):
+            return self.rows
+
+    def fake_exec(c, sql, params=None, timeout=100):
+        return Result([('id',)] if 'sys.indexes' in sql else [('id', 0)])
+
+    executed = []
+    failures = ['[id] >= 26 AND [id] < 51']
+
+    def flaky_sanitize(c, sql, params=None, timeout=100):
+        executed.append(sql)
+        if failures and failures[0] in sql:
+            failures.pop()
+            raise RuntimeError('slice timed out')
+        return Result([(25,)])
+
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', flaky_sanitize)
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+    args = (
+        row,
+        'DROP TABLE IF EXISTS main.[dbo].[big]',
+        'SELECT A.[id] INTO main.[dbo].[big] FROM Justice.[dbo].[big] A',
+        1,
+    )
+    with pytest.raises(RuntimeError):
+        importer._copy_large_table(DummyConn(), *args)
+    assert importer.progress.get_state('large_table:justice.dbo.big')['done'] == {'0': 25}
+
+    executed.clear()
+    assert importer._copy_large_table(DummyConn(), *args) == 75
+    assert len(executed) == 2
+    assert '[id] >= 26 AND [id] < 51' in executed[0] and '[id] >= 51 AND [id] < 76' in executed[1]
+    assert importer.progress.get_state('large_table:justice.dbo.big') is None
+
+
+def test_execute_table_operations_resumes_by_row_id(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {'sql_timeout': 100, 'log_file': str(tmp_path / 'err.log'), 'table_workers': 1}
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+    importer.checkpoints = CheckpointStore(str(tmp_path / 'checkpoints.json'))
+
+    # The earlier run finished RowID 3 but not RowID 1, which came first
+    rows = [{'RowID': i, 'DatabaseName': 'Justice', 'SchemaName': 'dbo', 'TableName': f't{i}'} for i in (1, 2, 3)]
+    importer.checkpoints.complete('table_operations', 3, 'justice.dbo.t3')
+    importer.checkpoints.fail('table_operations', 1, 'justice.dbo.t1', error='timeout')
+    monkeypatch.setattr(importer, '_fetch_table_operation_rows', lambda *a: rows)
+
+    processed = []
+    monkeypatch.setattr(
+        importer, '_process_table_operation_row', lambda c, row, idx, log: processed.append(row['RowID']) or True
+    )
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    importer.execute_table_operations(DummyConn())
+
+    assert processed == [1, 2]
+    assert all(importer.checkpoints.is_done('table_operations', i) for i in (1, 2, 3))
+
+
+def test_execute_table_operations_retries_deadlocked_table(tmp_path, monkeypatch):
+    from utils.retry_policy import RetryBudget, RetryPolicy
+
+    importer = BaseDBImporter()
+    importer.config = {'sql_timeout': 100, 'log_file': str(tmp_path / 'err.log'), 'table_workers': 2}
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+    importer.checkpoints = CheckpointStore(str(tmp_path / 'checkpoints.json'))
+    importer.retry_policy = RetryPolicy(max_attempts=3, budget=RetryBudget(5), sleep=lambda s: None)
+
+    rows = [{'RowID': i, 'SchemaName': 'dbo', 'TableName': f't{i}'} for i in (1, 2)]
+    monkeypatch.setattr(importer, '_fetch_table_operation_rows', lambda *a: rows)
+
+    connections = []
+
+    class DummyConn:
+        def __init__(self):
+            connections.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    monkeypatch.setattr('etl.base_importer.get_target_connection', DummyConn)
+
+    from utils.etl_helpers import SQLExecutionError
+    attempts = []
+
+    def fake_process(conn, row, idx, log_file):
+        attempts.append((row['TableName'], conn))
+        if row['TableName'] == 't1' and len([a for a in attempts if a[0] == 't1']) == 1:
+            deadlock = sys.modules['pyodbc'].Error('40001', 'Transaction was deadlocked (1205)')
+            raise SQLExecutionError('SELECT', deadlock, table_name='dbo.t1')
+        return True
+
+    monkeypatch.setattr(importer, '_process_table_operation_row', fake_process)
+
+    importer.execute_table_operations(DummyConn())
+
+    t1_conns = [conn for name, conn in attempts if name == 't1']
+    assert len(t1_conns) == 2 and t1_conns[0] is not t1_conns[1]
+    assert importer.checkpoints.is_done('table_operations', 1)
+    assert importer.retry_policy.budget.remaining == 4
+
+
+def test_plan_run_copies_no_data(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'log_file': str(tmp_path / 'err.log'),
+        'table_workers': 2,
+        'plan_file': str(tmp_path / 'plan.json'),
+    }
+    importer.DB_TYPE = 'Justice'
+    importer.db_name = 'main'
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+
+    gathered = []
+    monkeypatch.setattr(importer, 'prepare_plan_tables', lambda conn, table: gathered.append(table), raising=False)
+
+    def no_rebuild(*args):
+        raise AssertionError('plan mode must not rebuild TablesToConvert')
+
+    monkeypatch.setattr(importer, 'prepare_drop_and_select', no_rebuild, raising=False)
+
+    class Result:
+        def __init__(self, data, columns=()):
+            self.data = data
+            self.description = [(c,) for c in columns]
+
+        def fetchone(self):
+            return self.data[0]
+
+        def fetchall(self):
+            return self.data
+
+    queries = []
+
+    def fake_exec(c, sql, params=None, timeout=100):
+        queries.append(sql)
+        if 'OBJECT_ID' in sql:
+            return Result([(123,)])
+        if 'TUS.fConvert=1' in sql:
+            return Result(
+                [(1, 'Justice', 'dbo', 'a', 1, 7, 10)],
+                ['RowID', 'DatabaseName', 'SchemaName', 'TableName', 'fConvert', 'ScopeRowCount', 'RowCount'],
+            )
+        if 'DROP TABLE' in sql:
+            return Result([])
+        return Result([('dbo', 'a', 50000, 8192 * 10)])
+
+    def no_copy(*args, **kwargs):
+        raise AssertionError('plan mode must not execute copy statements')
+
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_exec)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', no_copy)
+
+    class DummyConn:
+        def commit(self):
+            pass
+
+        def rollback(self):
+            pass
+
+    plan = importer.plan_run(DummyConn())
+
+    assert gathered == ['#TablesToConvert_Plan']
+    plan_query = next(q for q in queries if 'TUS.fConvert=1' in q)
+    assert 'FROM #TablesToConvert_Plan S' in plan_query
+    assert 'main.dbo.TablesToConvert ' not in ''.join(queries)
+    assert queries[-1] == 'DROP TABLE IF EXISTS #TablesToConvert_Plan'
+    assert any('Justice.sys.dm_db_partition_stats' in q for q in queries)
+    assert plan['tables'][0]['rows'] == 50000
+    assert plan['phases']['table_operations']['workers'] == 2
+    assert (tmp_path / 'plan.json').exists()
+
+
+class _RawConnection:
+    def __init__(self):
+        self.commits = 0
+
+    def cursor(self):
+        return types.SimpleNamespace(execute=lambda *a, **k: None, close=lambda: None)
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        pass
+
+
+def _joins_importer(tmp_path, monkeypatch, current):
+    csv_path = tmp_path / "EJ_Base_Selects_ALL.csv"
+    csv_path.write_text("TableName|Freq\nA|1\n", encoding="utf-8")
+    importer = BaseDBImporter()
+    importer.config = {
+        "csv_file": str(csv_path),
+        "log_file": str(tmp_path / "log.txt"),
+        "csv_chunk_size": 10,
+        "reuse_joins_import": True,
+    }
+    raw_conn = _RawConnection()
+    engine = types.SimpleNamespace(raw_connection=lambda: raw_conn)
+    monkeypatch.setattr("etl.base_importer.get_target_engine", lambda: engine)
+    monkeypatch.setattr("etl.base_importer.import_is_current", lambda *a: current)
+    loads = []
+    saved = []
+    monkeypatch.setattr(
+        "etl.base_importer.load_frames",
+        lambda *a, **k: loads.append(a) or types.SimpleNamespace(rows=1, rows_per_second=1.0),
+    )
+    monkeypatch.setattr("etl.base_importer.save_fingerprint", lambda cursor, table, fp, rows: saved.append((table, rows)))
+    return importer, loads, saved
+
+
+def test_import_joins_skips_unchanged_csv(tmp_path, monkeypatch):
+    importer, loads, saved = _joins_importer(tmp_path, monkeypatch, current=True)
+    importer.import_joins()
+    assert loads == []
+    assert saved == []
+
+
+def test_import_joins_records_fingerprint_after_load(tmp_path, monkeypatch):
+    importer, loads, saved = _joins_importer(tmp_path, monkeypatch, current=False)
+    importer.import_joins()
+    assert len(loads) == 1
+    assert saved == [("TableUsedSelects_base", 1)]
+
+
+def test_import_joins_does_not_cache_load_with_rejects(tmp_path, monkeypatch):
+    importer, loads, saved = _joins_importer(tmp_path, monkeypatch, current=False)
+    monkeypatch.setattr(
+        "etl.base_importer.normalized_chunks",
+        lambda path, size, rejected: rejected.append(RejectedRow(2, "Freq", "x")) or [],
+    )
+    importer.import_joins()
+    assert len(loads) == 1
+    assert saved == []
+
+
+def _pk_importer(tmp_path, monkeypatch, workers, rows):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'include_empty_tables': True,
+        'skip_pk_creation': False,
+        'log_file': str(tmp_path / 'err.log'),
+        'pk_workers': workers,
+    }
+    importer.db_name = 'main'
+    importer.progress = ProgressTracker(str(tmp_path / 'prog.json'))
+    importer.duration_history = TableDurationHistory(str(tmp_path / 'durations.json'))
+    importer.checkpoints = CheckpointStore(str(tmp_path / 'checkpoints.json'))
+    monkeypatch.setattr(importer, 'run_sql_file', lambda *a: None)
+    monkeypatch.setattr(importer, '_fetch_pk_rows', lambda *a: rows)
+    return importer
+
+
+class _PkConn:
+    def execute(self, *a, **k):
+        return types.SimpleNamespace(fetchone=lambda: (1,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def test_create_primary_keys_parallel_keeps_table_order(tmp_path, monkeypatch):
+    import threading
+
+    rows = []
+    for table in ('a', 'b', 'c'):
+        rows.append({'RowID': len(rows) + 1, 'SchemaName': 'dbo', 'TableName': table, 'TYPEY': 1, 'ScopeRowCount': 1})
+        rows.append({'RowID': len(rows) + 1, 'SchemaName': 'dbo', 'TableName': table, 'TYPEY': 2, 'ScopeRowCount': 1})
+    importer = _pk_importer(tmp_path, monkeypatch, 3, rows)
+    monkeypatch.setattr('etl.base_importer.get_target_connection', _PkConn)
+
+    executed = []
+    lock = threading.Lock()
+
+    def fake_pk_group(conn, group, idx, log_file):
+        with lock:
+            executed.append((group[0]['TableName'], [row['TYPEY'] for row in group], threading.current_thread().name))
+
+    monkeypatch.setattr(importer, '_process_pk_group', fake_pk_group)
+    importer.create_primary_keys(_PkConn())
+
+    assert sorted(name for name, _, _ in executed) == ['a', 'b', 'c']
+    for _, typeys, thread in executed:
+        assert typeys == [1, 2]
+        assert thread.startswith('etl-worker')
+    # One checkpoint per table, on the row the resume check reads
+    assert importer.checkpoints.count('pk_creation') == 3
+    assert all(importer.checkpoints.is_done('pk_creation', row_id) for row_id in (2, 4, 6))
+    assert importer.progress.get('pk_creation') == 3
+
+
+def test_create_primary_keys_parallel_reports_failed_table(tmp_path, monkeypatch):
+    rows = [
+        {'RowID': 1, 'SchemaName': 'dbo', 'TableName': 'a', 'TYPEY': 2, 'ScopeRowCount': 1},
+        {'RowID': 2, 'SchemaName': 'dbo', 'TableName': 'b', 'TYPEY': 2, 'ScopeRowCount': 1},
+    ]
+    importer = _pk_importer(tmp_path, monkeypatch, 2, rows)
+    monkeypatch.setattr('etl.base_importer.get_target_connection', _PkConn)
+
+    def fake_pk_group(conn, group, idx, log_file):
+        if group[0]['TableName'] == 'a':
+            raise pyodbc_error('duplicate key')
+
+    pyodbc_error = sys.modules['etl.base_importer'].pyodbc.Error
+    monkeypatch.setattr(importer, '_process_pk_group', fake_pk_group)
+
+    with pytest.raises(pyodbc_error):
+        importer.create_primary_keys(_PkConn())
+    assert importer.checkpoints.is_done('pk_creation', 2)
+    assert importer.checkpoints.status('pk_creation', 1) == 'failed'
+
+
+def test_process_pk_group_skips_satisfied_not_null_alters(tmp_path, monkeypatch):
+    importer = _pk_importer(tmp_path, monkeypatch, 1, [])
+    group = [
+        {'RowID': 1, 'SchemaName': 'dbo', 'TableName': 'a', 'TYPEY': 1, 'ScopeRowCount': 1,
+         'Script': 'ALTER TABLE [main].[dbo].[a] ALTER COLUMN [Id] INT NOT NULL'},
+        {'RowID': 2, 'SchemaName': 'dbo', 'TableName': 'a', 'TYPEY': 1, 'ScopeRowCount': 1,
+         'Script': 'ALTER TABLE [main].[dbo].[a] ALTER COLUMN [Seq] SMALLINT NOT NULL'},
+        {'RowID': 3, 'SchemaName': 'dbo', 'TableName': 'a', 'TYPEY': 2, 'ScopeRowCount': 1,
+         'Script': 'ALTER TABLE [main].[dbo].[a] ADD CONSTRAINT [PK_a] PRIMARY KEY ([Id], [Seq])'},
+    ]
+    executed = []
+    monkeypatch.setattr(importer, '_nullable_columns', lambda conn, schema, table: {'seq', 'other'})
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', lambda conn, sql, timeout=None: executed.append(sql))
+
+    batch = importer._process_pk_group(_PkConn(), group, 1, str(tmp_path / 'err.log'))
+
+    assert len(executed) == 1
+    assert 'ALTER COLUMN [Id]' not in executed[0]
+    assert 'ALTER COLUMN [Seq] SMALLINT NOT NULL;' in executed[0]
+    assert executed[0].endswith('PRIMARY KEY ([Id], [Seq]);')
+    assert (batch.statements, batch.statements_run, batch.skipped_not_null) == (3, 2, 1)
+
+
+def test_process_pk_group_applies_table_index_options(tmp_path, monkeypatch):
+    importer = _pk_importer(tmp_path, monkeypatch, 1, [])
+    importer.config['pk_index_options'] = validate_index_options({'sort_in_tempdb': True, 'MAXDOP': 4})
+    importer.config['pk_index_options_by_table'] = {'dbo.a': validate_index_options({'MAXDOP': 8, 'DATA_COMPRESSION': 'page'})}
+    group = [
+        {'RowID': 1, 'SchemaName': 'dbo', 'TableName': 'a', 'TYPEY': 2, 'ScopeRowCount': 1,
+         'Script': 'ALTER TABLE [main].[dbo].[a] ADD CONSTRAINT [PK_a] PRIMARY KEY ([Id])'},
+    ]
+    executed = []
+    monkeypatch.setattr(importer, '_nullable_columns', lambda conn, schema, table: None)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', lambda conn, sql, timeout=None: executed.append(sql))
+
+    importer._process_pk_group(_PkConn(), group, 1, str(tmp_path / 'err.log'))
+
+    assert executed == [
+        'ALTER TABLE [main].[dbo].[a] ADD CONSTRAINT [PK_a] PRIMARY KEY ([Id]) '
+        'WITH (SORT_IN_TEMPDB = ON, MAXDOP = 8, DATA_COMPRESSION = PAGE);'
+    ]
+
+
+@pytest.mark.parametrize('options', [
+    {'MAXDOP': -1},
+    {'FILLFACTOR': 0},
+    {'DATA_COMPRESSION': 'COLUMNSTORE'},
+    {'ONLINE': 'maybe'},
+    {'PAD_INDEX': 'ON'},
+])
+def test_validate_index_options_rejects_bad_values(options):
+    with pytest.raises(ConfigError):
+        validate_index_options(options)
+
+
+def test_pipelined_builds_index_tables_while_others_copy(tmp_path, monkeypatch):
+    import threading
+
+    copy_rows = [
+        {'RowID': 1, 'DatabaseName': 'src', 'SchemaName': 'dbo', 'TableName': 'a', 'fConvert': 1, 'ScopeRowCount': 5, 'RowCount': 30},
+        {'RowID': 2, 'DatabaseName': 'src', 'SchemaName': 'dbo', 'TableName': 'b', 'fConvert': 1, 'ScopeRowCount': 5, 'RowCount': 20},
+        {'RowID': 3, 'DatabaseName': 'src', 'SchemaName': 'dbo', 'TableName': 'e', 'fConvert': 1, 'ScopeRowCount': 5, 'RowCount': 10},
+        {'RowID': 4, 'DatabaseName': 'src', 'SchemaName': 'dbo', 'TableName': 'c', 'fConvert': 1, 'ScopeRowCount': 5, 'RowCount': 5},
+    ]
+    pk_rows = [
+        {'RowID': n, 'DatabaseName': 'main', 'SchemaName': 'dbo', 'TableName': t, 'TYPEY': 2, 'ScopeRowCount': 5}
+        for n, t in enumerate(('a', 'b', 'c', 'e'), 1)
+    ]
+    importer = _pk_importer(tmp_path, monkeypatch, 1, pk_rows)
+    importer.config.update(table_workers=1, include_empty_tables=False, always_include_tables=[])
+    monkeypatch.setattr('etl.base_importer.get_target_connection', _PkConn)
+    monkeypatch.setattr(importer, '_fetch_table_operation_rows', lambda *a: copy_rows)
+    monkeypatch.setattr(importer, '_flush_table_results', lambda *a: None)
+    importer.checkpoints.complete('table_operations', 4, 'src.dbo.c')
+
+    a_indexed = threading.Event()
+    events = []
+
+    def fake_copy(idx, row_dict, log_file):
+        if row_dict['TableName'] == 'b':
+            # The copy of b only finishes once a's PK has been built
+            assert a_indexed.wait(5)
+        events.append(('copy', row_dict['TableName']))
+        importer._record_table_result(row_dict['RowID'], 0 if row_dict['TableName'] == 'e' else 5, 0.1)
+        return True
+
+    def fake_pk_group(conn, group, idx, log_file):
+        events.append(('pk', group[0]['TableName']))
+        if group[0]['TableName'] == 'a':
+            a_indexed.set()
+
+    monkeypatch.setattr(importer, '_copy_table', fake_copy)
+    monkeypatch.setattr(importer, '_process_pk_group', fake_pk_group)
+    monkeypatch.setattr(
+        importer, '_drop_tables',
+        lambda conn, tables, log_file: events.extend(('drop', table) for _, table in tables),
+    )
+
+    importer.execute_pipelined_builds(_PkConn())
+
+    assert events.index(('pk', 'a')) < events.index(('copy', 'b'))
+    assert ('drop', 'e') in events and ('pk', 'e') not in events
+    assert ('pk', 'c') in events and ('copy', 'c') not in events
+    assert sorted(e for e in events if e[0] == 'pk') == [('pk', 'a'), ('pk', 'b'), ('pk', 'c')]
+    assert importer.checkpoints.count('table_operations') == 4
+    assert importer.checkpoints.count('pk_creation') == 3
+
+
+def test_pipelined_pk_uses_copied_row_count(tmp_path, monkeypatch):
+    copy_rows = [
+        {'RowID': 1, 'DatabaseName': 'src', 'SchemaName': 'dbo', 'TableName': 'a', 'fConvert': 1, 'ScopeRowCount': 0, 'RowCount': 5},
+    ]
+    pk_rows = [
+        {'RowID': 1, 'DatabaseName': 'main', 'SchemaName': 'dbo', 'TableName': 'a', 'TYPEY': 2, 'ScopeRowCount': 0,
+         'Script': 'ALTER TABLE [main].[dbo].[a] ADD CONSTRAINT [PK_a] PRIMARY KEY ([Id])'},
+    ]
+    importer = _pk_importer(tmp_path, monkeypatch, 1, pk_rows)
+    importer.config.update(table_workers=1, include_empty_tables=False, always_include_tables=[])
+    monkeypatch.setattr('etl.base_importer.get_target_connection', _PkConn)
+    monkeypatch.setattr(importer, '_fetch_table_operation_rows', lambda *a: copy_rows)
+    monkeypatch.setattr(importer, '_flush_table_results', lambda *a: None)
+    monkeypatch.setattr(importer, '_nullable_columns', lambda conn, schema, table: None)
+
+    def fake_copy(idx, row_dict, log_file):
+        # The spreadsheet said 0 rows but the source probe found data
+        importer._record_table_result(row_dict['RowID'], 5, 0.1)
+        return True
+
+    executed = []
+    monkeypatch.setattr(importer, '_copy_table', fake_copy)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', lambda conn, sql, timeout=None: executed.append(sql))
+
+    importer.execute_pipelined_builds(_PkConn())
+
+    assert len(executed) == 1 and 'PRIMARY KEY ([Id])' in executed[0]
+    assert importer.checkpoints.count('pk_creation') == 1
+
+
+def test_drop_empty_tables_batches_and_honours_overrides(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'include_empty_tables': False,
+        'log_file': str(tmp_path / 'err.log'),
+        'always_include_tables': ['dbo.keep'],
+    }
+    importer.db_name = 'main'
+    rows = [('dbo', 'a'), ('dbo', 'keep'), ('dbo', 'b'), ('dbo', 'c')]
+    monkeypatch.setattr(
+        'etl.base_importer.execute_sql_with_timeout',
+        lambda conn, sql, timeout=None: types.SimpleNamespace(
+            description=[('SchemaName',), ('TableName',)], fetchall=lambda: rows
+        ),
+    )
+    monkeypatch.setattr('etl.base_importer.ETLConstants.DROP_BATCH_SIZE', 2)
+    executed = []
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', lambda conn, sql, timeout=None: executed.append(sql))
+
+    importer.drop_empty_tables(_PkConn())
+
+    assert executed == ['DROP TABLE IF EXISTS dbo.a, dbo.b', 'DROP TABLE IF EXISTS dbo.c']
+
+    executed.clear()
+    importer.config['include_empty_tables'] = True
+    importer.drop_empty_tables(_PkConn())
+    assert executed == []
+
+
+def test_process_table_row_skips_copy_only_when_source_is_empty(tmp_path, monkeypatch):
+    importer = BaseDBImporter()
+    importer.config = {
+        'sql_timeout': 100,
+        'include_empty_tables': False,
+        'log_file': str(tmp_path / 'err.log'),
+        'always_include_tables': ['dbo.kept'],
+    }
+    importer.db_name = 'main'
+    monkeypatch.setattr(importer, '_load_table_statements', lambda conn, row_id: {
+        'Drop_IfExists': f'DROP TABLE IF EXISTS main.dbo.t{row_id}',
+        'Select_Into': f'SELECT A.* INTO main.dbo.t{row_id} FROM src.dbo.t{row_id} A WHERE A.x = 1',
+    })
+    source_rows = {}
+    probes = []
+
+    def fake_execute(conn, sql, params=None, timeout=None):
+        probes.append(sql)
+        row_id = int(sql.split('src.dbo.t')[1].split()[0])
+        return types.SimpleNamespace(fetchone=lambda: (1,) if source_rows.get(row_id) else None)
+
+    copies = []
+    monkeypatch.setattr('etl.base_importer.execute_sql_with_timeout', fake_execute)
+    monkeypatch.setattr('etl.base_importer.sanitize_sql', lambda conn, sql, timeout=None: None)
+    monkeypatch.setattr(
+        importer, '_select_into_with_rowcount', lambda conn, sql: copies.append(sql) or 5
+    )
+    row = {'RowID': 7, 'SchemaName': 'dbo', 'TableName': 'empty', 'ScopeRowCount': 0, 'fConvert': 1}
+
+    # ScopeRowCount 0 and the source really is empty: no copy.
+    assert importer._process_table_operation_row(_PkConn(), row, 1, importer.config['log_file']) is True
+    assert probes == ['SELECT TOP (1) 1 FROM src.dbo.t7 A WHERE A.x = 1']
+    assert copies == []
+    assert importer.table_results.get(7).row_count == 0
+
+    # A stale ScopeRowCount of 0 for a source that has rows is still copied.
+    source_rows[9] = True
+    stale = dict(row, RowID=9, TableName='stale')
+    importer._process_table_operation_row(_PkConn(), stale, 2, importer.config['log_file'])
+    assert len(copies) == 1
+    assert importer.table_results.get(9).row_count == 5
+
+    # Kept tables are copied without probing.
+    probes.clear()
+    kept = dict(row, RowID=8, TableName='kept')
+    importer._process_table_operation_row(_PkConn(), kept, 3, importer.config['log_file'])
+    assert probes == []
+    assert len(copies) == 2
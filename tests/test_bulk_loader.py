@@ -0,0 +1,105 @@
+from etl.bulk_loader import (
+    MAX_SIZED_NVARCHAR,
+    SQL_WVARCHAR,
+    insert_rows,
+    load_delimited_file,
+)
+
+
+class FakeCursor:
+    def __init__(self):
+        self.fast_executemany = False
+        self.statements = []
+        self.batches = []
+        self.sizes = []
+        self.closed = False
+
+    def execute(self, sql):
+        self.statements.append(sql)
+
+    def setinputsizes(self, sizes):
+        self.sizes.append(sizes)
+
+    def executemany(self, sql, rows):
+        self.batches.append((sql, list(rows)))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.cursor_obj = FakeCursor()
+        self.commits = 0
+
+    def cursor(self):
+        return self.cursor_obj
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_insert_rows_uses_fast_executemany_with_sized_parameters():
+    cursor = FakeCursor()
+    long_value = "x" * (MAX_SIZED_NVARCHAR + 1)
+    sent = insert_rows(cursor, "T", ["A", "B", "C"], [("ab", None, long_value), ("abcd", None, "y")])
+
+    assert sent == 2
+    assert cursor.fast_executemany is True
+    assert cursor.sizes == [[(SQL_WVARCHAR, 4, 0), (SQL_WVARCHAR, 0, 0), (SQL_WVARCHAR, 0, 0)]]
+    sql, rows = cursor.batches[0]
+    assert sql == "INSERT INTO T ([A], [B], [C]) VALUES (?, ?, ?)"
+    assert len(rows) == 2
+
+
+def test_load_delimited_file_creates_table_and_inserts_chunks(tmp_path):
+    csv_path = tmp_path / "selects.csv"
+    csv_path.write_text("TableName|Freq|Comment\nA|1|x\nB|2|\nC|3|z\n", encoding="utf-8")
+    conn = FakeConnection()
+
+    stats = load_delimited_file(conn, str(csv_path), "TableUsedSelects", chunksize=2, str_columns=["TableName", "Freq"])
+
+    cursor = conn.cursor_obj
+    assert stats.rows == 3
+    assert conn.commits == 2
+    assert cursor.closed
+    assert cursor.statements[0] == "DROP TABLE IF EXISTS TableUsedSelects"
+    assert cursor.statements[1].startswith("CREATE TABLE TableUsedSelects ([TableName] NVARCHAR(MAX) NULL")
+    rows = [row for _, batch in cursor.batches for row in batch]
+    # Missing values outside the string columns are sent as NULL.
+    assert rows == [("A", "1", "x"), ("B", "2", None), ("C", "3", "z")]
+
+
+def test_typed_columns_are_created_and_bound_as_numbers():
+    import pandas as pd
+
+    from etl.bulk_loader import SQL_BIT, SQL_INTEGER, load_frames
+
+    conn = FakeConnection()
+    frame = pd.DataFrame({"TableName": ["A"], "Freq": [5], "fConvert": [True]})
+    types = {"Freq": "INT NOT NULL", "fConvert": "BIT NOT NULL"}
+
+    load_frames(conn, [frame], "T", str_columns=["TableName"], column_types=types)
+
+    cursor = conn.cursor_obj
+    assert cursor.statements[1] == (
+        "CREATE TABLE T ([TableName] NVARCHAR(MAX) NULL, [Freq] INT NOT NULL, [fConvert] BIT NOT NULL)"
+    )
+    assert cursor.sizes == [[(SQL_WVARCHAR, 1, 0), (SQL_INTEGER, 0, 0), (SQL_BIT, 0, 0)]]
+    assert cursor.batches[0][1] == [("A", 5, True)]
+    assert type(cursor.batches[0][1][0][1]) is int
+
+
+def test_load_frames_recreates_table_without_frames():
+    from etl.bulk_loader import load_frames
+
+    conn = FakeConnection()
+    stats = load_frames(conn, [], "T", columns=["TableName", "Freq"], column_types={"Freq": "INT NOT NULL"})
+
+    cursor = conn.cursor_obj
+    assert stats.rows == 0
+    assert cursor.statements == [
+        "DROP TABLE IF EXISTS T",
+        "CREATE TABLE T ([TableName] NVARCHAR(MAX) NULL, [Freq] INT NOT NULL)",
+    ]
+    assert conn.commits == 1
@@ -160,3 +160,76 @@ def test_end_to_end_full_importer(monkeypatch, tmp_path):
 
     conn.close()
 
+
+
+class OverlapImporter(MiniImporter):
+    """Records how the joins import interleaves with the scope scripts."""
+
+    DB_TYPE = "Overlap"
+
+    def __init__(self):
+        super().__init__()
+        import threading
+
+        self.scope_done = threading.Event()
+        self.events = []
+
+    def prepare_drop_and_select(self, conn):
+        self.scope_done.set()
+
+    def import_joins(self):
+        import threading
+
+        # Only completes if the scope scripts run while the import is in flight.
+        assert self.scope_done.wait(timeout=5)
+        self.events.append(("import_joins", threading.current_thread().name))
+
+    def update_joins_in_tables(self, conn):
+        self.events.append(("update_joins", None))
+
+
+def test_joins_import_overlaps_scope_scripts(monkeypatch, tmp_path):
+    monkeypatch.setenv("MSSQL_TARGET_CONN_STR", "Driver=SQLite;Database=:memory:")
+    monkeypatch.setenv("EJ_CSV_DIR", str(tmp_path))
+    monkeypatch.setenv("EJ_LOG_DIR", str(tmp_path))
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    monkeypatch.setattr(connections, "get_target_connection", lambda: conn)
+    monkeypatch.setattr("etl.base_importer.get_target_connection", lambda: conn)
+
+    importer = OverlapImporter()
+    assert importer.run() is False
+
+    assert [name for name, _ in importer.events] == ["import_joins", "update_joins"]
+    assert importer.events[0][1].startswith("joins-import")
+    conn.close()
+
+
+class FailingImporter(MiniImporter):
+    """Preprocessing and the background joins import both fail."""
+
+    DB_TYPE = "Failing"
+
+    def execute_preprocessing(self, conn):
+        raise RuntimeError("preprocessing failed")
+
+    def import_joins(self):
+        raise ValueError("bad joins csv")
+
+
+def test_joins_import_error_is_reported_when_preprocessing_fails(monkeypatch, tmp_path, caplog):
+    monkeypatch.setenv("MSSQL_TARGET_CONN_STR", "Driver=SQLite;Database=:memory:")
+    monkeypatch.setenv("EJ_CSV_DIR", str(tmp_path))
+    monkeypatch.setenv("EJ_LOG_DIR", str(tmp_path))
+
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    monkeypatch.setattr(connections, "get_target_connection", lambda: conn)
+    monkeypatch.setattr("etl.base_importer.get_target_connection", lambda: conn)
+
+    importer = FailingImporter()
+    assert importer.run() is False
+
+    joins_errors = [r for r in caplog.records if r.message == "Background joins import failed"]
+    assert len(joins_errors) == 1
+    assert "bad joins csv" in str(joins_errors[0].exc_info[1])
+    conn.close()
@@ -0,0 +1,118 @@
+import hashlib
+
+from etl.joins_import import (
+    FileFingerprint,
+    RejectedRow,
+    fingerprint_file,
+    import_is_current,
+    normalize_joins,
+    normalized_chunks,
+    save_fingerprint,
+)
+
+
+class ScriptedCursor:
+    """Cursor returning queued ``fetchone`` results in order."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+
+    def fetchone(self):
+        return self.results.pop(0)
+
+
+def test_fingerprint_file_hashes_content(tmp_path):
+    path = tmp_path / "selects.csv"
+    path.write_bytes(b"TableName|Freq\nA|1\n")
+
+    fingerprint = fingerprint_file(str(path), block_size=4)
+
+    assert fingerprint.size == 19
+    assert fingerprint.sha256 == hashlib.sha256(b"TableName|Freq\nA|1\n").hexdigest()
+
+
+def test_import_is_current_requires_same_hash_and_row_count():
+    fingerprint = FileFingerprint(10, 1.0, "abc")
+
+    # Stored fingerprint matches (mtime may differ) and the table still has its rows.
+    cursor = ScriptedCursor([(10, 2.0, "abc ", 5), (123,), (5,)])
+    assert import_is_current(cursor, "TableUsedSelects", fingerprint)
+
+    # Rows were deleted from the table since it was loaded.
+    cursor = ScriptedCursor([(10, 1.0, "abc", 5), (123,), (4,)])
+    assert not import_is_current(cursor, "TableUsedSelects", fingerprint)
+
+    # Different file content.
+    cursor = ScriptedCursor([(10, 1.0, "def", 5)])
+    assert not import_is_current(cursor, "TableUsedSelects", fingerprint)
+
+    # Table was dropped.
+    cursor = ScriptedCursor([(10, 1.0, "abc", 5), (None,)])
+    assert not import_is_current(cursor, "TableUsedSelects", fingerprint)
+
+    # Nothing recorded yet.
+    assert not import_is_current(ScriptedCursor([None]), "TableUsedSelects", fingerprint)
+
+
+def test_save_fingerprint_replaces_previous_entry():
+    cursor = ScriptedCursor([])
+    save_fingerprint(cursor, "TableUsedSelects", FileFingerprint(10, 1.0, "abc"), 5)
+
+    assert cursor.statements[0][0].startswith("DELETE FROM dbo.ImportFingerprints")
+    assert cursor.statements[1][1] == ("TableUsedSelects", 10, 1.0, "abc", 5)
+
+
+def test_normalize_joins_types_columns_and_rejects_malformed_rows():
+    import pandas as pd
+
+    chunk = pd.DataFrame(
+        {
+            "TableName": ["A", "B", "C", "D"],
+            "Freq": ["1,234", None, "x", "5"],
+            "InScopeFreq": ["12", "nan", "3", "4"],
+            "fConvert": ["1.0", "0", "1", "2"],
+        },
+        index=[10, 11, 12, 13],
+    )
+
+    clean, rejected = normalize_joins(chunk, first_line=12)
+
+    assert clean["TableName"].tolist() == ["A", "B"]
+    assert clean["Freq"].tolist() == [1234, 0]
+    assert clean["InScopeFreq"].tolist() == [12, 0]
+    assert clean["fConvert"].tolist() == [True, False]
+    assert rejected == [RejectedRow(14, "Freq", "x"), RejectedRow(15, "fConvert", "2")]
+
+
+def test_normalized_chunks_report_file_line_numbers(tmp_path, monkeypatch):
+    monkeypatch.setattr("etl.joins_import.csv_engine", lambda: None)
+    path = tmp_path / "selects.csv"
+    path.write_text(
+        "TableName|Freq|InScopeFreq|fConvert\nA|1|1|1\nB|2|2|0\nC|bad|3|1\n",
+        encoding="utf-8",
+    )
+    rejected = []
+
+    chunks = list(normalized_chunks(str(path), 2, rejected))
+
+    assert [len(c) for c in chunks] == [2, 0]
+    assert rejected == [RejectedRow(4, "Freq", "bad")]
+
+
+def test_normalized_chunks_count_blank_lines_and_quoted_newlines(tmp_path, monkeypatch):
+    monkeypatch.setattr("etl.joins_import.csv_engine", lambda: None)
+    path = tmp_path / "selects.csv"
+    path.write_text(
+        'TableName|Freq|InScopeFreq|fConvert\nA|1|1|1\n\n"B\nB"|2|2|0\nC|bad|3|1\n',
+        encoding="utf-8",
+    )
+    rejected = []
+
+    chunks = list(normalized_chunks(str(path), 2, rejected))
+
+    assert sum(len(c) for c in chunks) == 2
+    assert rejected == [RejectedRow(6, "Freq", "bad")]
@@ -1,5 +1,6 @@
 import importlib
 import math
+import pytest
 import sys
 import types
 import time
@@ -136,12 +137,48 @@ def test_gather_lob_columns_batches(monkeypatch):
     lob.gather_lob_columns(conn, cfg, "log.txt")
     elapsed = time.perf_counter() - start
 
-    expected_batches = math.ceil(len(rows) / cfg["batch_size"]) + 1  # final commit from transaction_scope
+    # One commit for the stale-row clean-up, one per batch and the final
+    # commit from transaction_scope.
+    expected_batches = math.ceil(len(rows) / cfg["batch_size"]) + 2
     assert conn.commits == expected_batches
     assert len(conn.last_cursor.executed) == len(rows)
     assert elapsed < 1.0
 
 
+class DummySAConn:
+    """SQLAlchemy-style connection: no ``cursor``, DB-API connection behind ``connection``."""
+
+    def __init__(self):
+        self.connection = DummyConn()
+        self.commits = 0
+        self.rollbacks = 0
+
+    def execute(self, *a, **k):
+        raise AssertionError("not used")
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+def test_write_lob_updates_commits_on_dbapi_connection(monkeypatch):
+    conn = DummySAConn()
+    cursor = conn.connection.cursor()
+    row = ("s", "t", "c", "text", None, 10, 10, 1, "ALTER")
+
+    def failing_insert(cursor, table, columns, rows, types):
+        if len(rows) > 1:
+            raise RuntimeError("batch failed")
+
+    monkeypatch.setattr(lob, "insert_rows", failing_insert)
+
+    assert lob.write_lob_updates(conn, cursor, [row, row], "log.txt") == 2
+    assert (conn.connection.rollbacks, conn.connection.commits) == (1, 2)
+    assert (conn.rollbacks, conn.commits) == (0, 0)
+
+
 def test_gather_lob_columns_override(monkeypatch):
     rows = [("s", "t", "c", "text", None, 0)]
     select_cursor = DummySelectCursor(rows)
@@ -158,3 +195,306 @@ def test_gather_lob_columns_override(monkeypatch):
 
     lob.gather_lob_columns(conn, cfg, "log.txt")
     assert len(conn.last_cursor.executed) == len(rows)
+
+
+class _ResultCursor:
+    def __init__(self, row):
+        self.row = row
+
+    def fetchone(self):
+        return self.row
+
+
+def test_get_max_lengths_profiles_table_in_one_scan(monkeypatch):
+    queries = []
+
+    def fake_exec(conn, sql, timeout):
+        queries.append(sql)
+        return _ResultCursor((12, 24, None, None))
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", fake_exec)
+
+    lengths = lob.get_max_lengths(
+        DummyConn(), "dbo", "t", [("a", "nvarchar"), ("b", "text"), ("c", "int")], 30
+    )
+
+    assert len(queries) == 1
+    assert "MAX(LEN([a])), MAX(DATALENGTH([a]))" in queries[0]
+    assert "MAX(LEN(CAST([b] AS NVARCHAR(MAX))))" in queries[0]
+    assert lengths == {"a": (12, 24), "b": (0, 0), "c": (None, None)}
+
+
+def test_get_max_lengths_falls_back_to_column_scans(monkeypatch):
+    def failing_exec(conn, sql, timeout):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", failing_exec)
+    monkeypatch.setattr(lob, "get_max_length", lambda conn, s, t, column, d, timeout: len(column))
+
+    lengths = lob.get_max_lengths(DummyConn(), "dbo", "t", [("ab", "varchar"), ("abc", "ntext")], 30)
+
+    assert lengths == {"ab": (2, None), "abc": (3, None)}
+
+
+class _RowsCursor:
+    def __init__(self, columns, rows):
+        self.description = [(c,) for c in columns]
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+
+class _WorkerConn(DummyConn):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_execute_lob_column_updates_groups_tables_across_workers(monkeypatch):
+    import threading
+
+    rows = [
+        ("dbo", "a", "ALTER TABLE [dbo].[a] ALTER COLUMN [x] TEXT;"),
+        ("dbo", "b", "ALTER TABLE [dbo].[b] ALTER COLUMN [x] VARCHAR(10);"),
+        ("dbo", "a", "ALTER TABLE [dbo].[a] ALTER COLUMN [y] VARCHAR(5);"),
+    ]
+    monkeypatch.setattr(
+        lob, "execute_sql_with_timeout",
+        lambda conn, q, timeout: _RowsCursor(["SchemaName", "TableName", "Alter_Statement"], rows),
+    )
+    monkeypatch.setattr(lob, "get_target_connection", _WorkerConn)
+    executed = []
+
+    def fake_sanitize(conn, sql, timeout):
+        executed.append((sql, id(conn), threading.current_thread().name))
+
+    monkeypatch.setattr(lob, "sanitize_sql", fake_sanitize)
+
+    lob.execute_lob_column_updates(DummyConn(), {"sql_timeout": 30, "workers": 2}, "log.txt")
+
+    table_a = [(sql, conn) for sql, conn, _ in executed if "[a]" in sql]
+    assert [sql for sql, _ in table_a] == [rows[0][2], rows[2][2]]
+    assert len({conn for _, conn in table_a}) == 1
+    assert all(thread.startswith("etl-worker") for _, _, thread in executed)
+    assert len(executed) == 3
+
+
+def test_write_lob_updates_reports_bad_rows_individually(tmp_path):
+    class PickyCursor(DummyUpdateCursor):
+        def executemany(self, sql, params):
+            if any(row[2] == "bad" for row in params):
+                raise ValueError("string data, right truncation")
+            super().executemany(sql, params)
+
+    conn = DummyConn()
+    cursor = PickyCursor(conn)
+    rows = [("s", "t", name, "text", None, 1, 10, 10, "ALTER") for name in ("a", "bad", "c")]
+    log_file = tmp_path / "log.txt"
+
+    written = lob.write_lob_updates(conn, cursor, rows, str(log_file))
+
+    assert written == 2
+    assert [row[2] for row in cursor.executed] == ["a", "c"]
+    assert conn.rollbacks == 2
+    assert "s.t.bad" in log_file.read_text()
+
+
+def test_build_rebuild_sql_casts_changed_columns_and_restores_pk():
+    sql = lob.build_rebuild_sql(
+        "dbo",
+        "Case",
+        ["Id", "Notes", "Memo", "Code"],
+        {"notes": "VARCHAR(40)", "memo": "TEXT"},
+        "ALTER TABLE [dbo].[Case] ADD CONSTRAINT [PK_Case] PRIMARY KEY CLUSTERED ([Id] ASC)",
+    )
+
+    assert "CAST([Notes] AS VARCHAR(40)) AS [Notes]" in sql
+    assert "CAST([Memo] AS TEXT) AS [Memo]" in sql
+    assert "[Id],\n    CAST" in sql and "[Code]\nINTO [dbo].[Case__lob]" in sql
+    assert sql.index("DROP TABLE [dbo].[Case]") < sql.index("sp_rename N'[dbo].[Case__lob]', N'Case'")
+    assert sql.startswith("SET XACT_ABORT ON;\nSET NOCOUNT ON;\nBEGIN TRANSACTION;\n")
+    assert sql.endswith("PRIMARY KEY CLUSTERED ([Id] ASC);\nCOMMIT TRANSACTION;\nSET NOCOUNT OFF;")
+
+
+def test_build_rebuild_sql_refuses_to_truncate():
+    sql = lob.build_rebuild_sql(
+        "dbo", "Case", ["Id", "Notes", "Memo", "Flag"], {"notes": "VARCHAR(40)", "memo": "TEXT", "flag": "CHAR(1)"}
+    )
+
+    guard = sql[sql.index("BEGIN TRANSACTION;\n") + 19 : sql.index("DROP TABLE IF EXISTS")]
+    assert guard.startswith("IF EXISTS (SELECT 1 FROM [dbo].[Case] WHERE ")
+    assert "LEN(CAST([Notes] AS NVARCHAR(MAX))) > 40 OR LEN(CAST([Flag] AS NVARCHAR(MAX))) > 1" in guard
+    assert "[Memo]" not in guard
+    assert "THROW 50000, N'Rebuilding [dbo].[Case] would truncate data" in guard
+
+
+def test_execute_lob_column_updates_alters_unmeasured_columns(monkeypatch):
+    columns = ["SchemaName", "TableName", "Alter_Statement", "ColumnName", "MaxLen", "RowCnt"]
+    rows = [
+        ("dbo", "big", "ALTER TABLE [dbo].[big] ALTER COLUMN [x] TEXT;", "x", 9000, 5000),
+        ("dbo", "big", "ALTER TABLE [dbo].[big] ALTER COLUMN [y] CHAR(1);", "y", None, 5000),
+    ]
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", lambda conn, q, timeout: _RowsCursor(columns, rows))
+    executed = []
+    monkeypatch.setattr(lob, "sanitize_sql", lambda conn, sql, timeout: executed.append(sql))
+
+    lob.execute_lob_column_updates(DummyConn(), {"sql_timeout": 30, "rebuild_rows": 1000}, "log.txt")
+
+    assert executed == [rows[0][2], rows[1][2]]
+
+
+def test_execute_lob_column_updates_rebuilds_large_tables_once(monkeypatch):
+    columns = ["SchemaName", "TableName", "Alter_Statement", "ColumnName", "MaxLen", "RowCnt"]
+    rows = [
+        ("dbo", "big", "ALTER TABLE [dbo].[big] ALTER COLUMN [x] TEXT;", "x", 9000, 5000),
+        ("dbo", "small", "ALTER TABLE [dbo].[small] ALTER COLUMN [x] TEXT;", "x", 9000, 10),
+        ("dbo", "big", "ALTER TABLE [dbo].[big] ALTER COLUMN [y] VARCHAR(5);", "y", 5, 5000),
+        ("dbo", "small", "ALTER TABLE [dbo].[small] ALTER COLUMN [y] VARCHAR(5);", "y", 5, 10),
+    ]
+
+    def fake_exec(conn, sql, timeout):
+        if "LOB_COLUMN_UPDATES" in sql:
+            return _RowsCursor(columns, rows)
+        if "sys.key_constraints" in sql:
+            return _RowsCursor([], [("PK_big", "CLUSTERED", "id", False)])
+        return _RowsCursor([], [("id", False, 0), ("x", False, 0), ("y", False, 0)])
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", fake_exec)
+    executed = []
+    monkeypatch.setattr(lob, "sanitize_sql", lambda conn, sql, timeout: executed.append(sql))
+
+    lob.execute_lob_column_updates(DummyConn(), {"sql_timeout": 30, "rebuild_rows": 1000}, "log.txt")
+
+    assert len(executed) == 3
+    rebuild = executed[0]
+    assert "CAST([x] AS TEXT) AS [x]" in rebuild and "CAST([y] AS VARCHAR(5)) AS [y]" in rebuild
+    assert "ADD CONSTRAINT [PK_big] PRIMARY KEY CLUSTERED ([id] ASC)" in rebuild
+    assert executed[1:] == [rows[1][2], rows[3][2]]
+
+
+def test_execute_lob_column_updates_alters_tables_the_copy_would_break(monkeypatch):
+    columns = ["SchemaName", "TableName", "Alter_Statement", "ColumnName", "MaxLen", "RowCnt"]
+    rows = [
+        ("dbo", "big", "ALTER TABLE [dbo].[big] ALTER COLUMN [x] TEXT;", "x", 9000, 5000),
+        ("dbo", "big", "ALTER TABLE [dbo].[big] ALTER COLUMN [y] VARCHAR(5);", "y", 5, 5000),
+    ]
+
+    def fake_exec(conn, sql, timeout):
+        if "LOB_COLUMN_UPDATES" in sql:
+            return _RowsCursor(columns, rows)
+        return _RowsCursor([], [("id", False, 1), ("x", False, 1), ("y", False, 1)])
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", fake_exec)
+    executed = []
+    monkeypatch.setattr(lob, "sanitize_sql", lambda conn, sql, timeout: executed.append(sql))
+
+    lob.execute_lob_column_updates(DummyConn(), {"sql_timeout": 30, "rebuild_rows": 1000}, "log.txt")
+
+    assert executed == [rows[0][2], rows[1][2]]
+
+
+def test_gather_lob_columns_skips_unchanged_tables(monkeypatch):
+    select_cursor = DummySelectCursor([
+        ("s", "old", "c", "text", None, 5, 1),
+        ("s", "new", "c", "text", None, 5, 0),
+    ])
+    select_cursor.description.append(("Unchanged",))
+    queries = []
+
+    def fake_exec(conn, sql, timeout):
+        queries.append(sql)
+        return select_cursor
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", fake_exec)
+    profiled = []
+    monkeypatch.setattr(
+        lob, "get_max_lengths",
+        lambda conn, s, t, columns, timeout: profiled.append(t) or {c: (10, 10) for c, _ in columns},
+    )
+
+    conn = DummyConn()
+    lob.gather_lob_columns(conn, {"include_empty_tables": True, "sql_timeout": 30, "batch_size": 10}, "log.txt")
+
+    assert profiled == ["new"]
+    assert [row[1] for row in conn.last_cursor.executed] == ["new"]
+    assert "DELETE U FROM" in queries[0] and "LOB_TABLE_STATE" in queries[0]
+
+
+def test_gather_lob_columns_full_scan_forgets_table_state(monkeypatch):
+    queries = []
+
+    def fake_exec(conn, sql, timeout):
+        queries.append(sql)
+        return DummySelectCursor([])
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", fake_exec)
+
+    lob.gather_lob_columns(
+        DummyConn(), {"include_empty_tables": True, "sql_timeout": 30, "incremental": False}, "log.txt"
+    )
+
+    assert queries[0].strip().startswith("DELETE FROM") and "LOB_TABLE_STATE" in queries[0]
+
+
+def test_execute_lob_column_updates_skips_applied_alters(monkeypatch):
+    columns = [
+        "SchemaName", "TableName", "Alter_Statement", "ColumnName", "MaxLen", "RowCnt",
+        "CurrentType", "CurrentBytes",
+    ]
+    rows = [
+        ("dbo", "t", "ALTER TABLE [dbo].[t] ALTER COLUMN [a] TEXT;", "a", 9000, 5, "text", 16),
+        ("dbo", "t", "ALTER TABLE [dbo].[t] ALTER COLUMN [b] VARCHAR(5);", "b", 5, 5, "varchar", 5),
+        ("dbo", "t", "ALTER TABLE [dbo].[t] ALTER COLUMN [c] VARCHAR(5);", "c", 5, 5, "nvarchar", -1),
+    ]
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", lambda conn, q, timeout: _RowsCursor(columns, rows))
+    executed = []
+    monkeypatch.setattr(lob, "sanitize_sql", lambda conn, sql, timeout: executed.append(sql))
+
+    lob.execute_lob_column_updates(DummyConn(), {"sql_timeout": 30}, "log.txt")
+
+    assert executed == [rows[2][2]]
+
+
+def test_check_pool_capacity_rejects_too_many_workers(monkeypatch):
+    monkeypatch.setattr(lob, "pool_capacity", lambda: 15)
+    lob.check_pool_capacity({"workers": 14})
+    with pytest.raises(lob.ConfigError):
+        lob.check_pool_capacity({"workers": 15})
+
+
+def test_unchanged_tables_require_matching_last_write():
+    sql = lob._unchanged_tables_sql()
+
+    assert "sys.dm_db_index_usage_stats" in sql and "last_user_update" in sql
+    assert "st.LastUserUpdate = g.LastUserUpdate" in sql
+    # Usage statistics reset on restart, so older state never matches.
+    assert "st.ProcessDate > (SELECT sqlserver_start_time FROM sys.dm_os_sys_info)" in sql
+
+
+def test_usage_stats_permission_error_treats_every_table_as_changed(monkeypatch, caplog):
+    def denied(conn, sql, timeout):
+        raise sys.modules["pyodbc"].Error("42000", "VIEW SERVER STATE permission was denied (300) (SQLExecDirectW)")
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", denied)
+    conn = DummyConn()
+
+    assert lob.usage_stats_visible(conn, 30) is False
+    assert conn.rollbacks == 1
+    assert "VIEW SERVER STATE" in caplog.text
+
+    queries = []
+
+    def fake_exec(conn, sql, timeout):
+        queries.append(sql)
+        return DummySelectCursor([])
+
+    monkeypatch.setattr(lob, "execute_sql_with_timeout", fake_exec)
+    lob.gather_lob_columns(
+        DummyConn(), {"include_empty_tables": True, "sql_timeout": 30, "track_writes": False}, "log.txt"
+    )
+    lob.record_lob_table_state(DummyConn(), {"sql_timeout": 30, "track_writes": False})
+
+    assert queries and not any("dm_db_index_usage_stats" in q or "dm_os_sys_info" in q for q in queries)
@@ -0,0 +1,59 @@
+import sqlite3
+
+from etl.metadata_writer import (
+    STATUS_DONE,
+    STATUS_FAILED,
+    TableResultBuffer,
+    build_update_statements,
+)
+
+
+def _metadata_db():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE ttc(RowID INTEGER PRIMARY KEY, ScopeRowCount INTEGER, CopySeconds REAL, CopyStatus TEXT)"
+    )
+    conn.executemany("INSERT INTO ttc (RowID, ScopeRowCount) VALUES (?, 5)", [(1,), (2,), (3,)])
+    return conn
+
+
+def test_update_statements_apply_results_in_one_pass():
+    conn = _metadata_db()
+    buffer = TableResultBuffer(flush_rows=10)
+    buffer.add(1, 7, 1.25, STATUS_DONE)
+    buffer.add(2, None, 0.5, STATUS_FAILED)
+
+    statements = build_update_statements("ttc", buffer.take())
+    assert len(statements) == 1
+    conn.execute(statements[0])
+
+    rows = conn.execute("SELECT RowID, ScopeRowCount, CopySeconds, CopyStatus FROM ttc ORDER BY RowID").fetchall()
+    assert rows == [(1, 7, 1.25, "done"), (2, 5, 0.5, "failed"), (3, 5, None, None)]
+    assert len(buffer) == 0
+
+
+def test_buffer_flushes_by_row_count_and_restores_failures():
+    buffer = TableResultBuffer(flush_rows=2, flush_seconds=3600)
+    buffer.add(1, 1, 0.1)
+    assert not buffer.due()
+    buffer.add(2, 2, 0.1)
+    assert buffer.due()
+
+    taken = buffer.take()
+    buffer.add(2, 20, 0.2)
+    buffer.restore(taken)
+
+    assert buffer.get(1).row_count == 1
+    assert buffer.get(2).row_count == 20
+
+
+def test_update_statements_are_chunked(monkeypatch):
+    monkeypatch.setattr("etl.metadata_writer.FLUSH_CHUNK_SIZE", 2)
+    buffer = TableResultBuffer()
+    for row_id in range(1, 6):
+        buffer.add(row_id, row_id, 0.0)
+
+    statements = build_update_statements("ttc", buffer.take())
+
+    assert len(statements) == 3
+    assert statements[-1].endswith("WHERE RowID IN (5)")
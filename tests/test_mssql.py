@@ -31,3 +31,22 @@ def test_get_target_connection(monkeypatch):
     conn = connections.get_target_connection()
     assert isinstance(conn, DummyConn)
     assert created['kwargs']['pool_size'] == settings.db_pool_size
+
+
+def test_dispose_engines_closes_cached_engines(monkeypatch):
+    disposed = []
+
+    class DisposableEngine(DummyEngine):
+        def dispose(self):
+            disposed.append(self)
+
+    monkeypatch.setattr(connections, '_engines', {}, raising=False)
+    monkeypatch.setattr(connections.sqlalchemy, 'create_engine', lambda url, **k: DisposableEngine(), raising=False)
+
+    engine = connections.get_engine('mssql+pyodbc://one')
+    assert connections.get_engine('mssql+pyodbc://one') is engine
+    connections.get_engine('mssql+pyodbc://two')
+
+    connections.dispose_engines()
+    assert len(disposed) == 2
+    assert connections._engines == {}
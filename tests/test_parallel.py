@@ -0,0 +1,59 @@
+import threading
+
+from etl.parallel import run_pipelined
+
+
+def test_run_pipelined_starts_second_step_as_items_finish():
+    first_done = threading.Event()
+    calls = []
+    lock = threading.Lock()
+
+    def first(item):
+        if item == 2:
+            # Item 2 is only copied after item 1's second step has run
+            assert first_done.wait(5)
+        with lock:
+            calls.append(('first', item))
+        return item * 10
+
+    def second(item):
+        with lock:
+            calls.append(('second', item))
+        if item == 10:
+            first_done.set()
+        return item + 1
+
+    finished = []
+    run_pipelined(
+        [1, 2, 3],
+        first,
+        second,
+        1,
+        2,
+        on_first=lambda outcome: outcome.result if outcome.item != 3 else None,
+        on_second=lambda outcome: finished.append(outcome.result),
+        ready=[100],
+    )
+
+    assert calls.index(('second', 10)) < calls.index(('first', 2))
+    assert ('second', 30) not in calls
+    assert sorted(finished) == [11, 21, 101]
+
+
+def test_run_pipelined_captures_errors():
+    def first(item):
+        if item == 'bad':
+            raise ValueError(item)
+        return item
+
+    outcomes = []
+
+    def on_first(outcome):
+        outcomes.append(outcome)
+        return outcome.result if outcome.ok else None
+
+    seconds = []
+    run_pipelined(['ok', 'bad'], first, str.upper, 2, 1, on_first=on_first, on_second=seconds.append)
+
+    assert sorted(o.ok for o in outcomes) == [False, True]
+    assert [o.result for o in seconds] == ['OK']
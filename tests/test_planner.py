@@ -0,0 +1,41 @@
+import json
+
+from etl.planner import build_plan, format_plan, simulate_makespan, write_plan
+from etl.scheduler import TableDurationHistory
+
+
+def test_simulate_makespan_longest_first():
+    assert simulate_makespan([10, 5, 5], 1) == 20
+    assert simulate_makespan([10, 5, 5], 2) == 10
+    assert simulate_makespan([7, 6, 5, 4], 2) == 11
+    assert simulate_makespan([], 4) == 0
+
+
+def test_build_plan_uses_sizes_and_history(tmp_path):
+    history = TableDurationHistory(str(tmp_path / "durations.json"))
+    history.record("table_operations", "justice.dbo.slow", 300.0, rows=1000)
+    rows = [
+        {"RowID": 1, "DatabaseName": "Justice", "SchemaName": "dbo", "TableName": "slow", "RowCount": 1000},
+        {"RowID": 2, "DatabaseName": "Justice", "SchemaName": "dbo", "TableName": "big", "RowCount": 5},
+    ]
+    sizes = {"justice.dbo.big": (2_000_000, 512 * 1048576)}
+
+    plan = build_plan(rows, sizes, history, {"table_operations": 2, "pk_creation": 1})
+
+    by_table = {t["table"]: t for t in plan["tables"]}
+    assert by_table["justice.dbo.slow"]["copy_seconds"] == 300.0
+    assert by_table["justice.dbo.big"]["rows"] == 2_000_000
+    assert by_table["justice.dbo.big"]["bytes"] == 512 * 1048576
+    # 2M rows at the 1000 rows / 300 s observed rate dominates the plan
+    assert plan["tables"][0]["table"] == "justice.dbo.big"
+    copy = plan["phases"]["table_operations"]
+    assert copy["projected_seconds"] == max(t["copy_seconds"] for t in plan["tables"])
+    assert copy["serial_seconds"] > copy["projected_seconds"]
+
+    text = format_plan(plan)
+    assert "justice.dbo.big" in text
+    assert "projected" in text
+
+    path = tmp_path / "plan.json"
+    write_plan(plan, str(path))
+    assert json.loads(path.read_text())["total_rows"] == 2_001_000
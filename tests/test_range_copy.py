@@ -0,0 +1,38 @@
+from etl.range_copy import build_slice_sql, plan_slices, split_select_into
+
+
+SELECT_INTO = (
+    "SELECT DISTINCT A.[id], CAST(A.[note] AS NVARCHAR(MAX)) AS [note] "
+    "INTO Target.[dbo].[big] FROM Justice.[dbo].[big] A WITH (NOLOCK) "
+    "INNER JOIN Justice.dbo.other B ON B.id = A.id"
+)
+
+
+def test_split_select_into():
+    select_part, target, from_clause = split_select_into(SELECT_INTO)
+
+    assert select_part == "SELECT DISTINCT A.[id], CAST(A.[note] AS NVARCHAR(MAX)) AS [note]"
+    assert target == "Target.[dbo].[big]"
+    assert from_clause.startswith("FROM Justice.[dbo].[big] A WITH (NOLOCK) INNER JOIN")
+    assert split_select_into("DROP TABLE x") is None
+
+
+def test_plan_slices_covers_range_without_overlap():
+    slices = plan_slices(1, 100, row_count=1000, slice_rows=300)
+
+    assert slices == [(1, 26), (26, 51), (51, 76), (76, 101)]
+    assert plan_slices(5, 5, row_count=10, slice_rows=100) == [(5, 6)]
+    assert plan_slices(10, 1, row_count=10, slice_rows=100) == []
+
+
+def test_slice_sql_is_idempotent_and_handles_identity():
+    select_part, target, from_clause = split_select_into(SELECT_INTO)
+
+    batch = build_slice_sql(select_part, target, from_clause, "id", 1, 26, columns=["id", "note"])
+    lines = batch.splitlines()
+
+    assert lines[2] == "DELETE FROM Target.[dbo].[big] WHERE [id] >= 1 AND [id] < 26"
+    assert lines[3] == "SET IDENTITY_INSERT Target.[dbo].[big] ON"
+    assert lines[4].startswith("INSERT INTO Target.[dbo].[big] WITH (TABLOCK) ([id], [note]) SELECT X.* FROM (")
+    assert lines[4].endswith("WHERE X.[id] >= 1 AND X.[id] < 26")
+    assert "TABLOCK" not in build_slice_sql(select_part, target, from_clause, "id", 1, 26, tablock=False)
@@ -0,0 +1,99 @@
+import sys
+
+import pytest
+
+from utils.etl_helpers import SQLExecutionError
+from utils.retry_policy import RetryBudget, RetryPolicy, is_lock_error, is_transient
+
+
+def _odbc_error(sqlstate, number, text):
+    return sys.modules["pyodbc"].Error(
+        sqlstate, f"[{sqlstate}] [Microsoft][ODBC Driver 17 for SQL Server][SQL Server]{text} ({number}) (SQLExecDirectW)"
+    )
+
+
+def test_is_transient_classifies_wrapped_errors():
+    deadlock = _odbc_error("40001", 1205, "Transaction was deadlocked")
+    lock_timeout = _odbc_error("HY000", 1222, "Lock request time out period exceeded.")
+    syntax = _odbc_error("42000", 102, "Incorrect syntax near 'FROM'.")
+
+    assert is_transient(SQLExecutionError("SELECT 1", lock_timeout, table_name="dbo.t"))
+    assert is_transient(deadlock)
+    assert is_transient(sys.modules["pyodbc"].Error("08S01", "Communication link failure"))
+    assert not is_transient(SQLExecutionError("SELECT 1", syntax, table_name="dbo.t"))
+    assert not is_transient(ValueError("bad value"))
+
+
+def test_is_transient_ignores_numbers_in_the_message_text():
+    duplicate = _odbc_error(
+        "23000",
+        2627,
+        "Violation of PRIMARY KEY constraint 'PK_t'. Cannot insert duplicate key in object 'dbo.t'. "
+        "The duplicate key value is (1205).",
+    )
+    reset_key = _odbc_error("23000", 2627, "Cannot insert duplicate key. The duplicate key value is (10054)")
+    second_record = sys.modules["pyodbc"].Error(
+        "01000", "[01000] [SQL Server]Changed context (5701) (SQLExecDirectW); [40001] [SQL Server]Deadlock (1205)"
+    )
+
+    assert not is_transient(duplicate)
+    assert not is_transient(reset_key)
+    assert is_transient(second_record)
+
+
+def test_retry_policy_retries_transient_errors_with_backoff():
+    delays = []
+    calls = {"count": 0}
+    rollbacks = []
+
+    def flaky():
+        calls["count"] += 1
+        if calls["count"] < 3:
+            raise _odbc_error("HY000", 1222, "Lock request time out period exceeded.")
+        return "ok"
+
+    policy = RetryPolicy(max_attempts=3, budget=RetryBudget(5), base_delay=1.0, sleep=delays.append)
+
+    assert policy.run(flaky, "copy dbo.t", on_retry=rollbacks.append) == "ok"
+    assert calls["count"] == 3
+    assert len(rollbacks) == 2
+    assert 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 2.0
+    assert policy.budget.remaining == 3
+
+
+def test_retry_policy_stops_on_permanent_error_and_spent_budget():
+    policy = RetryPolicy(max_attempts=5, budget=RetryBudget(1), sleep=lambda s: None)
+    calls = {"count": 0}
+
+    def deadlock():
+        calls["count"] += 1
+        raise _odbc_error("40001", 1205, "Transaction was deadlocked")
+
+    with pytest.raises(sys.modules["pyodbc"].Error):
+        policy.run(deadlock, "copy dbo.t")
+    # One retry from the budget, then the error propagates
+    assert calls["count"] == 2
+
+    def broken():
+        raise ValueError("not transient")
+
+    with pytest.raises(ValueError):
+        RetryPolicy(sleep=lambda s: None).run(broken, "copy dbo.t")
+
+
+def test_same_connection_retries_only_lock_errors():
+    link = _odbc_error("08S01", 10054, "TCP Provider: An existing connection was forcibly closed by the remote host.")
+    deadlock = _odbc_error("40001", 1205, "Transaction was deadlocked")
+
+    assert is_transient(link) and not is_lock_error(link)
+    assert is_lock_error(deadlock)
+
+    calls = {"count": 0}
+
+    def dropped():
+        calls["count"] += 1
+        raise link
+
+    with pytest.raises(sys.modules["pyodbc"].Error):
+        RetryPolicy(sleep=lambda s: None).run(dropped, "copy dbo.t", retryable=is_lock_error)
+    assert calls["count"] == 1
@@ -0,0 +1,43 @@
+import json
+
+from etl.pk_builder import build_constraint_batch, not_null_column
+from etl.run_report import RunReport
+
+
+def test_not_null_column_parses_bracketed_and_plain_names():
+    assert not_null_column("ALTER TABLE [db].[dbo].[t] ALTER COLUMN [Case]]ID] INT NOT NULL") == "Case]ID"
+    assert not_null_column("ALTER TABLE t ALTER COLUMN Seq VARCHAR(10) NOT NULL;") == "Seq"
+    assert not_null_column("ALTER TABLE t ADD CONSTRAINT pk PRIMARY KEY (Seq)") is None
+
+
+def test_constraint_batch_keeps_everything_when_nullability_is_unknown():
+    rows = [
+        {"Script": "ALTER TABLE t ALTER COLUMN [Id] INT NOT NULL"},
+        {"Script": "ALTER TABLE t ADD CONSTRAINT pk PRIMARY KEY ([Id])"},
+    ]
+    batch = build_constraint_batch(rows, None)
+    assert batch.skipped_not_null == 0
+    assert batch.sql == (
+        "ALTER TABLE t ALTER COLUMN [Id] INT NOT NULL;\n"
+        "ALTER TABLE t ADD CONSTRAINT pk PRIMARY KEY ([Id]);"
+    )
+
+
+def test_run_report_compares_with_previous_run(tmp_path):
+    report = RunReport("Justice")
+    with report.time_phase("table_operations"):
+        pass
+    report.add_table("pk_creation", "justice.dbo.a", 2.0, previous_seconds=5.0, statements=3, not_null_skipped=2)
+    report.add_table("pk_creation", "justice.dbo.b", 1.0, statements=2, not_null_skipped=0)
+
+    path = tmp_path / "report.json"
+    report.write(str(path))
+    data = json.loads(path.read_text())
+
+    pk = data["phases"]["pk_creation"]
+    assert pk["tables"] == 2
+    assert pk["table_seconds"] == 3.0
+    assert (pk["compared_tables"], pk["compared_seconds"], pk["compared_previous_seconds"]) == (1, 2.0, 5.0)
+    assert (pk["statements"], pk["not_null_skipped"]) == (5, 2)
+    assert "seconds" in data["phases"]["table_operations"]
+    assert "5.0s previous run" in report.format()
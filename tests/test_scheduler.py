@@ -0,0 +1,52 @@
+from etl.scheduler import (
+    TableDurationHistory,
+    order_longest_first,
+    order_table_groups_longest_first,
+    table_key,
+)
+
+
+def _row(table, rows, schema="dbo", db="Justice"):
+    return {"DatabaseName": db, "SchemaName": schema, "TableName": table, "RowCount": rows}
+
+
+def test_order_longest_first_by_row_count(tmp_path):
+    history = TableDurationHistory(str(tmp_path / "durations.json"))
+    rows = [_row("small", 10), _row("huge", 10_000_000), _row("medium", 5000)]
+
+    ordered = order_longest_first(rows, "table_operations", history)
+
+    assert [r["TableName"] for r in ordered] == ["huge", "medium", "small"]
+
+
+def test_history_overrides_row_count_and_persists(tmp_path):
+    path = str(tmp_path / "durations.json")
+    history = TableDurationHistory(path)
+    slow = _row("slow_but_small", 100)
+    history.record("table_operations", table_key(slow), 600.0, rows=100)
+    history.record("table_operations", table_key(_row("other", 1_000_000)), 10.0, rows=1_000_000)
+    history.save()
+
+    reloaded = TableDurationHistory(path)
+    rows = [_row("big", 2_000_000), slow]
+    ordered = order_longest_first(rows, "table_operations", reloaded)
+
+    assert ordered[0]["TableName"] == "slow_but_small"
+    assert reloaded.get("table_operations", table_key(slow)) == 600.0
+
+
+def test_table_groups_keep_statement_order(tmp_path):
+    history = TableDurationHistory(str(tmp_path / "durations.json"))
+    rows = [
+        {"SchemaName": "dbo", "TableName": "a", "RowCount": 1, "TYPEY": 1},
+        {"SchemaName": "dbo", "TableName": "a", "RowCount": 1, "TYPEY": 2},
+        {"SchemaName": "dbo", "TableName": "b", "RowCount": 900, "TYPEY": 1},
+        {"SchemaName": "dbo", "TableName": "b", "RowCount": 900, "TYPEY": 1},
+        {"SchemaName": "dbo", "TableName": "b", "RowCount": 900, "TYPEY": 2},
+    ]
+
+    ordered = order_table_groups_longest_first(rows, "pk_creation", history)
+
+    assert [(r["TableName"], r["TYPEY"]) for r in ordered] == [
+        ("b", 1), ("b", 1), ("b", 2), ("a", 1), ("a", 2),
+    ]
@@ -0,0 +1,40 @@
+from etl.tsql_lexer import parse_select_into, tokenize
+
+
+def test_tokenize_skips_comments_and_tracks_depth():
+    tokens = tokenize("SELECT /* INTO x */ CAST(a AS INT) -- FROM y\n, N'it''s' FROM t")
+
+    assert [t.text for t in tokens] == [
+        "SELECT", "CAST", "(", "a", "AS", "INT", ")", ",", "N'it''s'", "FROM", "t",
+    ]
+    assert [t.depth for t in tokens[1:7]] == [0, 0, 1, 1, 1, 0]
+
+
+def test_parse_select_into_ignores_keywords_in_literals_and_identifiers():
+    sql = (
+        "SELECT DISTINCT A.[Into, From], CAST(A.[Note] AS NVARCHAR(MAX)) AS [Note], "
+        "'a FROM b' AS Label, (SELECT MAX(x) FROM s) AS M "
+        "INTO Target.[dbo].[t] FROM Justice.[dbo].[t] A WITH (NOLOCK) "
+        "INNER JOIN Justice.dbo.u B ON B.id = A.id WHERE B.code <> ' INTO '"
+    )
+
+    parsed = parse_select_into(sql)
+
+    assert parsed.distinct
+    assert parsed.target == "Target.[dbo].[t]"
+    assert parsed.from_clause.startswith("FROM Justice.[dbo].[t] A WITH (NOLOCK)")
+    assert parsed.from_clause.endswith("WHERE B.code <> ' INTO '")
+    assert parsed.columns[0] == "A.[Into, From]"
+    assert parsed.column_expressions[1] == "CAST(A.[Note] AS NVARCHAR(MAX))"
+    assert len(parsed.columns) == 4
+
+
+def test_parse_select_into_rejects_other_statements_and_caches():
+    assert parse_select_into("DROP TABLE IF EXISTS x") is None
+    assert parse_select_into("SELECT a FROM t") is None
+
+    columns = ", ".join(f"A.[c{i}]" for i in range(500))
+    sql = f"SELECT {columns} INTO dbo.wide FROM src.dbo.wide A"
+    first = parse_select_into(sql)
+    assert len(first.columns) == 500 and not first.distinct
+    assert parse_select_into(sql) is first
@@ -0,0 +1,139 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+
+class CheckpointStore:
+    """Per-table checkpoints keyed by phase and ``TablesToConvert.RowID``.
+
+    Unlike the enumeration index kept by :class:`ProgressTracker`, entries do
+    not depend on the order in which work finished, so a resumed run skips
+    exactly the tables that completed.  Each entry also records the table it
+    belongs to; if the ``RowID`` now points at a different table the entry is
+    ignored.
+
+    By default every mark is written straight away.  With ``flush_marks``
+    and ``flush_seconds`` the file is rewritten only once that many marks
+    have accumulated or that much time has passed; :meth:`close` writes
+    whatever is left.
+    """
+
+    def __init__(self, path: str, flush_marks: int = 1, flush_seconds: float = 0.0) -> None:
+        self.path = path
+        self.flush_marks = max(1, int(flush_marks))
+        self.flush_seconds = float(flush_seconds)
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict[str, Dict[str, Any]]] = self._load()
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+
+    def _load(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as exc:
+            logger.error("Failed to read checkpoint file %s: %s", self.path, exc)
+            return {}
+
+    def _save(self) -> None:
+        self._unsaved = 0
+        self._last_save = time.monotonic()
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a
+            # truncated checkpoint file behind.
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception as exc:
+            logger.error("Failed to write checkpoint file %s: %s", self.path, exc)
+
+    def status(self, phase: str, row_id: Any, table: Optional[str] = None) -> Optional[str]:
+        """Return the recorded status for ``row_id`` or ``None``."""
+        entry = self._data.get(phase, {}).get(str(row_id))
+        if not entry:
+            return None
+        if table is not None and entry.get("table") not in (None, table):
+            return None
+        return entry.get("status")
+
+    def is_done(self, phase: str, row_id: Any, table: Optional[str] = None) -> bool:
+        return self.status(phase, row_id, table) == DONE
+
+    def mark(
+        self,
+        phase: str,
+        row_id: Any,
+        status: str,
+        table: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record ``status`` for ``row_id`` and persist it once a flush is due."""
+        if row_id is None:
+            return
+        with self._lock:
+            entry: Dict[str, Any] = {
+                "status": status,
+                "timestamp": datetime.now().isoformat(),
+            }
+            if table is not None:
+                entry["table"] = table
+            if error:
+                entry["error"] = str(error)
+            self._data.setdefault(phase, {})[str(row_id)] = entry
+            self._unsaved += 1
+            if (
+                self._unsaved >= self.flush_marks
+                or time.monotonic() - self._last_save >= self.flush_seconds
+            ):
+                self._save()
+
+    def flush(self) -> None:
+        """Write marks that have not been saved yet."""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def close(self) -> None:
+        self.flush()
+
+    def start(self, phase: str, row_id: Any, table: Optional[str] = None) -> None:
+        self.mark(phase, row_id, IN_PROGRESS, table)
+
+    def complete(self, phase: str, row_id: Any, table: Optional[str] = None) -> None:
+        self.mark(phase, row_id, DONE, table)
+
+    def fail(self, phase: str, row_id: Any, table: Optional[str] = None, error: Any = None) -> None:
+        self.mark(phase, row_id, FAILED, table, error=error)
+
+    def count(self, phase: str, status: str = DONE) -> int:
+        """Return how many entries in ``phase`` have ``status``."""
+        return sum(1 for entry in self._data.get(phase, {}).values() if entry.get("status") == status)
+
+    def delete(self) -> None:
+        """Forget all checkpoints and delete the file."""
+        with self._lock:
+            self._data = {}
+            self._unsaved = 0
+            if self.path and os.path.exists(self.path):
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
@@ -37,6 +37,41 @@ class ProgressTracker:
         except Exception:
             return default
 
+    def get_state(self, key: str, default: Any = None) -> Any:
+        """Return a structured checkpoint stored with :meth:`set_state`."""
+        return self.load().get(key, default)
+
+    def set_state(self, key: str, value: Any) -> None:
+        """Persist a JSON-serialisable checkpoint under ``key``."""
+        with self._lock:
+            if not self.path:
+                return
+            data = self.load()
+            data[key] = value
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+            except Exception as exc:
+                logger.error("Failed to write progress file %s: %s", self.path, exc)
+
+    def clear_state(self, key: str) -> None:
+        """Remove the checkpoint stored under ``key``, if any."""
+        with self._lock:
+            if not self.path:
+                return
+            data = self.load()
+            if key not in data:
+                return
+            del data[key]
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+            except Exception as exc:
+                logger.error("Failed to write progress file %s: %s", self.path, exc)
+
     def update(self, key: str, value: int, total: Optional[int] = None, 
                operation: str = "", details: str = "") -> None:
         """Enhanced update with progress percentage and operation details."""
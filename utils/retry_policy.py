@@ -0,0 +1,161 @@
+"""Retry policy for transient SQL Server failures.
+
+Deadlocks, lock timeouts and dropped connections are usually gone by the
+time a statement is tried again, but until now a single one aborted the whole
+import.  :class:`RetryPolicy` re-runs an idempotent unit of work (one table
+copy, one PK statement, one ALTER) when the error is classified as transient.
+It backs off with jitter, and a :class:`RetryBudget` shared by the whole run
+stops a struggling server from being hammered indefinitely.
+"""
+
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional, Set, TypeVar
+
+from config import ETLConstants
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# SQL Server error numbers worth retrying.
+TRANSIENT_ERROR_NUMBERS: Set[int] = {
+    1205,   # chosen as deadlock victim
+    1222,   # lock request time out period exceeded
+    233,    # no process is on the other end of the pipe
+    10053,  # connection aborted by the host
+    10054,  # connection reset by peer
+    10060,  # connection attempt timed out
+    40197,  # Azure SQL: service error processing the request
+    40501,  # Azure SQL: service is busy
+    40613,  # Azure SQL: database unavailable
+}
+
+# ODBC SQLSTATEs that indicate a broken link or a serialisation failure.
+TRANSIENT_SQLSTATES: Set[str] = {"08S01", "08001", "40001"}
+
+# The subset that leaves the connection usable, so the same connection can
+# retry.  Every other transient error drops the connection.
+LOCK_ERROR_NUMBERS: Set[int] = {1205, 1222}
+LOCK_SQLSTATES: Set[str] = {"40001"}
+
+# pyodbc ends each diagnostic record with the native error number, followed
+# by the ODBC function name, the next record or the end of the message:
+# "...[SQL Server]Transaction was deadlocked (1205) (SQLExecDirectW)".
+# Numbers in parentheses inside the message text (a duplicate key value,
+# for example) are not followed by one of those.
+_ERROR_NUMBER = re.compile(r"\((\d{3,5})\)(?=\s*(?:\(SQL\w+\)|;\s*\[|$))")
+
+
+def _error_chain(exc: BaseException) -> Iterator[BaseException]:
+    """Yield ``exc`` and the driver errors wrapped inside it."""
+    seen = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        yield current
+        current = (
+            getattr(current, "original_error", None)  # SQLExecutionError
+            or getattr(current, "orig", None)  # SQLAlchemy DBAPIError
+            or current.__cause__
+        )
+
+
+def _has_error(exc: BaseException, numbers: Set[int], sqlstates: Set[str]) -> bool:
+    for error in _error_chain(exc):
+        args = getattr(error, "args", ())
+        if args and isinstance(args[0], str) and args[0] in sqlstates:
+            return True
+        for text in (str(arg) for arg in args):
+            if {int(n) for n in _ERROR_NUMBER.findall(text)} & numbers:
+                return True
+    return False
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` is a deadlock, lock timeout or connection drop."""
+    return _has_error(exc, TRANSIENT_ERROR_NUMBERS, TRANSIENT_SQLSTATES)
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    """Return ``True`` if ``exc`` is a deadlock or lock timeout.
+
+    These can be retried on the connection that raised them; a dropped
+    connection cannot.
+    """
+    return _has_error(exc, LOCK_ERROR_NUMBERS, LOCK_SQLSTATES)
+
+
+class RetryBudget:
+    """Upper bound on the number of retries taken by a whole run."""
+
+    def __init__(self, total: int) -> None:
+        self.remaining = max(0, int(total))
+        self._lock = threading.Lock()
+
+    def consume(self) -> bool:
+        """Take one retry from the budget; ``False`` once it is spent."""
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+class RetryPolicy:
+    """Retry transient failures with full-jitter exponential backoff."""
+
+    def __init__(
+        self,
+        max_attempts: int = ETLConstants.MAX_RETRY_ATTEMPTS,
+        budget: Optional[RetryBudget] = None,
+        base_delay: float = ETLConstants.DEFAULT_RETRY_BASE_DELAY,
+        max_delay: float = ETLConstants.DEFAULT_RETRY_MAX_DELAY,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_attempts = max(1, int(max_attempts))
+        self.budget = budget or RetryBudget(ETLConstants.DEFAULT_RETRY_BUDGET)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (starting at 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def run(
+        self,
+        func: Callable[[], T],
+        description: str,
+        on_retry: Optional[Callable[[BaseException], Any]] = None,
+        retryable: Callable[[BaseException], bool] = is_transient,
+    ) -> T:
+        """Call ``func`` until it succeeds or fails permanently.
+
+        ``func`` must be safe to repeat.  ``on_retry`` is called with the
+        failure before each new attempt, for example to roll back.
+        ``retryable`` decides which errors are retried; callers that reuse
+        one connection for every attempt pass :func:`is_lock_error`.
+        """
+        attempt = 1
+        while True:
+            try:
+                return func()
+            except Exception as exc:
+                if attempt >= self.max_attempts or not retryable(exc):
+                    raise
+                if not self.budget.consume():
+                    logger.error(f"Retry budget exhausted; not retrying {description}")
+                    raise
+                wait = self.delay(attempt)
+                logger.warning(
+                    f"Transient error on attempt {attempt} for {description}: {exc}. "
+                    f"Retrying in {wait:.1f}s"
+                )
+                if on_retry:
+                    on_retry(exc)
+                self._sleep(wait)
+                attempt += 1